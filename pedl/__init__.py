@@ -1,9 +1,11 @@
 from . import *
 from . import widgets
 from .widget         import MainWindow, Widget
-from .utils          import Font, Visibility, launch
+from .utils          import Font, Visibility, Param, launch, launch_async
 from .designer       import Designer
-from .layout         import VBoxLayout, HBoxLayout, StackedLayout
+from .factory        import factory, family
+from .layout         import (VBoxLayout, HBoxLayout, StackedLayout,
+                             GridLayout, FlowLayout, PackedLayout)
 
 from ._version import get_versions
 __version__ = get_versions()['version']
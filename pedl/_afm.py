@@ -0,0 +1,222 @@
+"""
+Glyph advances of the fonts available within EDM
+
+Widths of the printable ASCII characters, from space to tilde, in thousandths
+of the font size, along with the ascender and descender of each face. These
+are taken from the Adobe Font Metrics of the Type 1 fonts that the X server
+scales for EDM. Generated from the AFM files, do not edit by hand.
+"""
+#Metrics derived from AFM files distributed by Adobe Systems with the
+#following notices
+# Copyright (c) 1985, 1987, 1988, 1991 Adobe Systems Incorporated.  All Rights Reserved.
+# Copyright (c) 1985, 1987, 1989, 1990 Adobe Systems Incorporated.  All Rights Reserved.Helvetica is a trademark of Linotype AG and/or its subsidiaries.
+# Copyright (c) 1985, 1987, 1989, 1990 Adobe Systems Incorporated.  All Rights Reserved.Times is a trademark of Linotype AG and/or its subsidiaries.
+# Copyright (c) 1985, 1987, 1989, 1990 Adobe Systems Incorporated.  All rights reserved.Helvetica is a trademark of Linotype AG and/or its subsidiaries.
+# Copyright (c) 1985, 1987, 1989, 1991 Adobe Systems Incorporated.  All Rights Reserved.
+# Copyright (c) 1989, 1990, 1991 Adobe Systems Incorporated. All rights reserved.
+# Copyright (c) 1989, 1990, 1991, Adobe Systems Incorporated. All rights reserved.
+# Copyright (c) 1989, 1991 Adobe Systems Incorporated.  All Rights Reserved.Utopia is a registered trademark of Adobe Systems Incorporated.
+
+#(family, weight, slant) : (ascender, descender, widths)
+faces = {
+    ('helvetica', 'medium', 'r') : (718, -207, (
+         278,  278,  355,  556,  556,  889,  667,  191,  333,  333,  389,  584,
+         278,  333,  278,  278,  556,  556,  556,  556,  556,  556,  556,  556,
+         556,  556,  278,  278,  584,  584,  584,  556, 1015,  667,  667,  722,
+         722,  667,  611,  778,  722,  278,  500,  667,  556,  833,  722,  778,
+         667,  778,  722,  667,  611,  722,  667,  944,  667,  667,  611,  278,
+         278,  278,  469,  556,  333,  556,  556,  500,  556,  556,  278,  556,
+         556,  222,  222,  500,  222,  833,  556,  556,  556,  556,  333,  500,
+         278,  556,  500,  722,  500,  500,  500,  334,  260,  334,  584,
+    )),
+    ('helvetica', 'bold', 'r') : (718, -207, (
+         278,  333,  474,  556,  556,  889,  722,  238,  333,  333,  389,  584,
+         278,  333,  278,  278,  556,  556,  556,  556,  556,  556,  556,  556,
+         556,  556,  333,  333,  584,  584,  584,  611,  975,  722,  722,  722,
+         722,  667,  611,  778,  722,  278,  556,  722,  611,  833,  722,  778,
+         667,  778,  722,  667,  611,  722,  667,  944,  667,  667,  611,  333,
+         278,  333,  584,  556,  333,  556,  611,  556,  611,  556,  333,  611,
+         611,  278,  278,  556,  278,  889,  611,  611,  611,  611,  389,  556,
+         333,  611,  556,  778,  556,  556,  500,  389,  280,  389,  584,
+    )),
+    ('helvetica', 'medium', 'i') : (718, -207, (
+         278,  278,  355,  556,  556,  889,  667,  191,  333,  333,  389,  584,
+         278,  333,  278,  278,  556,  556,  556,  556,  556,  556,  556,  556,
+         556,  556,  278,  278,  584,  584,  584,  556, 1015,  667,  667,  722,
+         722,  667,  611,  778,  722,  278,  500,  667,  556,  833,  722,  778,
+         667,  778,  722,  667,  611,  722,  667,  944,  667,  667,  611,  278,
+         278,  278,  469,  556,  333,  556,  556,  500,  556,  556,  278,  556,
+         556,  222,  222,  500,  222,  833,  556,  556,  556,  556,  333,  500,
+         278,  556,  500,  722,  500,  500,  500,  334,  260,  334,  584,
+    )),
+    ('helvetica', 'bold', 'i') : (718, -207, (
+         278,  333,  474,  556,  556,  889,  722,  238,  333,  333,  389,  584,
+         278,  333,  278,  278,  556,  556,  556,  556,  556,  556,  556,  556,
+         556,  556,  333,  333,  584,  584,  584,  611,  975,  722,  722,  722,
+         722,  667,  611,  778,  722,  278,  556,  722,  611,  833,  722,  778,
+         667,  778,  722,  667,  611,  722,  667,  944,  667,  667,  611,  333,
+         278,  333,  584,  556,  333,  556,  611,  556,  611,  556,  333,  611,
+         611,  278,  278,  556,  278,  889,  611,  611,  611,  611,  389,  556,
+         333,  611,  556,  778,  556,  556,  500,  389,  280,  389,  584,
+    )),
+    ('times', 'medium', 'r') : (683, -217, (
+         250,  333,  408,  500,  500,  833,  778,  180,  333,  333,  500,  564,
+         250,  333,  250,  278,  500,  500,  500,  500,  500,  500,  500,  500,
+         500,  500,  278,  278,  564,  564,  564,  444,  921,  722,  667,  667,
+         722,  611,  556,  722,  722,  333,  389,  722,  611,  889,  722,  722,
+         556,  722,  667,  556,  611,  722,  722,  944,  722,  722,  611,  333,
+         278,  333,  469,  500,  333,  444,  500,  444,  500,  444,  333,  500,
+         500,  278,  278,  500,  278,  778,  500,  500,  500,  500,  333,  389,
+         278,  500,  500,  722,  500,  500,  444,  480,  200,  480,  541,
+    )),
+    ('times', 'bold', 'r') : (676, -205, (
+         250,  333,  555,  500,  500, 1000,  833,  278,  333,  333,  500,  570,
+         250,  333,  250,  278,  500,  500,  500,  500,  500,  500,  500,  500,
+         500,  500,  333,  333,  570,  570,  570,  500,  930,  722,  667,  722,
+         722,  667,  611,  778,  778,  389,  500,  778,  667,  944,  722,  778,
+         611,  778,  722,  556,  667,  722,  722, 1000,  722,  722,  667,  333,
+         278,  333,  581,  500,  333,  500,  556,  444,  556,  444,  333,  500,
+         556,  278,  333,  556,  278,  833,  556,  500,  556,  556,  444,  389,
+         333,  556,  500,  722,  500,  500,  444,  394,  220,  394,  520,
+    )),
+    ('times', 'medium', 'i') : (683, -205, (
+         250,  333,  420,  500,  500,  833,  778,  214,  333,  333,  500,  675,
+         250,  333,  250,  278,  500,  500,  500,  500,  500,  500,  500,  500,
+         500,  500,  333,  333,  675,  675,  675,  500,  920,  611,  611,  667,
+         722,  611,  611,  722,  722,  333,  444,  667,  556,  833,  667,  722,
+         611,  722,  611,  500,  556,  722,  611,  833,  611,  556,  556,  389,
+         278,  389,  422,  500,  333,  500,  500,  444,  500,  444,  278,  500,
+         500,  278,  278,  444,  278,  722,  500,  500,  500,  500,  389,  389,
+         278,  500,  444,  667,  444,  444,  389,  400,  275,  400,  541,
+    )),
+    ('times', 'bold', 'i') : (699, -205, (
+         250,  389,  555,  500,  500,  833,  778,  278,  333,  333,  500,  570,
+         250,  333,  250,  278,  500,  500,  500,  500,  500,  500,  500,  500,
+         500,  500,  333,  333,  570,  570,  570,  500,  832,  667,  667,  667,
+         722,  667,  667,  722,  778,  389,  500,  667,  611,  889,  722,  722,
+         611,  722,  667,  556,  611,  722,  667,  889,  667,  611,  611,  333,
+         278,  333,  570,  500,  333,  500,  500,  444,  500,  444,  333,  500,
+         556,  278,  278,  500,  278,  778,  556,  500,  500,  500,  389,  389,
+         278,  556,  444,  667,  500,  444,  389,  348,  220,  348,  570,
+    )),
+    ('courier', 'medium', 'r') : (629, -157, (
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+    )),
+    ('courier', 'bold', 'r') : (626, -142, (
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+    )),
+    ('courier', 'medium', 'i') : (629, -157, (
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+    )),
+    ('courier', 'bold', 'i') : (626, -142, (
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+         600,  600,  600,  600,  600,  600,  600,  600,  600,  600,  600,
+    )),
+    ('new century schoolbook', 'medium', 'r') : (737, -205, (
+         278,  296,  389,  556,  556,  833,  815,  204,  333,  333,  500,  606,
+         278,  333,  278,  278,  556,  556,  556,  556,  556,  556,  556,  556,
+         556,  556,  278,  278,  606,  606,  606,  444,  737,  722,  722,  722,
+         778,  722,  667,  778,  833,  407,  556,  778,  667,  944,  815,  778,
+         667,  778,  722,  630,  667,  815,  722,  981,  704,  704,  611,  333,
+         606,  333,  606,  500,  333,  556,  556,  444,  574,  500,  333,  537,
+         611,  315,  296,  593,  315,  889,  611,  500,  574,  556,  444,  463,
+         389,  611,  537,  778,  537,  537,  481,  333,  606,  333,  606,
+    )),
+    ('new century schoolbook', 'bold', 'r') : (737, -205, (
+         287,  296,  333,  574,  574,  833,  852,  241,  389,  389,  500,  606,
+         278,  333,  278,  278,  574,  574,  574,  574,  574,  574,  574,  574,
+         574,  574,  278,  278,  606,  606,  606,  500,  747,  759,  778,  778,
+         833,  759,  722,  833,  870,  444,  648,  815,  722,  981,  833,  833,
+         759,  833,  815,  667,  722,  833,  759,  981,  722,  722,  667,  389,
+         606,  389,  606,  500,  333,  611,  648,  556,  667,  574,  389,  611,
+         685,  370,  352,  667,  352,  963,  685,  611,  667,  648,  519,  500,
+         426,  685,  611,  889,  611,  611,  537,  389,  606,  389,  606,
+    )),
+    ('new century schoolbook', 'medium', 'i') : (737, -205, (
+         278,  333,  400,  556,  556,  833,  852,  278,  333,  333,  500,  606,
+         278,  333,  278,  606,  556,  556,  556,  556,  556,  556,  556,  556,
+         556,  556,  278,  278,  606,  606,  606,  444,  747,  704,  722,  722,
+         778,  722,  667,  778,  833,  407,  611,  741,  667,  944,  815,  778,
+         667,  778,  741,  667,  685,  815,  704,  926,  704,  685,  667,  333,
+         606,  333,  606,  500,  333,  574,  556,  444,  611,  444,  333,  537,
+         611,  333,  315,  556,  333,  889,  611,  500,  574,  556,  444,  444,
+         352,  611,  519,  778,  500,  500,  463,  333,  606,  333,  606,
+    )),
+    ('new century schoolbook', 'bold', 'i') : (737, -205, (
+         287,  333,  400,  574,  574,  889,  889,  287,  407,  407,  500,  606,
+         287,  333,  287,  278,  574,  574,  574,  574,  574,  574,  574,  574,
+         574,  574,  287,  287,  606,  606,  606,  481,  747,  741,  759,  759,
+         833,  741,  704,  815,  870,  444,  667,  778,  704,  944,  852,  833,
+         741,  833,  796,  685,  722,  833,  741,  944,  741,  704,  704,  407,
+         606,  407,  606,  500,  333,  667,  611,  537,  667,  519,  389,  611,
+         685,  389,  370,  648,  389,  944,  685,  574,  648,  630,  519,  481,
+         407,  685,  556,  833,  574,  519,  519,  407,  606,  407,  606,
+    )),
+    ('utopia', 'medium', 'r') : (742, -230, (
+         225,  242,  458,  530,  530,  838,  706,  278,  350,  350,  412,  570,
+         265,  392,  265,  460,  530,  530,  530,  530,  530,  530,  530,  530,
+         530,  530,  265,  265,  570,  570,  570,  389,  793,  635,  646,  684,
+         779,  606,  580,  734,  798,  349,  350,  658,  568,  944,  780,  762,
+         600,  762,  644,  541,  621,  791,  634,  940,  624,  588,  610,  330,
+         460,  330,  570,  500,  400,  523,  598,  496,  598,  514,  319,  520,
+         607,  291,  280,  524,  279,  923,  619,  577,  608,  591,  389,  436,
+         344,  606,  504,  768,  486,  506,  480,  340,  228,  340,  570,
+    )),
+    ('utopia', 'bold', 'r') : (742, -230, (
+         210,  278,  473,  560,  560,  887,  748,  252,  365,  365,  442,  600,
+         280,  392,  280,  378,  560,  560,  560,  560,  560,  560,  560,  560,
+         560,  560,  280,  280,  600,  600,  600,  456,  833,  644,  683,  689,
+         777,  629,  593,  726,  807,  384,  386,  707,  585,  918,  739,  768,
+         650,  768,  684,  561,  624,  786,  645,  933,  634,  617,  614,  335,
+         379,  335,  600,  500,  430,  544,  605,  494,  605,  519,  342,  533,
+         631,  316,  316,  582,  309,  948,  638,  585,  615,  597,  440,  446,
+         370,  629,  520,  774,  522,  524,  483,  365,  284,  365,  600,
+    )),
+    ('utopia', 'medium', 'i') : (742, -242, (
+         225,  240,  402,  530,  530,  826,  725,  216,  350,  350,  412,  570,
+         265,  392,  265,  270,  530,  530,  530,  530,  530,  530,  530,  530,
+         530,  530,  265,  265,  570,  570,  570,  425,  794,  624,  632,  661,
+         763,  596,  571,  709,  775,  345,  352,  650,  565,  920,  763,  753,
+         614,  753,  640,  533,  606,  794,  637,  946,  632,  591,  622,  330,
+         390,  330,  570,  500,  400,  561,  559,  441,  587,  453,  315,  499,
+         607,  317,  309,  545,  306,  912,  618,  537,  590,  559,  402,  389,
+         341,  618,  510,  785,  516,  468,  468,  340,  270,  340,  570,
+    )),
+    ('utopia', 'bold', 'i') : (742, -242, (
+         210,  285,  455,  560,  560,  896,  752,  246,  350,  350,  500,  600,
+         280,  392,  280,  260,  560,  560,  560,  560,  560,  560,  560,  560,
+         560,  560,  280,  280,  600,  600,  600,  454,  828,  634,  680,  672,
+         774,  622,  585,  726,  800,  386,  388,  688,  586,  921,  741,  761,
+         660,  761,  681,  551,  616,  776,  630,  920,  630,  622,  618,  350,
+         460,  350,  600,  500,  400,  596,  586,  456,  609,  476,  348,  522,
+         629,  339,  333,  570,  327,  914,  635,  562,  606,  584,  440,  417,
+         359,  634,  518,  795,  516,  489,  466,  340,  265,  340,  600,
+    )),
+}
@@ -0,0 +1,312 @@
+"""
+Screens are often deployed to many consoles, where writing thousands of
+small files to a network file system costs far more than rendering them. A
+build can instead stream each rendered screen straight into a single
+compressed archive, with no intermediate files, using :class:`.Archive`. The
+format is chosen by the extension of the archive, one of :data:`.formats`.
+Archives compressed with Zstandard require the ``zstandard`` package.
+
+Each archive ends with a manifest, ``MANIFEST.json``, listing the path, size
+and SHA-256 digest of every screen. :func:`.extract` unpacks an archive on
+the target, checking every screen against the manifest before writing only
+those that differ from the screens already there::
+
+    pedl build site/screens.py --archive screens.tar.zst
+    pedl extract screens.tar.zst -o /path/to/screens
+"""
+####################
+# Standard Library #
+####################
+import io
+import os
+import json
+import time
+import hashlib
+import logging
+import tarfile
+import shutil
+import zipfile
+import tempfile
+import posixpath
+
+####################
+#    Third Party   #
+####################
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+####################
+#     Package      #
+####################
+from .utils import keep_mode
+
+logger = logging.getLogger(__name__)
+
+#Name of the manifest within each archive
+manifest = 'MANIFEST.json'
+
+#Supported extensions, with the compression of tar archives
+formats = {'.tar'     : '',
+           '.tar.gz'  : 'gz',
+           '.tgz'     : 'gz',
+           '.tar.bz2' : 'bz2',
+           '.tar.xz'  : 'xz',
+           '.tar.zst' : 'zst',
+           '.zip'     : None}
+
+
+def archive_format(path):
+    """
+    Extension of an archive, one of :data:`.formats`
+
+    Raises
+    ------
+    ValueError:
+        If the extension is not supported
+
+    ImportError:
+        If ``zstandard`` is needed but not installed
+    """
+    for ext in sorted(formats, key=len, reverse=True):
+        if path.endswith(ext):
+            if formats[ext] == 'zst' and zstandard is None:
+                raise ImportError('zstandard is required to use {} archives'
+                                  ''.format(ext))
+            return ext
+
+    raise ValueError('Unknown archive format {}, expected one of {}'
+                     ''.format(path, ', '.join(sorted(formats))))
+
+
+def check_name(name):
+    """
+    Ensure a path within an archive stays beneath the output directory
+    """
+    norm = posixpath.normpath(name)
+
+    if posixpath.isabs(norm) or norm == '..' or norm.startswith('../'):
+        raise ValueError('Archive member {} is outside of the archive'
+                         ''.format(name))
+
+    return norm
+
+
+class Archive:
+    """
+    Write rendered screens into a compressed archive
+
+    Screens are compressed as they are added, so the archive is written in
+    a single pass. The manifest is added when the archive is closed
+
+    Parameters
+    ----------
+    path : str
+        Location of the archive, the extension chooses the format
+
+    Attributes
+    ----------
+    entries : list
+        Path, size and digest of each screen added
+
+    Example
+    -------
+    .. code::
+
+        with Archive('screens.tar.gz') as archive:
+            archive.add('valves/overview.edl', d.dumps())
+    """
+    def __init__(self, path):
+        self.path    = path
+        self.format  = archive_format(path)
+        self.entries = list()
+        self.mtime   = time.time()
+        self._stream = None
+        compression  = formats[self.format]
+
+        if compression is None:
+            self._zip = zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED)
+            self._tar = None
+
+        elif compression == 'zst':
+            self._stream = zstandard.ZstdCompressor(write_checksum=True)\
+                                    .stream_writer(open(path, 'wb'))
+            self._tar = tarfile.open(fileobj=self._stream, mode='w|')
+
+        else:
+            self._tar = tarfile.open(path, mode='w|' + compression)
+
+
+    def add(self, name, text):
+        """
+        Add a screen to the archive
+
+        Parameters
+        ----------
+        name : str
+            Path of the screen within the archive
+
+        text : str
+            Contents of the screen
+        """
+        data = text.encode()
+        self.entries.append({'path'   : check_name(name),
+                             'size'   : len(data),
+                             'sha256' : hashlib.sha256(data).hexdigest()})
+        self._write(name, data)
+
+
+    def _write(self, name, data):
+        if self._tar is None:
+            info = zipfile.ZipInfo(name, time.localtime(self.mtime)[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            self._zip.writestr(info, data)
+
+        else:
+            info = tarfile.TarInfo(name)
+            info.size, info.mtime = len(data), self.mtime
+            self._tar.addfile(info, io.BytesIO(data))
+
+
+    def close(self):
+        """
+        Write the manifest and finish the archive
+        """
+        self._write(manifest, json.dumps(self.entries, indent=1).encode())
+
+        if self._tar is None:
+            self._zip.close()
+
+        else:
+            self._tar.close()
+
+            if self._stream is not None:
+                self._stream.close()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def members(path):
+    """
+    Name and contents of each file in an archive, in order
+
+    Tar archives are read as a stream, so only one member is held at a time
+    """
+    ext = archive_format(path)
+
+    if formats[ext] is None:
+        with zipfile.ZipFile(path, 'r') as archive:
+            for info in archive.infolist():
+                if not info.is_dir():
+                    yield info.filename, archive.read(info)
+        return
+
+    with open(path, 'rb') as handle:
+        if formats[ext] == 'zst':
+            handle = zstandard.ZstdDecompressor().stream_reader(handle)
+
+        with tarfile.open(fileobj=handle, mode='r|*') as archive:
+            for info in archive:
+                if info.isfile():
+                    yield info.name, archive.extractfile(info).read()
+
+
+def extract(path, directory='.'):
+    """
+    Unpack the screens of an archive, only writing those that changed
+
+    Every screen is checked against the manifest before any file beneath the
+    directory is touched. Changed screens are first written to a temporary
+    directory alongside them, then each replaces the original atomically,
+    keeping its permissions, so EDM never reads a partially written screen
+
+    Parameters
+    ----------
+    path : str
+        Location of the archive
+
+    directory : str, optional
+        Root of the output tree
+
+    Returns
+    -------
+    written : list
+        Path of each screen written, relative to the directory
+
+    Raises
+    ------
+    ValueError:
+        If the archive has no manifest, a screen does not match it, or a
+        path would be written outside of the directory
+    """
+    os.makedirs(directory, exist_ok=True)
+    staging = tempfile.mkdtemp(dir=directory, prefix='.pedl-extract-')
+
+    try:
+        written, found, listed = list(), dict(), None
+
+        for name, data in members(path):
+            if name == manifest:
+                listed = json.loads(data.decode())
+                continue
+
+            name   = check_name(name)
+            target = os.path.join(directory, *name.split('/'))
+            found[name] = {'size'   : len(data),
+                           'sha256' : hashlib.sha256(data).hexdigest()}
+
+            if unchanged(target, data):
+                continue
+
+            staged = os.path.join(staging, str(len(written)))
+            with open(staged, 'wb') as handle:
+                handle.write(data)
+
+            written.append(name)
+
+        if listed is None:
+            raise ValueError('{} has no manifest'.format(path))
+
+        expected = {entry['path'] : {'size'   : entry['size'],
+                                     'sha256' : entry['sha256']}
+                    for entry in listed}
+
+        for name in set(expected) | set(found):
+            if expected.get(name) != found.get(name):
+                raise ValueError('{} does not match the manifest of {}'
+                                 ''.format(name, path))
+
+        for i, name in enumerate(written):
+            staged = os.path.join(staging, str(i))
+            target = os.path.join(directory, *name.split('/'))
+            os.makedirs(os.path.dirname(os.path.abspath(target)),
+                        exist_ok=True)
+            keep_mode(staged, target)
+            os.replace(staged, target)
+
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    return written
+
+
+def unchanged(path, data):
+    """
+    Whether a file already holds the given contents
+    """
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+
+        with open(path, 'rb') as handle:
+            return handle.read() == data
+
+    except FileNotFoundError:
+        return False
@@ -0,0 +1,312 @@
+"""
+Building the screens of a site is a matter of running every registered
+:func:`.factory` and saving the result. :func:`.build` collects factories
+from modules and from the ``pedl.screens`` entry point group of installed
+packages, runs them in a pool of processes, and returns a summary of each
+screen that can be written as JSON. The same machinery checks screens
+without writing them, or reports how long each takes to create and render.
+An entry point may name either a module of factories or a single factory
+function, in which case the name of the entry point is the output path.
+
+.. code::
+
+    entry_points = {'pedl.screens' : ['vacuum = site.vacuum.screens']}
+
+Screens may also be built straight into a compressed archive, see
+:mod:`pedl.archive`. The ``pedl`` command exposes each mode::
+
+    pedl build site/screens.py -o /path/to/screens -j 8 --json summary.json
+    pedl build site/screens.py --archive screens.tar.gz
+    pedl check site/screens.py
+    pedl stats --group pedl.screens
+"""
+####################
+# Standard Library #
+####################
+import os
+import time
+import inspect
+import logging
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+try:
+    from importlib import metadata
+except ImportError:
+    metadata = None
+
+####################
+#    Third Party   #
+####################
+
+####################
+#     Package      #
+####################
+from .factory  import Factory, load, factories
+from .compiled import CompiledScreen
+from .archive  import Archive
+from .utils    import atomic, write_if_changed
+
+logger = logging.getLogger(__name__)
+
+#Entry point group searched by default
+group = 'pedl.screens'
+
+#Modes of operation
+modes = ('build', 'check', 'stats')
+
+
+def entry_points(name):
+    """
+    Installed entry points of a group
+    """
+    if metadata is None:
+        return []
+
+    eps = metadata.entry_points()
+
+    if hasattr(eps, 'select'):
+        return list(eps.select(group=name))
+
+    return list(eps.get(name, []))
+
+
+def collect(modules=(), groups=()):
+    """
+    Find the factories of modules and entry point groups
+
+    Parameters
+    ----------
+    modules : iterable, optional
+        Dotted names or paths of modules defining factories
+
+    groups : iterable, optional
+        Names of entry point groups
+
+    Returns
+    -------
+    factories : ``OrderedDict``
+        :class:`.Factory` objects by output path
+    """
+    found = OrderedDict()
+
+    for name in modules:
+        for f in factories(load(name)):
+            found[f.path] = f
+
+    for name in groups:
+        for ep in entry_points(name):
+            obj = ep.load()
+
+            if inspect.ismodule(obj):
+                for f in factories(obj):
+                    found[f.path] = f
+
+            else:
+                path = ep.name if ep.name.endswith('.edl') \
+                                else ep.name + '.edl'
+                found[path] = Factory(path, obj)
+
+    return found
+
+
+def process(factory, directory='.', mode='build', force=False,
+            archive=False):
+    """
+    Create a single screen and build, check or measure it
+
+    Parameters
+    ----------
+    factory : :class:`.Factory`
+
+    directory : str, optional
+        Root of the output tree
+
+    mode : str, optional
+        ``build`` to save the screen, ``check`` to validate it without
+        saving, or ``stats`` to render it without saving
+
+    force : bool, optional
+        Write screens even if the file holds the same contents
+
+    archive : bool, optional
+        Rather than saving the screen, return its text as ``edl`` in the
+        result, to be added to an :class:`.Archive`
+
+    Returns
+    -------
+    result : dict
+        Output path, whether the screen succeeded and was written, time in
+        seconds to create and render, size in bytes, number of objects, any
+        validation problems and the error raised, if any
+    """
+    result = OrderedDict([('path', factory.path), ('ok', False),
+                          ('written', False), ('create', None),
+                          ('render', None), ('bytes', None),
+                          ('objects', None), ('problems', []),
+                          ('error', None)])
+    try:
+        start    = time.perf_counter()
+        designer = factory.func()
+        result['create'] = time.perf_counter() - start
+
+        #Instances of a family were validated when compiled
+        if isinstance(designer, CompiledScreen):
+            result['objects'] = designer.objects
+            problems = designer.problems
+
+        else:
+            result['objects'] = len(designer.findChildren())
+            problems = None
+
+        if mode == 'check':
+            if problems is None:
+                problems = str(designer.validate()).splitlines()
+
+            result['problems'] = problems
+            result['ok'] = not problems
+            return result
+
+        start = time.perf_counter()
+        edl   = designer.dumps()
+        result['render'] = time.perf_counter() - start
+        result['bytes']  = len(edl.encode())
+
+        if mode == 'build' and archive:
+            result['edl'] = edl
+
+        elif mode == 'build':
+            path = os.path.join(directory, factory.path)
+            os.makedirs(os.path.dirname(os.path.abspath(path)),
+                        exist_ok=True)
+
+            #Write the rendered text rather than render the screen again
+            if force:
+                with atomic(path) as handle:
+                    handle.write(edl)
+
+                result['written'] = True
+
+            else:
+                result['written'] = write_if_changed(path, edl)
+
+        result['ok'] = True
+
+    except Exception as exc:
+        logger.debug(traceback.format_exc())
+        result['error'] = '{}: {}'.format(type(exc).__name__, exc)
+
+    return result
+
+
+#Factories of each worker process
+_factories = None
+
+
+def _initialize(modules, groups):
+    global _factories
+    _factories = collect(modules, groups)
+
+
+def _process(args):
+    path, directory, mode, force, archive = args
+    return process(_factories[path], directory, mode, force, archive)
+
+
+def build(modules=(), groups=(), directory='.', mode='build', workers=1,
+          force=False, archive=None):
+    """
+    Build, check or measure every screen of modules and entry point groups
+
+    Parameters
+    ----------
+    modules : iterable, optional
+        Dotted names or paths of modules defining factories
+
+    groups : iterable, optional
+        Names of entry point groups
+
+    directory : str, optional
+        Root of the output tree
+
+    mode : str, optional
+        One of :data:`.modes`, see :func:`.process`
+
+    workers : int, optional
+        Number of processes, each of which imports the factories once. A
+        value of 1 runs every factory in the current process
+
+    force : bool, optional
+        Write screens even if the file holds the same contents
+
+    archive : str, optional
+        Write every screen into an archive at this location rather than the
+        directory. Screens are added in order as each is rendered
+
+    Returns
+    -------
+    summary : dict
+        Totals for the run, with the result of each screen in order
+    """
+    if mode not in modes:
+        raise ValueError('Unknown mode {}, expected one of {}'
+                         ''.format(mode, ', '.join(modes)))
+
+    if archive and mode != 'build':
+        raise ValueError('Only screens that are built can be archived')
+
+    start = time.perf_counter()
+    found = collect(modules, groups)
+    tasks = [(path, directory, mode, force, bool(archive)) for path in found]
+
+    if workers == 1 or len(tasks) < 2:
+        results = _results(tasks,
+                           lambda task: process(found[task[0]], *task[1:]),
+                           archive)
+
+    else:
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_initialize,
+                                 initargs=(list(modules), list(groups))) \
+                as executor:
+            chunksize = max(1, len(tasks) // (4*(workers or os.cpu_count())))
+            results = _results(tasks, _process, archive, executor.map,
+                               chunksize=chunksize)
+
+    return summarize(results, time.perf_counter() - start)
+
+
+def _results(tasks, func, archive=None, mapper=map, **kwargs):
+    """
+    Process each task, adding the rendered screens to an archive if given
+    """
+    results = mapper(func, tasks, **kwargs)
+
+    if not archive:
+        return list(results)
+
+    done = list()
+
+    with Archive(archive) as bundle:
+        for result in results:
+            edl = result.pop('edl', None)
+
+            if edl is not None:
+                bundle.add(result['path'], edl)
+                result['written'] = True
+
+            done.append(result)
+
+    return done
+
+
+def summarize(results, elapsed):
+    """
+    Totals of a set of screen results
+    """
+    return OrderedDict([('total',   len(results)),
+                        ('failed',  sum(not r['ok'] for r in results)),
+                        ('written', sum(r['written'] for r in results)),
+                        ('bytes',   sum(r['bytes'] or 0 for r in results)),
+                        ('seconds', elapsed),
+                        ('screens', results)])
@@ -0,0 +1,239 @@
+"""
+Command line interface for ``pedl``
+
+Each sub-command is implemented as a function that accepts the parsed
+arguments and returns the exit code of the program.
+"""
+####################
+# Standard Library #
+####################
+import sys
+import json
+import logging
+import argparse
+
+####################
+#    Third Party   #
+####################
+
+####################
+#     Package      #
+####################
+from .scan  import ScreenDatabase
+from .watch import Regenerator
+from .build import build as run_build, group
+from .archive import extract as run_extract
+
+logger = logging.getLogger(__name__)
+
+
+def scan(args):
+    """
+    Update the screen database from a directory tree
+    """
+    db = ScreenDatabase(args.db)
+
+    try:
+        for root in args.roots:
+            changed = db.update(root, workers=args.workers)
+            print('Scanned {} changed screens beneath {}'
+                  ''.format(len(changed), root))
+    finally:
+        db.close()
+
+    return 0
+
+
+def query(args):
+    """
+    Search the screen database
+    """
+    db = ScreenDatabase(args.db)
+
+    try:
+        if args.pv:
+            screens = db.screensWithPv(args.pv)
+        elif args.display:
+            screens = db.screensWithDisplay(args.display)
+        elif args.color is not None:
+            screens = db.screensWithColor(args.color)
+        elif args.widget_class:
+            screens = db.screensWithClass(args.widget_class)
+        else:
+            screens = db.screens
+    finally:
+        db.close()
+
+    for screen in screens:
+        print(screen)
+
+    return 0 if screens else 1
+
+
+def watch(args):
+    """
+    Regenerate screens as their sources change
+    """
+    regenerator = Regenerator(args.module, directory=args.output,
+                              poll=args.poll, interval=args.interval,
+                              delay=args.delay)
+    print('Watching {} for changes ...'.format(', '.join(regenerator.paths)))
+    regenerator.run()
+    return 0
+
+
+def build(args):
+    """
+    Build, check or measure the screens of modules and entry points
+    """
+    groups = args.group or ([] if args.modules else [group])
+    summary = run_build(args.modules, groups,
+                        directory=getattr(args, 'output', '.'),
+                        mode=args.command, workers=args.workers,
+                        force=getattr(args, 'force', False),
+                        archive=getattr(args, 'archive', None))
+
+    if args.json:
+        if args.json == '-':
+            json.dump(summary, sys.stdout, indent=2)
+            print()
+        else:
+            with open(args.json, 'w') as handle:
+                json.dump(summary, handle, indent=2)
+
+    for result in summary['screens']:
+        if result['error']:
+            print('{} : {}'.format(result['path'], result['error']),
+                  file=sys.stderr)
+
+        for problem in result['problems']:
+            print('{} : {}'.format(result['path'], problem), file=sys.stderr)
+
+    if args.json != '-':
+        if args.command == 'stats':
+            print('{:<40} {:>10} {:>10} {:>8} {:>10}'
+                  ''.format('Screen', 'Create(s)', 'Render(s)', 'Objects',
+                            'Bytes'))
+            for r in summary['screens']:
+                if r['ok']:
+                    print('{:<40} {:>10.3f} {:>10.3f} {:>8} {:>10}'
+                          ''.format(r['path'], r['create'], r['render'],
+                                    r['objects'], r['bytes']))
+
+        print('{total} screens, {failed} failed, {written} written, '
+              '{bytes} bytes in {seconds:.2f}s'.format(**summary))
+
+    if not summary['total']:
+        print('No screens found', file=sys.stderr)
+        return 1
+
+    return 1 if summary['failed'] else 0
+
+
+def extract(args):
+    """
+    Unpack an archive of screens, only writing those that changed
+    """
+    written = run_extract(args.archive, directory=args.output)
+
+    for path in written:
+        print('Wrote {}'.format(path))
+
+    print('{} screens written'.format(len(written)))
+    return 0
+
+
+def parser():
+    """
+    Argument parser for the ``pedl`` command
+    """
+    parser = argparse.ArgumentParser(prog='pedl',
+                                     description='Tools for EDM screens')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Show debug information')
+    commands = parser.add_subparsers(dest='command')
+
+    #Screen database
+    cmd = commands.add_parser('scan', help='Index a directory of screens')
+    cmd.add_argument('roots', nargs='+', help='Directories to scan')
+    cmd.add_argument('--db', default='pedl.db', help='Database path')
+    cmd.add_argument('-j', '--workers', type=int, default=None,
+                     help='Number of worker processes')
+    cmd.set_defaults(func=scan)
+
+    cmd = commands.add_parser('query', help='Search the screen database')
+    cmd.add_argument('--db', default='pedl.db', help='Database path')
+    group = cmd.add_mutually_exclusive_group()
+    group.add_argument('--pv', help='Screens referencing a PV')
+    group.add_argument('--display', help='Screens embedding a display')
+    group.add_argument('--color', type=int, help='Screens using a color index')
+    group.add_argument('--class', dest='widget_class',
+                       help='Screens containing a widget class')
+    cmd.set_defaults(func=query)
+
+    #Screen generation
+    cmd = commands.add_parser('watch', help='Regenerate screens as their '
+                                            'sources change')
+    cmd.add_argument('module', help='Module or file defining the factories')
+    cmd.add_argument('-o', '--output', default='.',
+                     help='Directory to write screens')
+    cmd.add_argument('--poll', action='store_true',
+                     help='Poll for changes rather than use inotify')
+    cmd.add_argument('--interval', type=float, default=0.5,
+                     help='Seconds between each scan when polling')
+    cmd.add_argument('--delay', type=float, default=0.2,
+                     help='Seconds without a change before rebuilding')
+    cmd.set_defaults(func=watch)
+
+    for name, text in (('build', 'Build screens into a directory'),
+                       ('check', 'Validate screens without writing them'),
+                       ('stats', 'Time and measure each screen')):
+        cmd = commands.add_parser(name, help=text)
+        cmd.add_argument('modules', nargs='*',
+                         help='Modules or files defining the factories')
+        cmd.add_argument('-g', '--group', action='append',
+                         help='Entry point group of factories, by default '
+                              '{} if no modules are given'.format(group))
+        cmd.add_argument('-j', '--workers', type=int, default=1,
+                         help='Number of worker processes')
+        if name == 'build':
+            cmd.add_argument('-o', '--output', default='.',
+                             help='Directory to write screens')
+            cmd.add_argument('--force', action='store_true',
+                             help='Write screens even if they have not '
+                                  'changed')
+            cmd.add_argument('--archive', metavar='PATH',
+                             help='Write screens into a .tar.gz, .tar.zst, '
+                                  '.zip or other archive rather than the '
+                                  'output directory')
+        cmd.add_argument('--json', metavar='PATH',
+                         help="Write a summary as JSON, '-' for stdout")
+        cmd.set_defaults(func=build)
+
+    cmd = commands.add_parser('extract', help='Unpack an archive of screens')
+    cmd.add_argument('archive', help='Archive written by pedl build')
+    cmd.add_argument('-o', '--output', default='.',
+                     help='Directory to write screens')
+    cmd.set_defaults(func=extract)
+
+    return parser
+
+
+def main(argv=None):
+    """
+    Entry point for the ``pedl`` command
+    """
+    args = parser().parse_args(argv)
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose
+                                             else logging.WARNING)
+
+    if not getattr(args, 'func', None):
+        parser().print_help()
+        return 2
+
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
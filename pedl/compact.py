@@ -0,0 +1,109 @@
+"""
+The templates write every property of each object, even where EDM would
+assume the same value if the line were missing, along with a ``# (name)``
+comment and a blank line before each object. On screens of tens of
+thousands of objects these lines make up a large part of the file, all of
+which EDM has to read, often over NFS. :func:`.minify` removes them, using
+the table of :data:`.defaults` for each ``widgetClass``, and is applied by
+``Designer.dump(compact=True)``. The version numbers of each object are
+always kept, as EDM refuses to read objects without them.
+"""
+####################
+# Standard Library #
+####################
+import logging
+
+####################
+#    Third Party   #
+####################
+
+####################
+#     Package      #
+####################
+from .parser import parse_properties
+
+logger = logging.getLogger(__name__)
+
+#Properties EDM assumes when they are not given, by widgetClass. Only
+#properties that the loader of the class reads with an explicit default are
+#listed, e.g ``tag.loadR("lineWidth", &lineWidth, &one)`` in the
+#``createFromFile`` of each shape, and the ``left`` alignment given to
+#``fontAlign`` by ``activeXTextClass``. Colors are read without a default, so
+#they are always written
+defaults = {'activeXTextClass'     : {'fontAlign' : '"left"'},
+            'activeRectangleClass' : {'lineWidth' : '1'},
+            'activeCircleClass'    : {'lineWidth' : '1'},
+            'activeLineClass'      : {'lineWidth' : '1'}}
+
+
+def minify(text):
+    """
+    Remove lines of an EDL file that EDM does not need
+
+    Comments, blank lines and properties of an object holding the value
+    listed in :data:`.defaults` for its ``widgetClass`` are removed.
+    Entries of bracketed properties and screen properties are kept
+
+    Parameters
+    ----------
+    text : str
+        Contents of the EDL file
+
+    Returns
+    -------
+    edl : str
+    """
+    lines   = list()
+    default = None
+    block   = False
+
+    for line in text.splitlines():
+        stripped = line.strip()
+
+        if block:
+            block = stripped != '}'
+
+        elif not stripped or stripped.startswith('#'):
+            continue
+
+        elif stripped.startswith('object '):
+            default = defaults.get(stripped.split(None, 1)[1], dict())
+
+        elif stripped == 'endObjectProperties':
+            default = None
+
+        elif default is not None:
+            key, _, value = stripped.partition(' ')
+            value = value.strip()
+
+            if value == '{':
+                block = True
+
+            elif key in default and default[key] == value:
+                continue
+
+        lines.append(line)
+
+    return '\n'.join(lines)
+
+
+def restore(widgetClass, properties):
+    """
+    Properties of an object read from a compact file, with each default
+    that was removed by :func:`.minify` given again
+
+    Parameters
+    ----------
+    widgetClass : str
+
+    properties : dict
+        Properties as read by :func:`.parse_properties`
+
+    Returns
+    -------
+    properties : OrderedDict
+    """
+    full = parse_properties(' '.join(item) for item in
+                            defaults.get(widgetClass, dict()).items())
+    full.update(properties)
+    return full
@@ -0,0 +1,172 @@
+"""
+A family of screens often differs only in PV prefixes, titles and a few
+colors, e.g the same panel for hundreds of devices. Rather than creating and
+rendering the complete tree of widgets for each device, the screen is
+created once with EDM macros in place of the values that differ, either
+written directly into strings as ``$(P)`` or assigned as a :class:`.Param`.
+:meth:`.Designer.compile` renders the screen once and divides the text at
+each macro, so each instance only joins strings together. Parameters not
+given when an instance is rendered are left as EDM macros, to be filled in by
+EDM when the screen is opened.
+
+.. code::
+
+    d = pedl.Designer()
+    d.window.name = '$(P) Overview'
+    d.addWidget(Rectangle(w=50, h=50, alarmPV='$(P):STATE',
+                          fill=Param('COLOR')))
+    screen = d.compile(['P', 'COLOR'])
+
+    for prefix in prefixes:
+        screen.save(prefix + '.edl', P=prefix, COLOR=ColorChoice.Green)
+"""
+####################
+# Standard Library #
+####################
+import re
+import logging
+from enum import Enum
+
+####################
+#    Third Party   #
+####################
+
+####################
+#     Package      #
+####################
+from .utils import atomic, write_if_changed
+
+logger = logging.getLogger(__name__)
+
+
+class CompiledScreen:
+    """
+    A rendered screen with slots for parameters
+
+    The screen holds only strings, so it can be pickled and sent to other
+    processes
+
+    Parameters
+    ----------
+    text : str
+        Rendered screen holding a macro for each parameter
+
+    params : iterable
+        Names of the parameters to substitute
+
+    objects : int, optional
+        Number of widgets in the screen
+
+    problems : list, optional
+        Description of each problem found when the screen was validated
+
+    values : dict, optional
+        Parameter values used by :meth:`.dumps` and :meth:`.save`
+    """
+    def __init__(self, text, params, objects=0, problems=(), values=None):
+        self.params   = tuple(params)
+        self.objects  = objects
+        self.problems = list(problems)
+        self.values   = dict(values or {})
+
+        #Alternating literal text and parameter names
+        self.parts, self.slots = [text], list()
+
+        if self.params:
+            pattern = re.compile(r'\$\(({})\)'.format(
+                                 '|'.join(re.escape(p) for p in self.params)))
+            self.parts = pattern.split(text)
+            self.slots = [(i, self.parts[i])
+                          for i in range(1, len(self.parts), 2)]
+
+
+    @property
+    def valid(self):
+        """
+        Whether no problems were found when the screen was compiled
+        """
+        return not self.problems
+
+
+    def render(self, **values):
+        """
+        Text of the screen for a set of parameter values
+
+        Parameters
+        ----------
+        values :
+            Value of each parameter as a keyword argument. Choices are
+            replaced by their value, anything else by its string. Parameters
+            not given are left as EDM macros
+
+        Returns
+        -------
+        edl : str
+
+        Raises
+        ------
+        TypeError:
+            If a value is given for an unknown parameter
+        """
+        unknown = set(values) - set(self.params)
+
+        if unknown:
+            raise TypeError('Unknown parameters {}'
+                            ''.format(', '.join(sorted(unknown))))
+
+        text = {name: str(v.value) if isinstance(v, Enum) else str(v)
+                for (name, v) in values.items()}
+        parts = list(self.parts)
+
+        for i, name in self.slots:
+            parts[i] = text.get(name, '$(' + name + ')')
+
+        return ''.join(parts)
+
+
+    def bind(self, **values):
+        """
+        A copy of the screen with values for :meth:`.dumps` and :meth:`.save`
+        """
+        bound = CompiledScreen.__new__(CompiledScreen)
+        bound.__dict__.update(self.__dict__)
+        bound.values = dict(self.values, **values)
+        return bound
+
+
+    def dumps(self):
+        """
+        Text of the screen for the bound values
+        """
+        return self.render(**self.values)
+
+
+    def save(self, path, only_changed=False, **values):
+        """
+        Save an instance of the screen to an EDL file
+
+        Parameters
+        ----------
+        path : str
+            Location of the new file
+
+        only_changed : bool, optional
+            Leave the file untouched if it already holds this screen
+
+        values :
+            Value of each parameter, in addition to those bound
+
+        Returns
+        -------
+        written : bool
+            Whether the file was written
+        """
+        text = self.render(**dict(self.values, **values))
+
+        if only_changed:
+            return write_if_changed(path, text)
+
+        with atomic(path) as handle:
+            handle.write(text)
+
+        return True
@@ -16,15 +16,21 @@ one, use :meth:`.setLayout` to apply your pattern to the screen.
 ####################
 import os
 import sys
+import copy
 import time
 import atexit
+import asyncio
 import os.path
 import logging
-import tempfile
+import warnings
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 ####################
 #    Third Party   #
 ####################
+import numpy as np
 from jinja2 import Environment, FileSystemLoader
 from jinja2 import PackageLoader, TemplateNotFound
 
@@ -34,11 +40,66 @@ from jinja2 import PackageLoader, TemplateNotFound
 from .widget  import PedlObject, MainWindow, Widget
 from .errors  import WidgetError
 from .choices import FontChoice
-from .layout  import Layout
-from .utils   import Font, launch
+from .layout  import (Layout, StackedLayout, VBoxLayout, AnchoredLayout,
+                      BoundedLayout)
+from .utils   import Font, write_if_changed
+from .validate import Validator
+from .spatial  import SpatialIndex
+from .widgets.shape import Lines
+from .geometry import store
+from .pagination import split, navigation
+from .routing  import Router
+from .preview  import PreviewSession
+from .compiled import CompiledScreen
+from .variants import ScalableScreen
+from .factoring import factor
+from .compact  import minify
 
 logger = logging.getLogger(__name__)
 
+#Environments by template directory, shared so each template is compiled once
+_environments = dict()
+
+
+def environment(template_dir=None):
+    """
+    Jinja2 environment shared by every Designer using a template directory
+
+    Parameters
+    ----------
+    template_dir : str, optional
+        Directory to find Jinja2 templates, otherwise those of ``pedl``
+
+    Returns
+    -------
+    env : ``jinja2.Environment``
+
+    Raises
+    ------
+    FileNotFoundError:
+        If the directory does not exist
+    """
+    key = os.path.abspath(template_dir) if template_dir else None
+
+    if key not in _environments:
+        if template_dir:
+            if not os.path.exists(template_dir):
+                raise FileNotFoundError('No such directory {}'
+                                        ''.format(template_dir))
+
+            logger.debug('Using {} as template directory ...'
+                         ''.format(template_dir))
+            loader = FileSystemLoader(template_dir)
+
+        else:
+            loader = PackageLoader('pedl')
+
+        _environments[key] = Environment(loader=loader, trim_blocks=True,
+                                         lstrip_blocks=True)
+
+    return _environments[key]
+
+
 class Designer:
     """
     Main Control class for PEDL
@@ -57,34 +118,56 @@ class Designer:
         The final screen that will be created
 
     env : ``jinja2.Environment``
-        Environment used to render templates
+        Environment used to render templates, shared with every other
+        Designer using the same templates
+
+    template_dir : str
+        Directory of templates, ``None`` if those of ``pedl`` are used
 
-    processes : list
-        Tuples of temporary files and processes spawned by the Designer
+    session : :class:`.PreviewSession`
+        Preview of the screen in EDM, ``None`` until :meth:`.exec_` is called
     """
     def __init__(self, template_dir=None):
 
+        self._spatial  = None
+        self._router   = None
         self.window    = MainWindow(parent=self)
         self.widgets   = list()
-        #Handle spawned processes 
-        self.processes = list()
-        atexit.register(Designer.closeAllWindows, self)
+        #Handle spawned preview
+        self.session   = None
 
         #Load specified template directory
-        if template_dir:
-            if not os.path.exists(template_dir):
-                raise FileNotFoundError('No such directory {}'
-                                        ''.format(template_dir))
+        self.template_dir = template_dir
+        self.env = environment(template_dir)
 
-            logger.debug('Using {} as template directory ...'
-                         ''.format(template_dir))
-            loader = FileSystemLoader(template_dir)
 
-        else:
-            loader = PackageLoader('pedl')
+    @property
+    def widgets(self):
+        """
+        Ordered top-level list of widgets loaded into designer
+        """
+        return self._widgets
+
+    @widgets.setter
+    def widgets(self, widgets):
+        self._widgets = widgets
 
+        #Contents have changed, rebuild spatial index on next query
+        if self._spatial is not None:
+            self._spatial.clear()
+            self._spatial = None
 
-        self.env = Environment(loader=loader,trim_blocks=True,lstrip_blocks=True)
+        if self._router is not None:
+            self._router.clear()
+            self._router = None
+
+
+    @property
+    def geometry(self):
+        """
+        :class:`.GeometryStore` holding the position and size of every widget
+        """
+        return store
 
 
     def addWidget(self, widget):
@@ -101,25 +184,105 @@ class Designer:
 
         self.widgets.append(widget)
 
+        #Keep existing spatial index current
+        if self._spatial is not None:
+            for child in self._leaves(widget):
+                self._spatial.insert(child)
+
+        #Connectors are not obstacles for further routes
+        if self._router is not None:
+            for child in self._leaves(widget):
+                if not isinstance(child, Lines):
+                    self._router.add(child)
+
+
+    def addPolylines(self, arrays, **kwargs):
+        """
+        Add a set of :class:`.Lines` widgets from arrays of points
+
+        Parameters
+        ----------
+        arrays : iterable
+            Each entry is an (N, 2) array of the points of a single line
+
+        kwargs :
+            Properties shared by every line, e.g ``lineColor``
+
+        Returns
+        -------
+        lines : list
+            Created :class:`.Lines` widgets
+        """
+        lines = [Lines.from_array(points, **kwargs) for points in arrays]
+
+        for line in lines:
+            self.addWidget(line)
+
+        return lines
+
+
+    @property
+    def router(self):
+        """
+        :class:`.Router` used by :meth:`.connect`
+
+        Every widget other than :class:`.Lines` is an obstacle. The router is
+        created on first use for the current size of the window, and widgets
+        added with :meth:`.addWidget` afterwards are included automatically
+        """
+        if self._router is None:
+            obstacles = [w for w in self.findChildren()
+                         if not isinstance(w, Lines)]
+            self._router = Router(self.window.w, self.window.h, obstacles)
+
+        return self._router
+
+
+    def connect(self, a, b, style='orthogonal', **kwargs):
+        """
+        Join two widgets with a line
+
+        Parameters
+        ----------
+        a : :class:`.Widget`
+            Start of the connection
+
+        b : :class:`.Widget`
+            End of the connection
+
+        style : str, optional
+            ``orthogonal`` to route horizontal and vertical segments around
+            the other widgets on the screen, or ``direct`` for a single
+            segment between the facing sides of the widgets
+
+        kwargs :
+            Properties of the line, e.g ``lineColor`` or ``lineWidth``
+
+        Returns
+        -------
+        line : :class:`.Lines`
+        """
+        if style == 'orthogonal':
+            points = self.router.route(a, b)
+
+        elif style == 'direct':
+            points = [self.router.port(a, b.center)[0],
+                      self.router.port(b, a.center)[0]]
+
+        else:
+            raise ValueError('Unknown connection style {}'.format(style))
+
+        line = Lines(points=points, closed=False, **kwargs)
+        self.addWidget(line)
+        return line
+
 
     def findChildren(self, _type=None, name=None):
         """
         All widgets in designer, even those in child layouts
         
         """
-        widgets = []
-
-        #Recursive widget search function
-        def recursive_widget(widget):
-            if isinstance(widget, Layout):
-                for widget in widget.widgets:
-                    recursive_widget(widget)
-            elif isinstance(widget, Widget):
-                widgets.append(widget)
-
-        #Find all widgets
-        for widget in self.widgets:
-            recursive_widget(widget)
+        widgets = [w for obj in self.widgets for w in self._leaves(obj)]
 
         #Filter by type
         if _type:
@@ -132,6 +295,147 @@ class Designer:
         return widgets
 
 
+    @staticmethod
+    def _leaves(obj):
+        """
+        All widgets within an object, descending into child layouts
+        """
+        if isinstance(obj, Layout):
+            for child in obj.widgets:
+                yield from Designer._leaves(child)
+
+        elif isinstance(obj, Widget):
+            yield obj
+
+
+    @property
+    def spatialIndex(self):
+        """
+        :class:`.SpatialIndex` of every widget in the Designer
+
+        The index is built on first use, and follows changes in geometry of
+        the indexed widgets afterwards. Widgets added directly to the Designer
+        are indexed automatically, but if a layout that is already in the
+        Designer has widgets added, use :meth:`.refreshIndex`
+        """
+        if self._spatial is None:
+            self._spatial = SpatialIndex(self.findChildren())
+
+        return self._spatial
+
+
+    def refreshIndex(self):
+        """
+        Rebuild the spatial index from the current contents of the Designer
+        """
+        if self._spatial is not None:
+            self._spatial.clear()
+
+        self._spatial = None
+        return self.spatialIndex
+
+
+    def widgetsAt(self, x, y):
+        """
+        Widgets whose area contains a point
+
+        Parameters
+        ----------
+        x : int
+            Horizontal position
+
+        y : int
+            Vertical position
+
+        Returns
+        -------
+        widgets : list
+        """
+        return self.spatialIndex.at(x, y)
+
+
+    def widgetsIn(self, rect, contained=False):
+        """
+        Widgets that intersect a region of the screen
+
+        Parameters
+        ----------
+        rect : tuple
+            Region as (x, y, w, h)
+
+        contained : bool, optional
+            Only return widgets entirely within the region
+
+        Returns
+        -------
+        widgets : list
+        """
+        return self.spatialIndex.within(rect, contained=contained)
+
+
+    def findOverlaps(self, exclude=StackedLayout):
+        """
+        Pairs of widgets that overlap one another
+
+        Parameters
+        ----------
+        exclude : type, optional
+            Layouts whose members are expected to overlap. By default, widgets
+            stacked deliberately inside the same :class:`.StackedLayout` are
+            not reported. Use ``None`` to report every overlap
+
+        Returns
+        -------
+        pairs : list
+            Tuples of overlapping widgets
+        """
+        return self.spatialIndex.overlaps(exclude=exclude)
+
+
+    def findDuplicates(self):
+        """
+        Widgets of the same type placed with identical geometry
+
+        Returns
+        -------
+        groups : list
+            Lists of duplicated widgets
+        """
+        return self.spatialIndex.duplicates()
+
+
+    def validate(self, raises=False):
+        """
+        Check the entire screen for problems before rendering
+
+        Every object is visited once, checking for missing templates, choice
+        properties that do not hold valid options, incomplete visibility
+        settings, widgets without size or outside of the window, buttons
+        without displays or commands and names that are used more than once.
+
+        Parameters
+        ----------
+        raises : bool, optional
+            Raise an exception if any problems are found
+
+        Returns
+        -------
+        report : :class:`.ValidationReport`
+            All of the problems found in the screen
+
+        Raises
+        ------
+        DesignerError:
+            If raises is True and the screen is not valid
+        """
+        report = Validator(self).run()
+
+        if raises:
+            report.raiseErrors()
+
+        return report
+
+
     def render(self, obj):
         """
         Render a ``PedlObject`` into EDM
@@ -160,28 +464,314 @@ class Designer:
                 edl.append(self.render(widget))
 
             else:
-                logger.debug('Rendering widget {} ...'.format(widget.name))
-                try:
-                    template = self.env.get_template(widget.template)
-                    logger.debug('Using template {} ...'.format(template.filename))
+                edl.append(self._render(widget, self.env))
 
-                except TemplateNotFound:
-                    raise WidgetError('Widget {} has non-existant template {}'
-                                      ''.format(widget.name, widget.template))
+        return '\n\n'.join(edl)
 
-                edl.append(template.render(widget=widget))
 
-        return '\n\n'.join(edl)
+    @staticmethod
+    def _render(widget, env):
+        """
+        Render a single widget with an environment
+        """
+        logger.debug('Rendering widget {} ...'.format(widget.name))
+        try:
+            template = env.get_template(widget.template)
+            logger.debug('Using template {} ...'.format(template.filename))
+
+        except TemplateNotFound:
+            raise WidgetError('Widget {} has non-existant template {}'
+                              ''.format(widget.name, widget.template))
+
+        return template.render(widget=widget)
+
+
+    @staticmethod
+    def _pieces(obj):
+        """
+        Widgets in the order they are rendered, with ``None`` in place of
+        each empty layout so that joining the rendered pieces gives the same
+        text as :meth:`.render`
+        """
+        if isinstance(obj, Layout):
+            if not obj.widgets:
+                yield None
+
+            for child in obj.widgets:
+                yield from Designer._pieces(child)
+
+        else:
+            yield obj
+
+
+    def paginate(self, layout, name, w=None, h=None, buttons=True):
+        """
+        Divide a layout too large for a single screen into several pages
+
+        The top-level children of the layout are distributed between pages
+        in order, each arranged by a copy of the layout, so that every page
+        fits within the given size. Each page is a new :class:`.Designer`
+        that shares the templates and window settings of this one. When more
+        than one page is needed, a bar of :class:`.RelatedDisplay` buttons is
+        placed beneath the contents of each page to move to the pages either
+        side of it. Pages are named ``<name>_<n>.edl``, these names are used
+        for the buttons so the pages should be saved to the same directory
+        along ``EDMDATAFILES``. Use :func:`.save_pages` to write all of them
+
+        Parameters
+        ----------
+        layout : :class:`.Layout`
+            Layout to divide. Its children are moved to the new pages
+
+        name : str
+            Name of the screen, used to name each page
+
+        w : int, optional
+            Maximum width of a page, by default the width of the window
+
+        h : int, optional
+            Maximum height of a page, by default the height of the window
+
+        buttons : bool, optional
+            Add navigation buttons between pages
+
+        Returns
+        -------
+        pages : OrderedDict
+            Mapping of filename to the :class:`.Designer` of each page
+        """
+        w, h    = w or self.window.w, h or self.window.h
+        margin  = self.window.margin
+        spacing = VBoxLayout.spacing.default
+
+        #Space left for the navigation bar
+        bar = navigation(['{}.edl'.format(name)]*2, 0).h + spacing
+
+        layouts = split(layout, w - 2*margin, h - 2*margin - bar)
+
+        if len(layouts) == 1:
+            names = ['{}.edl'.format(name)]
+        else:
+            names = ['{}_{}.edl'.format(name, i+1) for i in range(len(layouts))]
+
+        pages = OrderedDict()
+
+        for i, (filename, contents) in enumerate(zip(names, layouts)):
+            page     = type(self)(template_dir=self.template_dir)
+            page.env = self.env
+
+            for attr, value in self.window.attributes.items():
+                setattr(page.window, attr, value)
+
+            root = VBoxLayout(alignment='center')
+            root.addLayout(contents)
+
+            if buttons and len(names) > 1:
+                root.addLayout(navigation(names, i))
+
+            page.window.setLayout(root, resize=True)
+            pages[filename] = page
+
+        return pages
+
+
+    def _copy(self):
+        """
+        Copy of the screen holding a copy of every object
+        """
+        clone = copy.copy(self)
+        clone._spatial = None
+        clone._router  = None
+        clone.session  = None
+
+        #Copy every object, keeping references to the environment and the
+        #new Designer rather than this one
+        memo = {id(self): clone, id(self.env): self.env}
+        clone.window  = copy.deepcopy(self.window, memo)
+        clone.widgets = copy.deepcopy(self.widgets, memo)
+        return clone
+
+
+    def scaled(self, factor):
+        """
+        Copy of the screen scaled for a display of a different resolution
+
+        The position and size of every widget and the window are scaled
+        together as a single array operation on the :class:`.GeometryStore`,
+        along with the points of each :class:`.Lines`. Fonts are given the
+        closest size available in :attr:`.Font.sizes`, while line widths are
+        left unchanged. The spacing of each layout and the margin of the
+        window are scaled, so arranging the copy again keeps its scale. The
+        copy shares the template environment of this
+        Designer, so templates are only loaded once for every variant
+
+        Parameters
+        ----------
+        factor : float
+            Scale factor applied to both axes
+
+        Returns
+        -------
+        designer : :class:`.Designer`
+        """
+        scaled  = self._copy()
+        objects = [scaled.window]
+        stack   = list(scaled.widgets)
+        scaled.window.margin = int(round(self.window.margin*factor))
+
+        while stack:
+            obj = stack.pop()
+            objects.append(obj)
+
+            #Spacing is set directly, as a shuffle would undo the scaling
+            if isinstance(obj, Layout):
+                stack.extend(obj.widgets)
+
+                if obj.spacing:
+                    obj.attributes['spacing'] = int(round(obj.spacing*factor))
+
+            if isinstance(obj, AnchoredLayout) and obj._origin is not None:
+                obj._origin = [int(round(v*factor)) for v in obj._origin]
+
+            if isinstance(obj, BoundedLayout) and obj.maxWidth is not None:
+                obj.attributes['maxWidth'] = int(round(obj.maxWidth*factor))
+
+            elif isinstance(obj, Lines):
+                obj.points = np.rint(obj.points * factor)
+
+            #Snap fonts to available sizes
+            for value in obj.attributes.values():
+                if isinstance(value, Font):
+                    value.size = Font.nearest(value.size * factor)
+
+        store.scale([obj._slot for obj in objects if obj._stored], factor)
+        return scaled
+
+
+    def factor(self, name, count=2, widgets=2):
+        """
+        Share layouts repeated throughout the screen as embedded screens
+
+        Layouts with the same arrangement of widgets, differing only in
+        their position and PVs, are written once to a shared screen using
+        EDM macros for the PVs. Each occurrence is replaced by an
+        :class:`.EmbeddedWindow` holding the values of the macros. Where a
+        repeated layout is part of a larger one that also repeats, only the
+        larger layout is shared. The screen itself is left unchanged, see
+        :mod:`pedl.factoring`
+
+        Parameters
+        ----------
+        name : str
+            Name of the screen. The shared screens are named
+            ``<name>_shared<n>.edl`` and should be saved to the same
+            directory along ``EDMDATAFILES``
+
+        count : int, optional
+            Minimum number of occurrences of a layout to share it
+
+        widgets : int, optional
+            Minimum number of widgets within a layout to share it
+
+        Returns
+        -------
+        screens : OrderedDict
+            Mapping of filename to :class:`.Designer`, starting with the new
+            version of this screen followed by each shared screen
+        """
+        return factor(self, name, count=count, widgets=widgets)
+
+
+    def save_variants(self, path, variants):
+        """
+        Save scaled copies of the screen for several resolutions
+
+        The screen is rendered once, then the position and size of each
+        object, the points of each :class:`.Lines` and the size of each font
+        are scaled for every variant, giving the same text as saving
+        :meth:`.scaled` copies, see :class:`.ScalableScreen`
+
+        Parameters
+        ----------
+        path : str
+            Location of the screen, the suffix of each variant is added
+            before the extension
+
+        variants : dict
+            Mapping of suffix to scale factor, e.g ``{'_4k' : 2}``
+
+        Returns
+        -------
+        paths : dict
+            Mapping of suffix to the file written
+        """
+        root, ext = os.path.splitext(path)
+        paths     = OrderedDict()
+        screen    = ScalableScreen(self.dumps())
+
+        for suffix, factor in variants.items():
+            paths[suffix] = root + suffix + ext
+            screen.save(paths[suffix], factor)
+
+        return paths
+
+
+    def compile(self, params=(), workers=None):
+        """
+        Render the screen once for fast rendering of many instances
+
+        Values that differ between instances are given as EDM macros, either
+        within strings as ``$(P)`` or assigned to a property as a
+        :class:`.Param`. The screen is validated when it is compiled
+
+        Parameters
+        ----------
+        params : iterable
+            Names of the macros substituted by :meth:`.CompiledScreen.render`
+
+        workers : int, optional
+            Number of threads used to render the screen, see :meth:`.dumps`
+
+        Returns
+        -------
+        screen : :class:`.CompiledScreen`
+        """
+        return CompiledScreen(self.dumps(workers=workers), params,
+                              objects=len(self.findChildren()),
+                              problems=str(self.validate()).splitlines())
+
+
+    @property
+    def processes(self):
+        """
+        Preview file and EDM process of the :attr:`.session`, as a list of
+        tuples
+
+        .. deprecated::
+            Every preview is now shown by a single :class:`.PreviewSession`,
+            use :attr:`.session` instead
+        """
+        warnings.warn('Designer.processes is deprecated, use Designer.session',
+                      DeprecationWarning, stacklevel=2)
+
+        if self.session is None or self.session.proc is None:
+            return list()
+
+        return [(self.session.path, self.session.proc)]
 
 
     def exec_(self, wd=None, wait=True, **kwargs):
         """
         Show the current EDM screen
 
+        Every call is shown by the same :class:`.PreviewSession`, which
+        rewrites a single temporary file and reuses the running EDM process
+
         Parameters
         ----------
         wd : str, optional
-            Working directory to launch screen
+            Working directory to launch screen. EDM is restarted if this
+            differs from that of the running preview
 
         wait : bool, optional
             Block the main thread while the EDM preview is open
@@ -194,18 +784,15 @@ class Designer:
         proc : ``subprocess.Popen``
             Process containing EDM launch
         """
-        ftmp = tempfile.NamedTemporaryFile(mode='w+', delete=False, suffix='.edl')
-        #Write to temporary disk
-        with ftmp as temp:
-            self.dump(temp)
-        #Launch subprocess
-        proc = launch(ftmp.name, wd=wd, wait=wait ,**kwargs)
-        #Add to list to be removed
-        self.processes.append((ftmp,proc))
-        return proc
+        if self.session is None:
+            self.session = PreviewSession(self)
+            atexit.register(Designer.closeAllWindows, self)
 
+        self.session.wd = wd
+        return self.session.exec_(wait=wait, **kwargs)
 
-    def dump(self, handle):
+
+    def dump(self, handle, workers=None, compact=False):
         """
         Save the screen to a file handle
 
@@ -213,25 +800,156 @@ class Designer:
         ----------
         handle : file-like object
             File to store rendered created PEDL objects
+
+        workers : int, optional
+            Number of threads used to render the screen, see :meth:`.dumps`
+
+        compact : bool, optional
+            Leave out comments and properties EDM assumes, see :meth:`.dumps`
         """
         if not handle.name.endswith('.edl'):
             logger.warning('Filename does not have suffix .edl ',
                            'EDM will not be able to launch this file')
 
+        handle.write(self.dumps(workers=workers, compact=compact))
+        handle.flush()
+
+
+    def dumps(self, workers=None, compact=False):
+        """
+        Render the whole screen
+
+        Parameters
+        ----------
+        workers : int, optional
+            Number of threads used to render the screen. The widgets of the
+            screen, including those within layouts, are divided into
+            contiguous chunks, each rendered with an environment belonging
+            to the thread, and the results joined in their original order.
+            The text is identical to that rendered by a single thread
+
+        compact : bool, optional
+            Leave out the comment naming each object, blank lines, and
+            properties holding the value EDM assumes when they are missing,
+            see :func:`.minify`
+
+        Returns
+        -------
+        edl : str
+            Contents of the EDL file
+
+        Notes
+        -----
+        While rendering, widgets are only read. Reading properties, the
+        :class:`.GeometryStore` and the points of :class:`.Lines` from many
+        threads is safe, as long as no thread changes the screen until the
+        render is complete. Setting any property, adding widgets, or
+        arranging layouts is not safe while a render is in progress, nor is
+        the first query of :attr:`.spatialIndex` or :attr:`.router`, which
+        build their contents lazily
+        """
         #Basic object list
         objs = [self.window]
         objs.extend(self.widgets)
 
-        edl  = [self.render(obj) for obj in objs]
+        if compact:
+            return minify(self.dumps(workers=workers))
 
-        handle.write('\n\n'.join(edl))
-        handle.flush()
+        if not workers or workers < 2:
+            return '\n\n'.join([self.render(obj) for obj in objs])
+
+        pieces = [w for obj in objs for w in self._pieces(obj)]
+        size   = max(1, -(-len(pieces) // (4*workers)))
+        chunks = [pieces[i:i+size] for i in range(0, len(pieces), size)]
+        local  = threading.local()
+
+        def render(chunk):
+            #Environments share the configuration and loader of the Designer
+            if not hasattr(local, 'env'):
+                local.env = self.env.overlay(cache_size=400)
+
+            return [self._render(w, local.env) if w is not None else ''
+                    for w in chunk]
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return '\n\n'.join([text for edl in pool.map(render, chunks)
+                                       for text in edl])
+
+
+    def save(self, path, only_changed=False, workers=None, compact=False):
+        """
+        Save the screen to an EDL file
+
+        Parameters
+        ----------
+        path : str
+            Location of the new file
+
+        only_changed : bool, optional
+            Leave the file untouched if it already holds this screen
+
+        workers : int, optional
+            Number of threads used to render the screen, see :meth:`.dumps`
+
+        compact : bool, optional
+            Leave out comments and properties EDM assumes, see :meth:`.dumps`
+
+        Returns
+        -------
+        written : bool
+            Whether the file was written
+        """
+        if only_changed:
+            return write_if_changed(path, self.dumps(workers=workers,
+                                                     compact=compact))
+
+        with open(path, 'w+') as handle:
+            self.dump(handle, workers=workers, compact=compact)
+
+        return True
+
+
+    async def save_async(self, path, only_changed=False, executor=None):
+        """
+        Save the screen to an EDL file without blocking the event loop
+
+        The screen is rendered and written in an executor, so many screens
+        can be saved concurrently from a single event loop. The screen must
+        not be changed until the save is complete
+
+        Parameters
+        ----------
+        path : str
+            Location of the new file
+
+        only_changed : bool, optional
+            Leave the file untouched if it already holds this screen
+
+        executor : ``concurrent.futures.ThreadPoolExecutor``, optional
+            Threads used to render and write the screen, by default those of
+            the event loop
+
+        Returns
+        -------
+        written : bool
+            Whether the file was written
+
+        Example
+        -------
+        .. code::
+
+            await asyncio.gather(*[d.save_async(path)
+                                   for (path, d) in screens.items()])
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.save, path,
+                                          only_changed)
 
 
     def closeAllWindows(self):
         """
-        Close all the registered processes
+        Close the preview and remove its temporary file
         """
-        for tmp, proc in self.processes:
-            proc.kill()
-            os.remove(tmp.name)
+        if self.session is not None:
+            self.session.close()
+            self.session = None
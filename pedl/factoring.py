@@ -0,0 +1,403 @@
+"""
+Screens built from the same composite layout many times, e.g a valve symbol
+with its label and buttons for every valve of a beamline, repeat the same
+block of EDL text for each device with only the PVs changed. EDM parses each
+of these blocks in turn, so large screens are slow to open. Layouts that are
+identical apart from their PVs can instead be written once to a shared screen
+that uses EDM macros for its PVs, with each occurrence replaced by an
+:class:`.EmbeddedWindow` giving the values of the macros.
+
+:meth:`.Designer.factor` finds the largest layouts that repeat, and returns
+the new screen along with each shared screen, in the same form as
+:meth:`.Designer.paginate`, so that :func:`.save_pages` can write them all.
+:func:`.report` measures the reduction in size.
+
+.. code::
+
+    screens = d.factor('vacuum')
+    print(pedl.factoring.report(d, screens))
+    save_pages(screens, directory='screens')
+
+Any property whose name ends with ``pv``, e.g :attr:`.Widget.alarmPV` or the
+``pv`` of a :class:`.Visibility`, is treated as a PV. Where the PVs of an
+occurrence differ only before their final ``:``, only that part is given as
+a macro, so ``VGC:01:STATE`` and ``VGC:01:OPEN`` become ``$(P):STATE`` and
+``$(P):OPEN``.
+"""
+####################
+# Standard Library #
+####################
+import copy
+import os.path
+import logging
+from enum import Enum
+from collections import OrderedDict, Counter, namedtuple
+
+####################
+#    Third Party   #
+####################
+import numpy as np
+
+####################
+#     Package      #
+####################
+from .layout  import Layout
+from .widgets import EmbeddedWindow, Display
+from .widgets.shape import Lines
+
+logger = logging.getLogger(__name__)
+
+
+def is_pv(name):
+    """
+    Whether a property holds the name of a PV
+    """
+    return name.lower().endswith('pv')
+
+
+def normal(value, pv=False):
+    """
+    Hashable form of a property value, with PV names reduced to whether one
+    is given
+    """
+    if pv and isinstance(value, str):
+        return bool(value)
+
+    if isinstance(value, (str, int, float, Enum, type(None))):
+        return value
+
+    if isinstance(value, np.ndarray):
+        return value.tobytes()
+
+    if isinstance(value, (list, tuple)):
+        return tuple(normal(v) for v in value)
+
+    if isinstance(value, dict):
+        return tuple(sorted((k, normal(v, is_pv(k))) for (k, v)
+                            in value.items()))
+
+    if hasattr(value, '__dict__'):
+        return (type(value), normal(vars(value)))
+
+    return repr(value)
+
+
+def locate(widget):
+    """
+    Location and value of each PV of a widget
+
+    Returns
+    -------
+    pvs : list
+        Tuple of the path of attribute names to each PV and its value
+    """
+    pvs = list()
+
+    for attr, value in sorted(widget.attributes.items()):
+        if is_pv(attr) and isinstance(value, str):
+            if value:
+                pvs.append(((attr,), value))
+
+        elif hasattr(value, '__dict__') and not isinstance(value, Enum):
+            pvs.extend(((attr, k), v) for (k, v) in sorted(vars(value).items())
+                       if is_pv(k) and isinstance(v, str) and v)
+
+    return pvs
+
+
+def leaves(obj):
+    """
+    Widgets within a layout, in the order they are rendered
+    """
+    if isinstance(obj, Layout):
+        for child in obj.widgets:
+            yield from leaves(child)
+
+    else:
+        yield obj
+
+
+class Structure:
+    """
+    Identify layouts that differ only in their position and PVs
+
+    Each distinct arrangement is given an integer, so that the key of a
+    layout only holds the integers of its children and their offsets from
+    the layout
+    """
+    def __init__(self):
+        self.ids   = dict()
+        self.cache = dict()
+
+
+    def intern(self, key):
+        return self.ids.setdefault(key, len(self.ids))
+
+
+    def key(self, obj):
+        """
+        Integer identifying the arrangement of an object
+        """
+        if id(obj) in self.cache:
+            return self.cache[id(obj)]
+
+        if isinstance(obj, Layout):
+            x, y = obj.x, obj.y
+            key  = self.intern(tuple((c.x - x, c.y - y, self.key(c))
+                                     for c in obj.widgets))
+            self.cache[id(obj)] = key
+            return key
+
+        attrs = dict(obj.attributes)
+
+        #Points are compared relative to the widget
+        if isinstance(obj, Lines):
+            attrs['points'] = obj.points - [obj.x, obj.y]
+
+        return self.intern((type(obj), obj.w, obj.h, normal(attrs)))
+
+
+def macros(occurrences):
+    """
+    Find the macros needed for a set of layouts with the same arrangement
+
+    Parameters
+    ----------
+    occurrences : list
+        Values of the PVs of each layout, in the same order for every layout
+
+    Returns
+    -------
+    templates : list
+        Value of each PV in the shared screen
+
+    values : list
+        Mapping of macro name to value for each occurrence
+    """
+    columns = list(zip(*occurrences))
+    slots   = list()
+
+    for column in columns:
+        if len(set(column)) == 1:
+            slots.append((None, column[0]))
+            continue
+
+        heads, tails = zip(*[v.rpartition(':')[::2] for v in column])
+
+        #Keep a suffix shared by every occurrence within the screen
+        if all(heads) and len(set(tails)) == 1:
+            slots.append((heads, ':' + tails[0]))
+
+        else:
+            slots.append((column, ''))
+
+    #Parts that always hold the same values share a macro
+    parts = list(OrderedDict.fromkeys(p for (p, _) in slots if p))
+    names = ['P'] if len(parts) == 1 else ['P{}'.format(i+1)
+                                           for i in range(len(parts))]
+    named = dict(zip(parts, names))
+
+    templates = [suffix if part is None
+                 else '$({})'.format(named[part]) + suffix
+                 for (part, suffix) in slots]
+
+    values = [OrderedDict((named[p], p[i]) for p in parts)
+              for i in range(len(occurrences))]
+
+    return templates, values
+
+
+def factor(designer, name, count=2, widgets=2):
+    """
+    Replace layouts repeated throughout a screen with embedded screens
+
+    See :meth:`.Designer.factor`
+    """
+    screen    = designer._copy()
+    structure = Structure()
+    keys      = dict()
+    sizes     = dict()
+
+    def visit(obj):
+        if isinstance(obj, Layout) and obj.widgets:
+            keys[id(obj)]  = structure.key(obj)
+            sizes[id(obj)] = sum(1 for _ in leaves(obj))
+
+            for child in obj.widgets:
+                visit(child)
+
+    for obj in screen.widgets:
+        visit(obj)
+
+    totals = Counter(keys.values())
+    shared = {key for (key, total) in totals.items() if total >= count}
+    shared.difference_update(keys[i] for (i, size) in sizes.items()
+                             if size < widgets)
+
+    #Choose the outermost shared layouts. A layout used fewer times than
+    #required once its parents are chosen is dropped, which may expose more
+    #of the layouts within it
+    while True:
+        chosen = list()
+
+        def select(container, children):
+            for i, obj in enumerate(children):
+                if not isinstance(obj, Layout) or not obj.widgets:
+                    continue
+
+                if keys[id(obj)] in shared:
+                    chosen.append((container, i, obj))
+
+                else:
+                    select(obj, obj.widgets)
+
+        select(screen, screen.widgets)
+        used = Counter(keys[id(obj)] for (_, _, obj) in chosen)
+        rare = {key for key in shared if used[key] < count}
+
+        if not rare:
+            break
+
+        shared -= rare
+
+    groups = OrderedDict()
+    for entry in chosen:
+        groups.setdefault(keys[id(entry[2])], list()).append(entry)
+
+    screens = OrderedDict([('{}.edl'.format(name), screen)])
+
+    for n, entries in enumerate(groups.values()):
+        filename = '{}_shared{}.edl'.format(name, n+1)
+        found    = [[(i, path, value) for (i, w) in enumerate(leaves(obj))
+                                      for (path, value) in locate(w)]
+                    for (_, _, obj) in entries]
+        templates, values = macros([[v for (_, _, v) in pvs]
+                                    for pvs in found])
+
+        #The first occurrence becomes the shared screen
+        first = entries[0][2]
+        page  = type(designer)(template_dir=designer.template_dir)
+        page.env = designer.env
+
+        for attr, value in designer.window.attributes.items():
+            setattr(page.window, attr, value)
+
+        page.window.name = os.path.splitext(filename)[0]
+        page.window.w, page.window.h = first.w, first.h
+        copies = list()
+
+        for widget in leaves(first):
+            clone = copy.deepcopy(widget, {id(widget.parent): None})
+
+            if isinstance(clone, Lines):
+                clone.points = clone.points - [first.x, first.y]
+
+            else:
+                clone.x, clone.y = clone.x - first.x, clone.y - first.y
+
+            copies.append(clone)
+
+        for (i, path, _), text in zip(found[0], templates):
+            if len(path) == 1:
+                copies[i].attributes[path[0]] = text
+
+            else:
+                setattr(copies[i].attributes[path[0]], path[1], text)
+
+        for clone in copies:
+            page.addWidget(clone)
+
+        screens[filename] = page
+
+        for (container, i, obj), macro in zip(entries, values):
+            symbols = ','.join('='.join(item) for item in macro.items())
+            window  = EmbeddedWindow(autoscale=False,
+                                     displays=[Display(page.window.name,
+                                                       filename,
+                                                       symbols)])
+            window.setGeometry(obj.x, obj.y, obj.w, obj.h)
+            replace(container, i, window)
+
+    logger.debug('Shared {} layouts between {} screens'
+                 ''.format(len(chosen), len(groups)))
+    return screens
+
+
+def replace(container, index, widget):
+    """
+    Put a widget in the place of a child of a layout or Designer
+    """
+    old = container.widgets[index]
+    container.widgets[index] = widget
+
+    if isinstance(container, Layout):
+        widget.parent = container
+
+        #Keep the cell of a GridLayout
+        cells = getattr(container, 'cells', None)
+        if cells is not None and old in cells:
+            cells[widget] = cells.pop(old)
+
+
+class Report(namedtuple('Report', ['before', 'after', 'uses'])):
+    """
+    Size of a screen before and after layouts were shared
+
+    Attributes
+    ----------
+    before : int
+        Size in bytes of the original screen
+
+    after : int
+        Size in bytes of the new screen and every shared screen
+
+    uses : OrderedDict
+        Number of times each shared screen is embedded
+    """
+    __slots__ = ()
+
+    @property
+    def reduction(self):
+        """
+        Fraction of the original size saved
+        """
+        if not self.before:
+            return 0.
+
+        return 1. - self.after / self.before
+
+
+    def __str__(self):
+        lines = ['{} bytes reduced to {} bytes ({:.1%} smaller) by sharing '
+                 '{} layouts'.format(self.before, self.after, self.reduction,
+                                     len(self.uses))]
+        lines.extend('  {} embedded {} times'.format(name, uses)
+                     for (name, uses) in self.uses.items())
+        return '\n'.join(lines)
+
+
+def report(designer, screens):
+    """
+    Compare the size of a screen with the screens created by
+    :meth:`.Designer.factor`
+
+    Parameters
+    ----------
+    designer : :class:`.Designer`
+        Original screen
+
+    screens : dict
+        Mapping of filename to :class:`.Designer`
+
+    Returns
+    -------
+    report : :class:`.Report`
+    """
+    main = next(iter(screens.values()))
+    uses = Counter(d.path for w in main.findChildren(EmbeddedWindow)
+                          for d in w.displays)
+
+    return Report(len(designer.dumps().encode()),
+                  sum(len(s.dumps().encode()) for s in screens.values()),
+                  OrderedDict((name, uses[name]) for name in screens
+                              if name in uses))
@@ -0,0 +1,238 @@
+"""
+Sites generate many screens from a package of Python code. Each function that
+creates a screen is registered with the :func:`.factory` decorator, along
+with the path of the file it is saved to, so that tools such as ``pedl
+watch`` can find every screen created by a module and run only those that
+need to be regenerated.
+
+.. code::
+
+    @pedl.factory('valves/overview.edl')
+    def overview():
+        d = pedl.Designer()
+        ...
+        return d
+"""
+####################
+# Standard Library #
+####################
+import os
+import sys
+import inspect
+import logging
+import functools
+import importlib
+from collections import OrderedDict, namedtuple
+
+####################
+#    Third Party   #
+####################
+
+####################
+#     Package      #
+####################
+from .designer import Designer
+from .compiled import CompiledScreen
+
+logger = logging.getLogger(__name__)
+
+#Registered factories by output path
+registry = OrderedDict()
+
+
+class Factory(namedtuple('Factory', ['path', 'func'])):
+    """
+    A registered function that creates a screen
+
+    Attributes
+    ----------
+    path : str
+        Location of the screen relative to the output directory
+
+    func : callable
+        Function returning a :class:`.Designer`, or a
+        :class:`.CompiledScreen` for an instance of a :func:`.family`
+    """
+    __slots__ = ()
+
+    @property
+    def module(self):
+        """
+        Name of the module defining the factory
+        """
+        return self.func.__module__
+
+
+    @property
+    def source(self):
+        """
+        Absolute path of the file defining the factory
+        """
+        func = inspect.unwrap(self.func)
+        return os.path.abspath(inspect.getsourcefile(func))
+
+
+def factory(path=None):
+    """
+    Register a function that creates a screen
+
+    Parameters
+    ----------
+    path : str, optional
+        Location of the screen relative to the output directory, by default
+        the name of the function with the suffix ``.edl``
+    """
+    def decorator(func):
+        name     = path or func.__name__ + '.edl'
+        previous = registry.get(name)
+
+        if previous and (previous.module, previous.func.__qualname__) \
+                     != (func.__module__, func.__qualname__):
+            logger.warning('{} is created by both {}.{} and {}.{}'
+                           ''.format(name, previous.module,
+                                     previous.func.__qualname__,
+                                     func.__module__, func.__qualname__))
+
+        registry[name] = Factory(name, func)
+        return func
+
+    return decorator
+
+
+def family(path, instances, params=None):
+    """
+    Register a function creating a parametric screen for many instances
+
+    The function returns a :class:`.Designer` using EDM macros for the
+    values that differ between instances. It is called and compiled with
+    :meth:`.Designer.compile` once per process, after which each instance is
+    rendered by substituting its values
+
+    Parameters
+    ----------
+    path : str
+        Format string for the location of each instance, e.g
+        ``'valves/{P}.edl'``
+
+    instances : iterable
+        Dictionary of parameter values for each instance
+
+    params : iterable, optional
+        Names of the parameters, by default the keys of the first instance
+
+    Example
+    -------
+    .. code::
+
+        @pedl.family('valves/{P}.edl', [{'P': 'VGC:01'}, {'P': 'VGC:02'}])
+        def valve():
+            d = pedl.Designer()
+            d.addWidget(Rectangle(w=50, h=50, alarmPV='$(P):STATE'))
+            return d
+    """
+    instances = [dict(values) for values in instances]
+    names     = list(params or (instances[0] if instances else ()))
+
+    def decorator(func):
+        compiled = dict()
+
+        def screen():
+            if 'screen' not in compiled:
+                compiled['screen'] = func().compile(names)
+
+            return compiled['screen']
+
+        for values in instances:
+            def instance(values=values):
+                return screen().bind(**values)
+
+            functools.update_wrapper(instance, func)
+            name = path.format(**values)
+            registry[name] = Factory(name, instance)
+
+        return func
+
+    return decorator
+
+
+def load(module):
+    """
+    Import a module of factories
+
+    Parameters
+    ----------
+    module : str
+        Either the dotted name of a module or the path of a Python file, in
+        which case its directory is added to ``sys.path``
+
+    Returns
+    -------
+    module : ``module``
+    """
+    if module.endswith('.py') or os.path.sep in module:
+        directory, name = os.path.split(os.path.abspath(module))
+
+        if directory not in sys.path:
+            sys.path.insert(0, directory)
+
+        module = os.path.splitext(name)[0]
+
+    return importlib.import_module(module)
+
+
+def root(module):
+    """
+    Directory holding the source of a module, or of the whole package
+    """
+    return os.path.dirname(os.path.abspath(module.__file__))
+
+
+def factories(module):
+    """
+    Registered factories defined beneath the directory of a module
+
+    Parameters
+    ----------
+    module : ``module``
+
+    Returns
+    -------
+    factories : list
+        :class:`.Factory` objects in order of registration
+    """
+    base = os.path.join(root(module), '')
+    return [f for f in registry.values() if f.source.startswith(base)]
+
+
+def run(factory, directory='.', only_changed=True):
+    """
+    Create a screen and save it beneath a directory
+
+    Parameters
+    ----------
+    factory : :class:`.Factory`
+
+    directory : str, optional
+        Root of the output tree
+
+    only_changed : bool, optional
+        Leave files that already hold the screen untouched
+
+    Returns
+    -------
+    designer : :class:`.Designer` or :class:`.CompiledScreen`
+        The created screen
+
+    written : bool
+        Whether the file was written
+    """
+    designer = factory.func()
+
+    if not isinstance(designer, (Designer, CompiledScreen)):
+        raise TypeError('Factory {} returned {} rather than a Designer'
+                        ''.format(factory.path, type(designer).__name__))
+
+    path = os.path.join(directory, factory.path)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    return designer, designer.save(path, only_changed=only_changed)
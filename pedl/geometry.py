@@ -0,0 +1,192 @@
+"""
+The position and size of every :class:`.PedlObject` is held in a single set
+of shared NumPy arrays rather than on each object. Each object only keeps the
+index of its slot within the :class:`.GeometryStore`, and the ``x``, ``y``,
+``w`` and ``h`` attributes read and write through to the arrays. This allows
+operations on many widgets at once, such as the arrangement of a layout, to
+be performed as vectorized array operations rather than attribute by
+attribute.
+"""
+####################
+# Standard Library #
+####################
+import logging
+import threading
+
+####################
+#    Third Party   #
+####################
+import numpy as np
+
+####################
+#     Package      #
+####################
+from .utils import pedlproperty
+
+logger = logging.getLogger(__name__)
+
+
+class GeometryStore:
+    """
+    Structure of arrays holding the geometry of all PEDL objects
+
+    Parameters
+    ----------
+    capacity : int, optional
+        Initial number of slots, the store grows as needed
+
+    Attributes
+    ----------
+    axes : tuple
+        Names of each row of :attr:`.data`
+
+    data : ``numpy.ndarray``
+        (4, capacity) array of x, y, w and h. The array is reallocated as the
+        store grows, so references to it should not be kept
+
+    Notes
+    -----
+    Slots are allocated and released under a lock, as objects release their
+    slot when they are garbage collected, which may happen on any thread,
+    e.g within the pool of :meth:`.Designer.dumps`. The lock is reentrant,
+    as collection may also be triggered while a slot is being allocated. A
+    slot is cleared when it is allocated again rather than when released, so
+    a release within the growth of the store loses nothing
+    """
+    axes = ('x', 'y', 'w', 'h')
+
+    def __init__(self, capacity=1024):
+        self.data = np.zeros((len(self.axes), capacity), dtype=np.int64)
+        self.free = list()
+        self.size = 0
+        self._lock = threading.RLock()
+
+
+    def allocate(self):
+        """
+        Reserve a slot in the store
+
+        Returns
+        -------
+        slot : int
+        """
+        with self._lock:
+            if self.free:
+                slot = self.free.pop()
+                self.data[:, slot] = 0
+                return slot
+
+            if self.size == self.data.shape[1]:
+                data = np.zeros((len(self.axes), 2*self.size), dtype=np.int64)
+                data[:, :self.size] = self.data
+                self.data = data
+
+            self.size += 1
+            return self.size - 1
+
+
+    def release(self, slot):
+        """
+        Return a slot to the store for reuse
+        """
+        with self._lock:
+            self.free.append(slot)
+
+
+    def axis(self, name):
+        """
+        Row of the store for an axis name
+        """
+        return self.data[self.axes.index(name)]
+
+
+    def scale(self, slots, factor):
+        """
+        Scale the geometry of many objects about the origin at once
+
+        The edges of each object are scaled and rounded rather than the size,
+        so that objects that touch before scaling still touch afterwards
+
+        Parameters
+        ----------
+        slots : array-like
+            Slots of the objects to scale
+
+        factor : float
+            Scale factor applied to both axes
+        """
+        slots  = np.asarray(slots, dtype=np.intp)
+        near   = self.data[:2, slots]
+        far    = near + self.data[2:, slots]
+        near   = np.rint(near * factor).astype(np.int64)
+        self.data[:2, slots] = near
+        self.data[2:, slots] = np.rint(far * factor).astype(np.int64) - near
+
+
+    def __len__(self):
+        return self.size - len(self.free)
+
+
+#Store shared by all PEDL objects
+store = GeometryStore()
+
+
+class geometryproperty(pedlproperty):
+    """
+    A :class:`.pedlproperty` stored in the shared :class:`.GeometryStore`
+
+    Parameters
+    ----------
+    axis : int
+        Row of the store holding the property
+
+    default : int, optional
+        Initial value
+
+    cb : callable, optional
+        Function to be run after the value is changed
+
+    doc : str, optional
+        Short doc-string to describe the property
+    """
+    def __init__(self, axis, default=0, fset=None, fget=None,
+                 cb=None, doc=None):
+        super().__init__(int, default=default, fset=fset, fget=fget,
+                         cb=cb, doc=doc)
+        self.axis = axis
+
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        return int(store.data[self.axis, instance._slot])
+
+
+    def __set__(self, instance, value):
+        if self.fset:
+            self.fset(instance, value)
+            return
+
+        value    = int(value)
+        previous = store.data[self.axis, instance._slot]
+        store.data[self.axis, instance._slot] = value
+
+        if previous != value and self.cb:
+            self.cb(instance)
+
+
+    def getter(self, fget):
+        return type(self)(self.axis, default=self.default,
+                          fget=fget, fset=self.fset,
+                          cb=self.cb, doc=self.__doc__)
+
+    def setter(self, fset):
+        return type(self)(self.axis, default=self.default,
+                          fget=self.fget, fset=fset,
+                          cb=self.cb, doc=self.__doc__)
+
+    def callback(self, cb):
+        return type(self)(self.axis, default=self.default,
+                          fget=self.fget, fset=self.fset,
+                          cb=cb, doc=self.__doc__)
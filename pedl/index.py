@@ -0,0 +1,381 @@
+"""
+Large, hand-maintained screens are often only partially generated. Instead of
+re-rendering a complete file to change a single PV, an :class:`.ObjectIndex`
+records where each ``object`` block lives inside the EDL file. The index is
+built with a single scan and cached next to the file, so that subsequent
+edits can splice freshly rendered text over only the blocks that changed with
+:meth:`.ObjectIndex.patch`.
+
+Example
+-------
+.. code::
+
+    index = ObjectIndex.load('large.edl')
+    i     = index.find(name='Valve 4')[0]
+    index = index.patch({i : designer.render(new_valve)})
+"""
+####################
+# Standard Library #
+####################
+import os
+import re
+import json
+import mmap
+import shutil
+import logging
+import tempfile
+from collections import namedtuple
+
+####################
+#    Third Party   #
+####################
+
+####################
+#     Package      #
+####################
+
+logger = logging.getLogger(__name__)
+
+ObjectBlock = namedtuple('ObjectBlock', ['name', 'widgetClass', 'start', 'end'])
+
+#Optional name comment and object declaration
+_header = re.compile(rb'^(?:# \(([^\n]*)\)\r?\n)?object (\S+)\r?\n',
+                     flags=re.MULTILINE)
+
+#Statements that open and close the objects within a group, and that end the
+#properties of an object
+_marker = re.compile(rb'^[ \t]*(beginGroup|endGroup|endObjectProperties)'
+                     rb'[ \t]*\r?$', flags=re.MULTILINE)
+
+
+def _blocks(data):
+    """
+    Header match and end offset of each top-level object in EDL text
+
+    The objects within a group are part of the block of the group, which
+    only ends at the ``endObjectProperties`` following its ``endGroup``
+    """
+    pos = 0
+
+    while True:
+        header = _header.search(data, pos)
+
+        if header is None:
+            return
+
+        depth = 0
+
+        for marker in _marker.finditer(data, header.end()):
+            word = marker.group(1)
+
+            if word == b'beginGroup':
+                depth += 1
+
+            elif word == b'endGroup':
+                depth -= 1
+
+            elif depth <= 0:
+                break
+
+        #Object without an end
+        else:
+            return
+
+        yield header, marker.end(1)
+        pos = marker.end(1)
+
+
+class ObjectIndex:
+    """
+    Byte-offset index of the objects within an EDL file
+
+    Only top-level objects are indexed, the objects within a group are
+    patched along with the group
+
+    Parameters
+    ----------
+    path : str
+        Path to the EDL file
+
+    blocks : list
+        :class:`.ObjectBlock` entries in file order
+
+    stamp : tuple, optional
+        Size and modification time of the file when it was scanned
+
+    Attributes
+    ----------
+    suffix : str
+        Extension appended to the EDL path to store the cached index
+
+    chunk : int
+        Buffer size used when streaming the file during a patch
+    """
+    suffix = '.idx'
+    chunk  = 1 << 20
+
+    def __init__(self, path, blocks, stamp=None):
+        self.path   = path
+        self.blocks = list(blocks)
+        self.stamp  = stamp or self.stat(path)
+
+
+    @staticmethod
+    def stat(path):
+        """
+        Size and modification time used to invalidate cached indices
+        """
+        info = os.stat(path)
+        return (info.st_size, info.st_mtime_ns)
+
+
+    @property
+    def cache(self):
+        """
+        Path of the cached index
+        """
+        return self.path + self.suffix
+
+
+    @property
+    def stale(self):
+        """
+        Whether the file has been modified since it was indexed
+        """
+        return self.stamp != self.stat(self.path)
+
+
+    @classmethod
+    def build(cls, path):
+        """
+        Scan an EDL file for object blocks
+
+        Parameters
+        ----------
+        path : str
+            Path to the EDL file
+
+        Returns
+        -------
+        index : :class:`.ObjectIndex`
+        """
+        stamp  = cls.stat(path)
+        blocks = list()
+
+        #Empty files can not be memory mapped
+        if stamp[0]:
+            with open(path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                    for match, end in _blocks(m):
+                        name = match.group(1)
+                        if name is not None:
+                            name = name.decode()
+
+                        blocks.append(ObjectBlock(name,
+                                                  match.group(2).decode(),
+                                                  match.start(), end))
+
+        logger.debug('Indexed {} objects in {}'.format(len(blocks), path))
+        return cls(path, blocks, stamp=stamp)
+
+
+    @classmethod
+    def load(cls, path, cache=True):
+        """
+        Load the index of a file, rescanning only if the cache is stale
+
+        Parameters
+        ----------
+        path : str
+            Path to the EDL file
+
+        cache : bool, optional
+            Read and write the index stored alongside the file
+
+        Returns
+        -------
+        index : :class:`.ObjectIndex`
+        """
+        if cache:
+            try:
+                with open(path + cls.suffix, 'r') as f:
+                    info = json.load(f)
+
+                stamp = tuple(info['stamp'])
+
+                if stamp == cls.stat(path):
+                    logger.debug('Using cached index for {}'.format(path))
+                    return cls(path, [ObjectBlock(*b) for b in info['blocks']],
+                               stamp=stamp)
+
+            except (OSError, ValueError, KeyError, TypeError):
+                logger.debug('No valid cached index for {}'.format(path))
+
+        index = cls.build(path)
+
+        if cache:
+            index.save()
+
+        return index
+
+
+    def save(self):
+        """
+        Store the index alongside the EDL file
+        """
+        with open(self.cache, 'w') as f:
+            json.dump({'stamp'  : list(self.stamp),
+                       'blocks' : [list(b) for b in self.blocks]}, f)
+
+
+    def find(self, name=None, widgetClass=None):
+        """
+        Positions of the blocks matching a name and or widget class
+
+        Returns
+        -------
+        indices : list
+        """
+        return [i for (i, b) in enumerate(self.blocks)
+                if (name is None or b.name == name)
+                and (widgetClass is None or b.widgetClass == widgetClass)]
+
+
+    def read(self, index):
+        """
+        Text of a single object block
+        """
+        block = self.blocks[index]
+
+        with open(self.path, 'rb') as f:
+            f.seek(block.start)
+            return f.read(block.end - block.start).decode()
+
+
+    def patch(self, changes):
+        """
+        Replace object blocks within the file
+
+        Only the requested blocks are rewritten. If every replacement is the
+        same size as the original block the file is modified in place through
+        ``mmap``, otherwise a single streamed copy is written beside the
+        original and moved over it.
+
+        Parameters
+        ----------
+        changes : dict
+            Mapping of block position to replacement text, usually the output
+            of :meth:`.Designer.render`
+
+        Returns
+        -------
+        index : :class:`.ObjectIndex`
+            Updated index of the patched file
+
+        Raises
+        ------
+        ValueError:
+            If the file has been modified since it was indexed
+        """
+        if self.stale:
+            raise ValueError('{} has changed since it was indexed'
+                             ''.format(self.path))
+
+        edits = sorted(((self.blocks[i], i, text.encode())
+                        for (i, text) in changes.items()),
+                       key=lambda edit : edit[0].start)
+
+        if all(len(text) == b.end - b.start for (b, i, text) in edits):
+            self._splice(edits)
+            logger.debug('Patched {} blocks of {} in place'
+                         ''.format(len(edits), self.path))
+        else:
+            self._stream(edits)
+            logger.debug('Patched {} blocks of {} by copy'
+                         ''.format(len(edits), self.path))
+
+        #Shift the offsets of all blocks following each edit
+        blocks = list(self.blocks)
+        shift  = 0
+        edits  = dict((i, text) for (b, i, text) in edits)
+
+        for i, b in enumerate(blocks):
+            start = b.start + shift
+
+            if i in edits:
+                match = _header.match(edits[i])
+                name  = b.name
+                cls   = b.widgetClass
+
+                if match:
+                    name = match.group(1) and match.group(1).decode()
+                    cls  = match.group(2).decode()
+
+                shift += len(edits[i]) - (b.end - b.start)
+                blocks[i] = ObjectBlock(name, cls, start, start + len(edits[i]))
+
+            else:
+                blocks[i] = b._replace(start=start, end=b.end + shift)
+
+        index = type(self)(self.path, blocks)
+
+        if os.path.exists(self.cache):
+            index.save()
+
+        return index
+
+
+    def _splice(self, edits):
+        """
+        Overwrite equally sized blocks in place
+        """
+        with open(self.path, 'r+b') as f:
+            with mmap.mmap(f.fileno(), 0) as m:
+                for (block, i, text) in edits:
+                    m[block.start:block.end] = text
+                m.flush()
+
+
+    def _stream(self, edits):
+        """
+        Copy the file once, substituting the edited blocks
+        """
+        dirname = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp = tempfile.mkstemp(dir=dirname, suffix='.edl')
+
+        try:
+            with open(self.path, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+                for (block, i, text) in edits:
+                    self._copy(src, dst, block.start - src.tell())
+                    dst.write(text)
+                    src.seek(block.end)
+
+                self._copy(src, dst, None)
+
+            shutil.copymode(self.path, tmp)
+            os.replace(tmp, self.path)
+
+        except Exception:
+            os.remove(tmp)
+            raise
+
+
+    def _copy(self, src, dst, size):
+        """
+        Copy size bytes between two handles, or the remainder if None
+        """
+        while size is None or size > 0:
+            n    = self.chunk if size is None else min(self.chunk, size)
+            data = src.read(n)
+
+            if not data:
+                break
+
+            dst.write(data)
+
+            if size is not None:
+                size -= len(data)
+
+
+    def __len__(self):
+        return len(self.blocks)
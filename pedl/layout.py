@@ -1,12 +1,16 @@
 """
 PEDL uses a Qt inspired layout system. Not all of the feature set has been
 implemented, but the basic concept is the same as well as much of the API.
-There are three major layout types, :class:`.HBoxLayout`, :class:`.VBoxLayout`
-and finally :class:`.StackLayout`. The two former layout types are borrowed
-directly from Qt, you simply add widgets and they are aligned and placed in
-such a way that they are either in a vertical or horizontal line. Finally,
-because EDM widgets tend to need to be stacked on top of each other, the
-:class:`.StackLayout` can be used to handle these kind of situations.
+There are four major layout types, :class:`.HBoxLayout`, :class:`.VBoxLayout`,
+:class:`.GridLayout` and finally :class:`.StackLayout`. The first three layout
+types are borrowed directly from Qt, you simply add widgets and they are
+aligned and placed in such a way that they are either in a vertical or
+horizontal line, or in the cells of a table. Finally, because EDM widgets tend
+to need to be stacked on top of each other, the :class:`.StackLayout` can be
+used to handle these kind of situations. For a varying number of similar
+widgets, the :class:`.FlowLayout` fills rows and wraps them at a given width,
+while the :class:`.PackedLayout` fits widgets of very different sizes, such as
+embedded displays, into as small an area as it can.
 
 Far more complex layouts are possible by using :meth:`Layout.addLayout` to
 nest layouts inside of each other. This allows the user to maintain a master
@@ -18,20 +22,70 @@ widget by using the :meth:`.Designer.setLayout`
 ####################
 import copy
 import logging
+from bisect import bisect_left, bisect_right
+from collections import namedtuple, deque
 
 ####################
 #    Third Party   #
 ####################
+import numpy as np
 
 ####################
 #     Package      #
 ####################
-from .widget  import Widget, PedlObject
-from .choices import AlignmentChoice
-from .utils   import pedlproperty
+from .widget   import Widget, PedlObject, MainWindow
+from .choices  import AlignmentChoice
+from .utils    import pedlproperty
+from .geometry import store
+from .metrics  import fit_text
 
 logger = logging.getLogger(__name__)
 
+
+def stored(widgets):
+    """
+    Slots of a list of widgets within the :class:`.GeometryStore`
+
+    Returns
+    -------
+    slots : ``numpy.ndarray`` or None
+        Array of slots, or None if any of the widgets derives its geometry
+        from other properties e.g a child :class:`.Layout`
+    """
+    if not widgets or not all(w._stored for w in widgets):
+        return None
+
+    return np.fromiter((w._slot for w in widgets), dtype=np.intp,
+                       count=len(widgets))
+
+
+def notify(widgets, changed):
+    """
+    Inform the listeners of widgets moved by a vectorized operation
+    """
+    for i in np.flatnonzero(changed):
+        if widgets[i].listeners:
+            widgets[i].geometryChanged()
+
+
+def centers(size):
+    """
+    Half of each size, rounded the same way as :meth:`.PedlObject.recenter`
+    """
+    return np.rint(size / 2).astype(np.int64)
+
+
+def alignments(align):
+    """
+    Convert a single alignment or a sequence of alignments into a list
+    """
+    try:
+        return [AlignmentChoice(a) for a in align]
+
+    except TypeError:
+        return [AlignmentChoice(align)]
+
+
 class Layout(PedlObject):
     """
     Parameters
@@ -53,6 +107,24 @@ class Layout(PedlObject):
         super().__init__(**kwargs)
 
 
+    def _extent(self, axis, size=None):
+        """
+        Minimum position, or maximum far edge along an axis of the children
+        """
+        slots = stored(self.widgets)
+
+        if slots is not None:
+            pos = store.data[axis, slots]
+            if size is None:
+                return int(pos.min())
+            return int((pos + store.data[size, slots]).max())
+
+        if size is None:
+            return min([w.y if axis else w.x for w in self.widgets])
+
+        return max([w.bottom if axis else w.right for w in self.widgets])
+
+
     @property
     def w(self):
         """
@@ -61,7 +133,7 @@ class Layout(PedlObject):
         if not self.widgets:
             return 0
 
-        return (max([w.right for w in self.widgets]) - self.x)
+        return self._extent(0, 2) - self.x
 
 
     @property
@@ -72,7 +144,7 @@ class Layout(PedlObject):
         if not self.widgets:
             return 0
 
-        return (max([w.bottom for w in self.widgets]) - self.y)
+        return self._extent(1, 3) - self.y
 
 
     @property
@@ -80,7 +152,7 @@ class Layout(PedlObject):
         if not self.widgets:
             return 0
 
-        return min([w.x for w in self.widgets])
+        return self._extent(0)
 
 
     @property
@@ -88,7 +160,7 @@ class Layout(PedlObject):
         if not self.widgets:
             return 0
 
-        return min([w.y for w in self.widgets])
+        return self._extent(1)
 
 
     @x.setter
@@ -186,6 +258,100 @@ class Layout(PedlObject):
         self.shuffle()
 
 
+    def fitText(self, padding=2, uniform=False):
+        """
+        Size each text widget in the layout to fit its text
+
+        All of the labels are measured at once, then the layout is arranged
+
+        Parameters
+        ----------
+        padding : int, optional
+            Space to leave on each side of the text
+
+        uniform : bool, optional
+            Give every label the size of the largest, so that a column or row
+            of labels lines up
+        """
+        labels = [w for w in self.widgets
+                  if 'text' in w._pedl and 'font' in w._pedl]
+
+        if labels:
+            fit_text(labels, padding=padding, uniform=uniform)
+            self.shuffle()
+
+
+    def removeWidget(self, widget):
+        """
+        Remove a widget or child layout
+
+        Parameters
+        ----------
+        widget : :class:`.Widget` or :class:`.Layout`
+            Child to remove
+
+        Raises
+        ------
+        ValueError:
+            If the object is not a child of the layout
+        """
+        self.widgets.remove(widget)
+        widget.parent = None
+
+        #Redraw
+        self.shuffle()
+
+
+    def arrange(self, slots, axis, leading, trailing):
+        """
+        Place simple widgets in a line using vectorized operations
+
+        Each widget follows the previous along the axis, separated by the
+        :attr:`.spacing`, and is aligned to the first widget on the opposite
+        axis. This gives the same result as placing each widget in turn
+
+        Parameters
+        ----------
+        slots : ``numpy.ndarray``
+            Slots of the child widgets in the :class:`.GeometryStore`
+
+        axis : int
+            Zero to place widgets horizontally, one to place vertically
+
+        leading : :class:`.AlignmentChoice`
+            Alignment to the minimum of the opposite axis
+
+        trailing : :class:`.AlignmentChoice`
+            Alignment to the far edge of the first widget
+        """
+        cross = 1 - axis
+        data  = store.data
+        pos,   size = data[axis,  slots], data[axis + 2,  slots]
+        align, span = data[cross, slots], data[cross + 2, slots]
+
+        #Cumulative sum of the preceding sizes and spacing
+        placed = pos.min() + np.concatenate(([0], np.cumsum(size[:-1]
+                                                           + self.spacing)))
+        #Offset from the first widget
+        center = align[0] + centers(span[0])
+
+        if self.alignment == leading:
+            aligned = np.full_like(align, align.min())
+
+        elif self.alignment == trailing:
+            aligned = align[0] + span[0] - span
+
+        elif self.alignment == AlignmentChoice.Center and center:
+            aligned = center - centers(span)
+
+        else:
+            aligned = align
+
+        data[axis,  slots] = placed
+        data[cross, slots] = aligned
+        notify(self.widgets, (placed != pos) | (aligned != align))
+
+
     def shuffle(self):
         """
         Rearrange all of the  child widgets
@@ -214,6 +380,14 @@ class HBoxLayout(Layout):
             logger.warning('Unsupported alignment {} HBoxLayout'
                            ''.format(self.alignment))
 
+        #Arrange all at once if each child is a simple widget
+        slots = stored(self.widgets)
+
+        if slots is not None:
+            self.arrange(slots, 0, AlignmentChoice.Top, AlignmentChoice.Bottom)
+            super().shuffle()
+            return
+
         for widget in self.widgets:
             #Align Widget
             if self.alignment == AlignmentChoice.Top:
@@ -249,6 +423,14 @@ class VBoxLayout(Layout):
             logger.warning('Unsupported alignment {} for VBoxLayout'
                            ''.format(self.alignment))
 
+        #Arrange all at once if each child is a simple widget
+        slots = stored(self.widgets)
+
+        if slots is not None:
+            self.arrange(slots, 1, AlignmentChoice.Left, AlignmentChoice.Right)
+            super().shuffle()
+            return
+
         for widget in self.widgets:
             if self.alignment == AlignmentChoice.Left:
                 widget.x = self.x
@@ -296,12 +478,7 @@ class StackedLayout(Layout):
 
     @alignment.setter
     def alignment(self, align):
-
-        try:
-            align = [AlignmentChoice(a) for a in align]
-
-        except TypeError:
-            align = [AlignmentChoice(align)]
+        align = alignments(align)
 
         if align != self.attributes.get('alignment'):
             self.attributes['alignment'] = align
@@ -316,6 +493,10 @@ class StackedLayout(Layout):
         self.attributes['spacing'] = spacing
 
     def shuffle(self):
+        if not self.widgets:
+            super().shuffle()
+            return
+
         ld = self.widgets[0]
 
         for w in self.widgets:
@@ -342,3 +523,687 @@ class StackedLayout(Layout):
 
         #Rearrange parent layout
         super().shuffle()
+
+
+class AnchoredLayout(Layout):
+    """
+    Layout whose children are placed relative to a fixed origin
+
+    The :class:`.HBoxLayout` and :class:`.VBoxLayout` find their position
+    from the current placement of their children. Layouts that align children
+    within a larger area, e.g a cell of a :class:`.GridLayout`, instead keep
+    the position of their top left corner, taken from the children the first
+    time they are arranged unless set explicitly
+    """
+    def __init__(self, **kwargs):
+        self._origin = None
+        super().__init__(**kwargs)
+
+
+    def anchor(self):
+        """
+        Fix the origin of the layout if it has not yet been set
+
+        Returns
+        -------
+        origin : list
+            Position of the top left corner of the layout
+        """
+        if self._origin is None:
+            self._origin = [self._extent(0), self._extent(1)]
+
+        return self._origin
+
+
+    @property
+    def x(self):
+        if self._origin is None:
+            return 0
+
+        return self._origin[0]
+
+
+    @property
+    def y(self):
+        if self._origin is None:
+            return 0
+
+        return self._origin[1]
+
+
+    @x.setter
+    def x(self, x):
+        if self.widgets and self._origin is not None:
+            shift = x - self.x
+            for w in self.widgets:
+                w.x += shift
+
+        self._origin = [x, self.y]
+
+
+    @y.setter
+    def y(self, y):
+        if self.widgets and self._origin is not None:
+            shift = y - self.y
+            for w in self.widgets:
+                w.y += shift
+
+        self._origin = [self.x, y]
+
+
+GridCell = namedtuple('GridCell', ['row', 'col', 'rowSpan', 'colSpan',
+                                   'alignment'])
+
+
+class GridLayout(AnchoredLayout):
+    """
+    Layout for widgets placed in rows and columns
+
+    The width of each column is that of its widest widget, and the height of
+    each row that of its tallest, so that columns line up across every row.
+    Widgets may span several rows or columns, in which case any size they
+    need beyond the cells they cover is given to the last row or column of
+    the span. All of the sizes are found in a single pass over the cells.
+
+    Each widget is aligned within its cell, either by the :attr:`.alignment`
+    of the layout, or an alignment given for the individual cell. Like the
+    :class:`.StackedLayout`, an alignment may be a list specifying both axes,
+    an axis without an option is centered
+
+    Parameters
+    ----------
+    rows : int, optional
+        Minimum number of rows, the grid grows to hold any widget added
+
+    cols : int, optional
+        Number of columns filled before widgets added without a position
+        wrap to the next row
+
+    Example
+    -------
+    .. code::
+
+        grid = GridLayout(cols=2, spacing=10)
+        grid.addWidget(label, 0, 0)
+        grid.addWidget(button, 0, 1, alignment=AlignmentChoice.Right)
+        grid.addWidget(plot, 1, 0, colSpan=2)
+    """
+    alignment = copy.copy(Layout.alignment)
+    alignment.default = [AlignmentChoice.Left, AlignmentChoice.Top]
+
+    rows = pedlproperty(int, default=0, doc='Minimum number of rows')
+    cols = pedlproperty(int, default=0, doc='Number of columns')
+
+    def __init__(self, rows=0, cols=0, **kwargs):
+        self.cells   = dict()
+        self._last   = None
+        super().__init__(rows=rows, cols=cols, **kwargs)
+
+
+    @alignment.setter
+    def alignment(self, align):
+        align = alignments(align)
+
+        if align != self.attributes.get('alignment'):
+            self.attributes['alignment'] = align
+            self.shuffle()
+
+
+    @rows.callback
+    def rows(self):
+        self.shuffle()
+
+
+    @cols.callback
+    def cols(self):
+        self.shuffle()
+
+
+    @property
+    def rowCount(self):
+        """
+        Number of rows in the grid
+        """
+        return max([self.rows] + [c.row + c.rowSpan
+                                  for c in self.cells.values()])
+
+
+    @property
+    def columnCount(self):
+        """
+        Number of columns in the grid
+        """
+        return max([self.cols] + [c.col + c.colSpan
+                                  for c in self.cells.values()])
+
+
+    def addWidget(self, widget, row=None, col=None, rowSpan=1, colSpan=1,
+                  alignment=None):
+        """
+        Add a Widget to a cell of the grid
+
+        Parameters
+        ----------
+        widget : :class:`.Widget`
+            EDM Widget
+
+        row, col : int, optional
+            Position of the cell. By default, the widget is placed in the
+            cell following the previously added widget
+
+        rowSpan, colSpan : int, optional
+            Number of rows and columns covered by the widget
+
+        alignment : :class:`.AlignmentChoice` or list, optional
+            Alignment within the cell, otherwise the alignment of the layout
+            is used
+        """
+        self._place(widget, row, col, rowSpan, colSpan, alignment)
+        self.insertWidget(self.count, widget)
+
+
+    def addLayout(self, layout, row=None, col=None, rowSpan=1, colSpan=1,
+                  alignment=None):
+        """
+        Add a child layout to a cell of the grid
+
+        See :meth:`.addWidget` for a description of the parameters
+        """
+        self._place(layout, row, col, rowSpan, colSpan, alignment)
+        self.insertLayout(self.count, layout)
+
+
+    def insertWidget(self, index, widget):
+        try:
+            super().insertWidget(index, widget)
+
+        except TypeError:
+            self.cells.pop(widget, None)
+            raise
+
+
+    def insertLayout(self, index, layout):
+        try:
+            super().insertLayout(index, layout)
+
+        except (TypeError, ValueError):
+            self.cells.pop(layout, None)
+            raise
+
+
+    def removeWidget(self, widget):
+        self.cells.pop(widget, None)
+        super().removeWidget(widget)
+
+
+    def _place(self, obj, row, col, rowSpan, colSpan, alignment):
+        """
+        Record the cell of an object
+        """
+        if rowSpan < 1 or colSpan < 1:
+            raise ValueError('Spans must cover at least one cell')
+
+        if row is None or col is None:
+            row, col = self._next()
+
+        if alignment is not None:
+            alignment = alignments(alignment)
+
+        self.cells[obj] = GridCell(row, col, rowSpan, colSpan, alignment)
+        self._last      = self.cells[obj]
+
+
+    def _next(self):
+        """
+        Cell following the previously added widget
+        """
+        if self._last is None:
+            return 0, 0
+
+        row, col = self._last.row, self._last.col + self._last.colSpan
+
+        if self.cols and col >= self.cols:
+            return row + 1, 0
+
+        return row, col
+
+
+    def _tracks(self, start, span, size, count):
+        """
+        Size of each row or column needed to hold the widgets within them
+        """
+        tracks = np.zeros(count, dtype=np.int64)
+        single = span == 1
+        np.maximum.at(tracks, start[single], size[single])
+
+        #Spanning widgets give any extra size to their last row or column
+        for i in np.flatnonzero(~single):
+            first, last = start[i], start[i] + span[i]
+            excess = (size[i] - tracks[first:last].sum()
+                      - self.spacing * (span[i] - 1))
+            if excess > 0:
+                tracks[last - 1] += excess
+
+        return tracks
+
+
+    def _cellPositions(self, start, span, size, count, origin):
+        """
+        Position of each cell along an axis, and the size of the cell
+        """
+        tracks = self._tracks(start, span, size, count)
+        edges  = origin + np.concatenate(([0], np.cumsum(tracks
+                                                         + self.spacing)))
+        last   = start + span - 1
+        return edges[start], edges[last] + tracks[last] - edges[start]
+
+
+    def shuffle(self):
+        if not self.widgets:
+            super().shuffle()
+            return
+
+        #Widgets inserted without a position follow the last placed
+        for widget in self.widgets:
+            if widget not in self.cells:
+                self._place(widget, None, None, 1, 1, None)
+
+        origin = self.anchor()
+
+        cells = [self.cells[w] for w in self.widgets]
+        row, col, rowSpan, colSpan = (np.array(a, dtype=np.int64) for a in
+                                      list(zip(*cells))[:4])
+
+        #Read all of the sizes at once if each child is a simple widget
+        slots = stored(self.widgets)
+
+        if slots is not None:
+            w, h = store.data[2, slots], store.data[3, slots]
+        else:
+            w = np.array([c.w for c in self.widgets], dtype=np.int64)
+            h = np.array([c.h for c in self.widgets], dtype=np.int64)
+
+        cx, cw = self._cellPositions(col, colSpan, w, self.columnCount,
+                                     origin[0])
+        cy, ch = self._cellPositions(row, rowSpan, h, self.rowCount,
+                                     origin[1])
+
+        #Alignment within each cell
+        align  = [c.alignment or self.alignment for c in cells]
+        left   = np.array([AlignmentChoice.Left   in a for a in align])
+        right  = np.array([AlignmentChoice.Right  in a for a in align])
+        top    = np.array([AlignmentChoice.Top    in a for a in align])
+        bottom = np.array([AlignmentChoice.Bottom in a for a in align])
+
+        x = np.select([left, right], [cx, cx + cw - w],
+                      cx + centers(cw) - centers(w))
+        y = np.select([top, bottom], [cy, cy + ch - h],
+                      cy + centers(ch) - centers(h))
+
+        if slots is not None:
+            changed = (store.data[0, slots] != x) | (store.data[1, slots] != y)
+            store.data[0, slots] = x
+            store.data[1, slots] = y
+            notify(self.widgets, changed)
+
+        else:
+            for widget, i, j in zip(self.widgets, x, y):
+                widget.x, widget.y = int(i), int(j)
+
+        #Rearrange parent layout
+        super().shuffle()
+
+
+class BoundedLayout(AnchoredLayout):
+    """
+    Layout that arranges children within a maximum width
+
+    Parameters
+    ----------
+    maxWidth : int, optional
+        Width available to the layout. If not given, the width of the screen
+        the layout is set on is used, less the margins. Until then, the width
+        of a default :class:`.MainWindow` is assumed
+    """
+    maxWidth = pedlproperty(int, doc='Width available to the layout')
+
+    @maxWidth.callback
+    def maxWidth(self):
+        self.shuffle()
+
+
+    @property
+    def width(self):
+        """
+        Width available to the children
+        """
+        if self.maxWidth is not None:
+            return self.maxWidth
+
+        return MainWindow.w.default - 2*MainWindow.margin
+
+
+class FlowLayout(BoundedLayout):
+    """
+    Layout for widgets placed in rows that wrap at a maximum width
+
+    Widgets are placed from left to right, starting a new row whenever the
+    next widget would extend past :attr:`.maxWidth`. This is useful for
+    screens that show a varying number of similar devices. Each row is as
+    tall as its tallest widget, and the :attr:`.alignment` places widgets
+    vertically within their row.
+
+    Adding or removing a widget only rearranges the rows from the one that
+    was changed onwards, stopping as soon as a row begins with the same
+    widget at the same position as before. Changing the size of a widget
+    already within the layout requires a call to :meth:`.shuffle`
+
+    Parameters
+    ----------
+    maxWidth : int, optional
+        Width at which rows wrap. If not given, the width of the screen the
+        layout is set on is used, less the margins. Until then, the width of
+        a default :class:`.MainWindow` is assumed
+    """
+    alignment = copy.copy(Layout.alignment)
+    alignment.default = AlignmentChoice.Top
+
+    def __init__(self, **kwargs):
+        #Index of the first widget in each row and its offset from the top
+        self.starts = list()
+        self.tops   = list()
+        self._edit  = None
+        super().__init__(**kwargs)
+
+
+    @property
+    def rowCount(self):
+        """
+        Number of rows
+        """
+        return len(self.starts)
+
+
+    def insertWidget(self, index, widget):
+        self._edit = (index, 1)
+        super().insertWidget(index, widget)
+
+
+    def insertLayout(self, index, layout):
+        self._edit = (index, 1)
+        super().insertLayout(index, layout)
+
+
+    def removeWidget(self, widget):
+        self._edit = (self.widgets.index(widget), -1)
+        super().removeWidget(widget)
+
+
+    def shuffle(self):
+        edit, self._edit = self._edit, None
+
+        if self.alignment not in (AlignmentChoice.Top,
+                                  AlignmentChoice.Bottom,
+                                  AlignmentChoice.Center):
+            logger.warning('Unsupported alignment {} for FlowLayout'
+                           ''.format(self.alignment))
+
+        if not self.widgets:
+            self.starts, self.tops = list(), list()
+
+        #Only rows following an insertion or removal need to move
+        elif edit and self.starts:
+            index, delta = edit
+            #A change at the start of a row may alter the previous row
+            row  = max(bisect_right(self.starts, index - 1) - 1, 0)
+            tail = dict((start + delta, top) for (start, top)
+                        in zip(self.starts[row+1:], self.tops[row+1:]))
+            self.flow(row, index, tail)
+
+        else:
+            self.flow(0)
+
+        #Rearrange parent layout
+        super().shuffle()
+
+
+    def flow(self, row, edit=0, tail=None):
+        """
+        Place widgets in rows, starting from an existing row
+
+        Parameters
+        ----------
+        row : int
+            Index of the first row to rearrange
+
+        edit : int, optional
+            Index of the first changed widget
+
+        tail : dict, optional
+            Mapping of the first widget of each following row to its
+            previous position. Once a new row matches an entry, the
+            remaining rows are known to be unchanged
+        """
+        left, y = self.anchor()
+        limit   = left + self.width
+        widgets = self.widgets
+        tail    = tail or dict()
+
+        if row:
+            start, top = self.starts[row], self.tops[row]
+        else:
+            start, top = 0, 0
+
+        del self.starts[row:], self.tops[row:]
+
+        while start < len(widgets):
+            #Rows following the change at the same position are unchanged
+            if start > edit and tail.get(start) == top:
+                rows = sorted(item for item in tail.items() if item[0] >= start)
+                self.starts.extend(r[0] for r in rows)
+                self.tops.extend(r[1] for r in rows)
+                return
+
+            #Fill a single row
+            end, right, height = start, left, 0
+            while end < len(widgets):
+                w = widgets[end]
+                if end > start and right + w.w > limit:
+                    break
+                right  += w.w + self.spacing
+                height  = max(height, w.h)
+                end    += 1
+
+            self.place(widgets[start:end], left, y + top, height)
+            self.starts.append(start)
+            self.tops.append(top)
+            start, top = end, top + height + self.spacing
+
+
+    def place(self, widgets, x, y, height):
+        """
+        Place a single row of widgets
+        """
+        for widget in widgets:
+            if self.alignment == AlignmentChoice.Bottom:
+                widget.placeBottom(y + height)
+
+            elif self.alignment == AlignmentChoice.Center:
+                widget.y = y + round(height/2) - round(widget.h/2)
+
+            else:
+                widget.y = y
+
+            widget.x = x
+            x += widget.w + self.spacing
+
+
+class PackedLayout(BoundedLayout):
+    """
+    Layout for widgets of very different sizes packed into a compact area
+
+    Widgets are placed by a skyline bin-packing algorithm. The layout keeps
+    track of the lowest edge of the widgets placed in each span of the
+    :attr:`.maxWidth`, and places each widget where its bottom edge will be
+    highest, preferring the left most position on a tie. Widgets are placed
+    tallest first, with widgets of equal height kept in the order they were
+    added. This aims for the smallest overall height within the given width
+    while keeping similar screens in a predictable order.
+
+    The skyline only holds the distinct edges left by the widgets placed so
+    far. Each widget slides across it once, keeping the highest segment
+    beneath it in a queue, so placing a widget costs time proportional to
+    the number of segments rather than to the segments times the width of
+    the widget. Packing is therefore O(n * segments), which becomes
+    quadratic in the number of widgets when their edges rarely line up.
+    Screens of a few thousand widgets pack in well under a second. The
+    whole arrangement may change with each new widget, so use
+    :meth:`.addWidgets` or :meth:`.addDisplays` to add many widgets with a
+    single rearrangement
+
+    Parameters
+    ----------
+    maxWidth : int, optional
+        Width to pack widgets within. By default the width of the screen as
+        described by :class:`.BoundedLayout`
+    """
+    def addWidgets(self, widgets):
+        """
+        Add several widgets, rearranging the layout once
+
+        Parameters
+        ----------
+        widgets : iterable
+            EDM Widgets
+        """
+        for widget in widgets:
+            if not isinstance(widget, Widget):
+                raise TypeError('Must be an EDM Widget')
+
+            widget.parent = self
+            self.widgets.append(widget)
+
+        self.shuffle()
+
+
+    def addDisplay(self, display, **kwargs):
+        """
+        Add an :class:`.EmbeddedWindow` sized to fit a display
+
+        Parameters
+        ----------
+        display : str or :class:`.Display`
+            Path to the EDL file or complete Display object. The size of the
+            window is read from the screen, so this must be found either as
+            given or along ``EDMDATAFILES``
+
+        kwargs :
+            Other properties of the EmbeddedWindow
+
+        Returns
+        -------
+        window : :class:`.EmbeddedWindow`
+        """
+        return self.addDisplays([display], **kwargs)[0]
+
+
+    def addDisplays(self, displays, **kwargs):
+        """
+        Add an :class:`.EmbeddedWindow` for each of several displays,
+        rearranging the layout once
+
+        See :meth:`.addDisplay` for a description of the parameters
+
+        Returns
+        -------
+        windows : list
+            :class:`.EmbeddedWindow` for each display
+        """
+        from .widgets import EmbeddedWindow
+
+        windows = [EmbeddedWindow(displays=[display], autoscale=True,
+                                  **kwargs) for display in displays]
+        self.addWidgets(windows)
+        return windows
+
+
+    def pack(self, sizes):
+        """
+        Find the position of each widget
+
+        Parameters
+        ----------
+        sizes : list
+            Width and height of each widget
+
+        Returns
+        -------
+        positions : list
+            Offset of each widget from the top left corner of the layout
+        """
+        spacing = self.spacing or 0
+        limit   = max([self.width] + [w for (w, h) in sizes]) + spacing
+
+        #Segments of the skyline, sorted left to right
+        xs, ys, ws = [0], [0], [limit]
+        positions  = [None] * len(sizes)
+        order      = sorted(range(len(sizes)), key=lambda i : -sizes[i][1])
+
+        for i in order:
+            w, h = sizes[i][0] + spacing, sizes[i][1] + spacing
+            best, k, window = None, 0, deque()
+
+            #Slide the span of the widget along the skyline, keeping the
+            #segments beneath it in a queue of decreasing height
+            for j in range(len(xs)):
+                x = xs[j]
+                if x + w > limit:
+                    break
+
+                while k == j or xs[k-1] + ws[k-1] < x + w:
+                    while window and ys[window[-1]] <= ys[k]:
+                        window.pop()
+                    window.append(k)
+                    k += 1
+
+                while window[0] < j:
+                    window.popleft()
+
+                #Lowest point the widget can rest on from this segment
+                y = ys[window[0]]
+                if best is None or y < best[1]:
+                    best = (j, y)
+
+            j, y   = best
+            x, end = xs[j], xs[j] + w
+            positions[i] = (x, y)
+
+            #Replace the covered segments with the new edge, keeping any part
+            #of the last that extends past the widget
+            k     = bisect_left(xs, end)
+            right = xs[k-1] + ws[k-1]
+            if right > end:
+                xs[k-1], ws[k-1] = end, right - end
+                k -= 1
+
+            xs[j:k], ys[j:k], ws[j:k] = [x], [y + h], [w]
+
+            #Merge neighbouring segments at the same height
+            for k in (j, j - 1):
+                if 0 <= k < len(xs) - 1 and ys[k] == ys[k+1]:
+                    ws[k] += ws[k+1]
+                    del xs[k+1], ys[k+1], ws[k+1]
+
+        return positions
+
+
+    def shuffle(self):
+        if self.widgets:
+            left, top = self.anchor()
+            sizes     = [(w.w, w.h) for w in self.widgets]
+
+            for widget, (x, y) in zip(self.widgets, self.pack(sizes)):
+                widget.x, widget.y = left + x, top + y
+
+        #Rearrange parent layout
+        super().shuffle()
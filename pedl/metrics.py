@@ -0,0 +1,182 @@
+"""
+PEDL disables the autosize feature of EDM text widgets so that the size of
+every widget is known when layouts are arranged. Rather than guessing the
+size of each label, or opening the screen in EDM to check, the size of text
+can be calculated from a table of the advance of each character in every
+font EDM uses. The widths of many strings in the same font are found at once
+with :func:`.measure_many`, so thousands of labels can be sized without an X
+server.
+"""
+####################
+# Standard Library #
+####################
+import math
+import logging
+from collections import defaultdict
+
+####################
+#    Third Party   #
+####################
+import numpy as np
+
+####################
+#     Package      #
+####################
+from ._afm import faces
+
+logger = logging.getLogger(__name__)
+
+#Characters outside of the table are measured as this character
+fallback = 'n'
+
+
+def advances(font):
+    """
+    Advance of each character code of a font
+
+    Parameters
+    ----------
+    font : :class:`.Font`
+
+    Returns
+    -------
+    advances : ``numpy.ndarray``
+        Width in pixels of each of the 256 Latin-1 character codes
+    """
+    return _table(font.font.value, font.bold, font.italicized) * font.size
+
+
+def _key(family, bold, italic):
+    return (family, 'bold' if bold else 'medium', 'i' if italic else 'r')
+
+
+_tables = dict()
+
+
+def _table(family, bold, italic):
+    """
+    Advances of a face for a unit font size, created once per face
+    """
+    key = _key(family, bold, italic)
+
+    if key not in _tables:
+        ascender, descender, widths = faces[key]
+        table = np.full(256, widths[ord(fallback) - 32] / 1000.)
+        table[32:127] = np.array(widths) / 1000.
+        table.flags.writeable = False
+        _tables[key] = table
+
+    return _tables[key]
+
+
+def height(font):
+    """
+    Height in pixels of a line of text from the ascender to the descender
+    """
+    ascender, descender, _ = faces[_key(font.font.value, font.bold,
+                                        font.italicized)]
+    return int(math.ceil((ascender - descender) / 1000. * font.size))
+
+
+def measure(text, font):
+    """
+    Size of a string of text
+
+    Parameters
+    ----------
+    text : str
+
+    font : :class:`.Font`
+
+    Returns
+    -------
+    size : tuple
+        Width and height in pixels
+    """
+    return tuple(int(v) for v in measure_many([text], font)[0])
+
+
+def measure_many(strings, font):
+    """
+    Size of many strings of text in the same font
+
+    Every string is encoded into a single buffer and the advances summed
+    with one array operation, rather than character by character
+
+    Parameters
+    ----------
+    strings : list
+        Strings to measure
+
+    font : :class:`.Font`
+
+    Returns
+    -------
+    sizes : ``numpy.ndarray``
+        (N, 2) array of the width and height in pixels of each string
+    """
+    strings = list(strings)
+    sizes   = np.zeros((len(strings), 2), dtype=np.int64)
+
+    if not strings:
+        return sizes
+
+    encoded = [s.encode('latin-1', 'replace') for s in strings]
+    lengths = np.fromiter((len(e) for e in encoded), dtype=np.intp,
+                          count=len(encoded))
+    codes   = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+
+    #Cumulative advance, so the width of each string is a difference
+    total  = np.concatenate(([0.], np.cumsum(advances(font)[codes])))
+    ends   = np.cumsum(lengths)
+    widths = total[ends] - total[ends - lengths]
+
+    sizes[:, 0] = np.ceil(widths - 1e-9)
+    sizes[:, 1] = height(font)
+    return sizes
+
+
+def fit_text(widgets, padding=2, uniform=False):
+    """
+    Size a set of text widgets to fit their text
+
+    Widgets are grouped by font so that each group is measured together
+
+    Parameters
+    ----------
+    widgets : list
+        Widgets with both ``text`` and ``font`` properties
+
+    padding : int, optional
+        Space added to each side of the text
+
+    uniform : bool, optional
+        Give every widget the size of the largest, e.g for a column of labels
+
+    Returns
+    -------
+    sizes : ``numpy.ndarray``
+        (N, 2) array of the new width and height of each widget
+    """
+    groups = defaultdict(list)
+
+    for i, widget in enumerate(widgets):
+        font = widget.font
+        groups[(font.font, font.bold, font.italicized, font.size)].append(i)
+
+    sizes = np.zeros((len(widgets), 2), dtype=np.int64)
+
+    for indices in groups.values():
+        font = widgets[indices[0]].font
+        sizes[indices] = measure_many([widgets[i].text for i in indices],
+                                      font)
+
+    sizes += 2*padding
+
+    if uniform and len(widgets):
+        sizes[:] = sizes.max(axis=0)
+
+    for widget, (w, h) in zip(widgets, sizes):
+        widget.w, widget.h = int(w), int(h)
+
+    return sizes
@@ -0,0 +1,192 @@
+"""
+EDM becomes slow to load and difficult to navigate once a screen holds
+thousands of widgets, and screens larger than the monitor of the operator are
+of little use. Rather than creating one enormous screen, the top-level
+children of a layout can be divided between several pages, each of which fits
+within a maximum size. :meth:`.Designer.paginate` creates a :class:`.Designer`
+for each page, linked to the pages before and after by a bar of
+:class:`.RelatedDisplay` buttons, and :func:`.save_pages` writes them all.
+"""
+####################
+# Standard Library #
+####################
+import copy
+import os.path
+import logging
+
+####################
+#    Third Party   #
+####################
+
+####################
+#     Package      #
+####################
+from .layout  import HBoxLayout, GridLayout
+from .widgets import RelatedDisplay, StaticText, Display
+
+logger = logging.getLogger(__name__)
+
+
+def split(layout, w, h):
+    """
+    Divide the children of a layout between layouts of a maximum size
+
+    Each page is a new layout of the same type and configuration as the
+    original, so that children are arranged the same way on every page. The
+    children of a :class:`.GridLayout` keep their cells, moved up so that
+    each page starts at the first row. Children are given to a page in order
+    until the next would not fit. As a page never shrinks when a child is
+    added, the number that fit is found by bisection, arranging each trial
+    page once rather than after every child. A single child larger than the
+    maximum size is given a page to itself. The children are moved out of
+    the original layout
+
+    Parameters
+    ----------
+    layout : :class:`.Layout`
+        Layout to divide
+
+    w : int
+        Maximum width of each page
+
+    h : int
+        Maximum height of each page
+
+    Returns
+    -------
+    pages : list
+        Layout for each page
+    """
+    children = list(layout.widgets)
+    pages    = list()
+    start    = 0
+
+    def fits(page):
+        return page.w <= w and page.h <= h
+
+    while start < len(children):
+        lo, hi = 1, len(children) - start
+        page   = fill(layout, children[start:start+hi])
+
+        if not fits(page):
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+
+                if fits(fill(layout, children[start:start+mid])):
+                    lo = mid
+
+                else:
+                    hi = mid
+
+            page = fill(layout, children[start:start+lo])
+
+            if not fits(page):
+                logger.warning('{} is larger than a single page'
+                               ''.format(children[start].name))
+
+        pages.append(page)
+        start += page.count
+
+    layout.widgets = list()
+
+    if isinstance(layout, GridLayout):
+        layout.cells, layout._last = dict(), None
+
+    return pages
+
+
+def fill(layout, children):
+    """
+    New layout of the same type and configuration holding some of the
+    children of a layout, arranged once
+    """
+    page = type(layout)(**{attr : copy.copy(value) for (attr, value)
+                           in layout.attributes.items()})
+
+    if isinstance(layout, GridLayout):
+        cells = [layout.cells[child] for child in children]
+        first = min(cell.row for cell in cells)
+        page.cells = dict((child, cell._replace(row=cell.row - first))
+                          for (child, cell) in zip(children, cells))
+        page._last = page.cells[children[-1]]
+
+    for child in children:
+        child.parent = page
+
+    page.widgets.extend(children)
+    page.shuffle()
+    return page
+
+
+def navigation(names, index, w=100, h=25, **kwargs):
+    """
+    Bar of buttons linking a page to those either side of it
+
+    Parameters
+    ----------
+    names : list
+        Filename of every page
+
+    index : int
+        Index of the current page
+
+    w : int, optional
+        Width of each button
+
+    h : int, optional
+        Height of each button
+
+    kwargs :
+        Other properties of the buttons, e.g ``fill``
+
+    Returns
+    -------
+    bar : :class:`.HBoxLayout`
+    """
+    bar = HBoxLayout(alignment='center')
+
+    def button(label, page):
+        name = os.path.splitext(names[page])[0]
+        return RelatedDisplay(label=label, w=w, h=h, closeCurrent=True,
+                              displays=[Display(name, names[page], '')],
+                              **kwargs)
+
+    if index > 0:
+        bar.addWidget(button('< Previous', index - 1))
+
+    bar.addWidget(StaticText(text='Page {} of {}'.format(index + 1,
+                                                         len(names)),
+                             w=w, h=h))
+
+    if index < len(names) - 1:
+        bar.addWidget(button('Next >', index + 1))
+
+    return bar
+
+
+def save_pages(pages, directory='.'):
+    """
+    Write each page to a directory
+
+    Parameters
+    ----------
+    pages : dict
+        Mapping of filename to :class:`.Designer` as returned by
+        :meth:`.Designer.paginate`
+
+    directory : str, optional
+        Location to write the pages
+
+    Returns
+    -------
+    paths : list
+        Path of each file written
+    """
+    paths = list()
+
+    for name, page in pages.items():
+        path = os.path.join(directory, name)
+        page.save(path)
+        paths.append(path)
+
+    return paths
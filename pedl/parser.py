@@ -0,0 +1,181 @@
+"""
+A lightweight reader for existing EDL files. This is not a complete
+implementation of the EDM file format, but it understands enough of the
+structure to recover the screen properties and the properties of each object
+as raw strings. This is used by the tools that need to inspect previously
+written screens without launching EDM.
+"""
+####################
+# Standard Library #
+####################
+import re
+import logging
+from collections import namedtuple, OrderedDict
+
+####################
+#    Third Party   #
+####################
+
+####################
+#     Package      #
+####################
+
+logger = logging.getLogger(__name__)
+
+#Objects within a group are its children
+EdlObject = namedtuple('EdlObject', ['name', 'widgetClass', 'properties',
+                                     'children'], defaults=[()])
+
+#Entries inside a multi-line property may be prefixed by their index
+_entry = re.compile(r'^(\d+)\s+(.*)$')
+
+
+def _unquote(value):
+    """
+    Strip surrounding quotes from a property value
+    """
+    if len(value) > 1 and value[0] == value[-1] == '"':
+        return value[1:-1]
+
+    return value
+
+
+def parse_properties(lines):
+    """
+    Parse the lines between a begin and end properties statement
+
+    Single line properties are stored as a string, flags without a value are
+    stored as ``True`` and bracketed properties are stored as a list of
+    entries.
+
+    Parameters
+    ----------
+    lines : iterable
+        Lines of the property block
+
+    Returns
+    -------
+    properties : OrderedDict
+    """
+    props = OrderedDict()
+    block = None
+
+    for line in lines:
+        line = line.strip()
+
+        if not line:
+            continue
+
+        #Inside a bracketed property
+        if block is not None:
+            if line == '}':
+                block = None
+            else:
+                entry = _entry.match(line)
+                if entry:
+                    line = entry.group(2)
+                block.append(_unquote(line))
+            continue
+
+        key, _, value = line.partition(' ')
+        value = value.strip()
+
+        if value == '{':
+            block = props[key] = list()
+
+        elif value:
+            props[key] = _unquote(value)
+
+        else:
+            props[key] = True
+
+    return props
+
+
+def parse_edl(text):
+    """
+    Parse the text of an EDL file
+
+    Parameters
+    ----------
+    text : str
+        Contents of the EDL file
+
+    Returns
+    -------
+    screen : OrderedDict
+        Screen properties
+
+    objects : list
+        :class:`.EdlObject` for each top-level object in the file. The
+        objects of a group are held as its children, use :func:`.walk` to
+        visit every object
+    """
+    screen  = OrderedDict()
+    lines   = iter(text.splitlines())
+    objects = _objects(lines, None, screen)
+    return screen, objects
+
+
+def walk(objects):
+    """
+    Every object, including those within groups, in file order
+    """
+    for obj in objects:
+        yield obj
+        yield from walk(obj.children)
+
+
+def _objects(lines, stop, screen=None):
+    """
+    Read objects until the stop statement, or the end of the file
+    """
+    objects = list()
+    name    = None
+
+    for line in lines:
+        line = line.strip()
+
+        if line == stop:
+            break
+
+        if line.startswith('# (') and line.endswith(')'):
+            name = line[3:-1]
+
+        elif line == 'beginScreenProperties' and screen is not None:
+            screen.update(parse_properties(_until(lines,
+                                                  'endScreenProperties')))
+
+        elif line.startswith('object '):
+            widgetClass = line.split(None, 1)[1]
+
+            #Find the start of the properties
+            for line in lines:
+                if line.strip() == 'beginObjectProperties':
+                    break
+
+            props, children = list(), list()
+
+            #Properties of a group surround the objects it holds
+            for line in _until(lines, 'endObjectProperties'):
+                if line.strip() == 'beginGroup':
+                    children.extend(_objects(lines, 'endGroup'))
+                else:
+                    props.append(line)
+
+            objects.append(EdlObject(name, widgetClass,
+                                     parse_properties(props),
+                                     tuple(children)))
+            name = None
+
+    return objects
+
+
+def _until(lines, stop):
+    """
+    Iterate through lines until the stop statement
+    """
+    for line in lines:
+        if line.strip() == stop:
+            return
+        yield line
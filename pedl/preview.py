@@ -0,0 +1,198 @@
+"""
+Each call of :meth:`.Designer.exec_` used to write a new temporary file and
+start a new EDM process, so iterating on a screen left a trail of EDM windows
+behind it, and every preview waited for EDM to start. A
+:class:`.PreviewSession` keeps a single temporary file and a single EDM
+process for the lifetime of the :class:`.Designer`. The file is atomically
+replaced with the current screen each time the preview is shown, and when
+EDM runs with ``-oneInst`` the running instance is asked to open the file
+again rather than starting another.
+"""
+####################
+# Standard Library #
+####################
+import os
+import shutil
+import logging
+import tempfile
+import subprocess
+
+####################
+#    Third Party   #
+####################
+
+####################
+#     Package      #
+####################
+from .utils import atomic, command
+
+logger = logging.getLogger(__name__)
+
+
+class PreviewSession:
+    """
+    A reusable EDM preview of a :class:`.Designer`
+
+    Parameters
+    ----------
+    designer : :class:`.Designer`
+        Screen to preview
+
+    wd : str, optional
+        Working directory of EDM, otherwise the current directory is used
+
+    oneInst : bool, optional
+        Run EDM as a single instance, so that the screen is reopened by the
+        running process. Otherwise the process is restarted on each update
+
+    timeout : float, optional
+        Time in seconds to wait for a request to the running instance
+
+    Attributes
+    ----------
+    path : str
+        Location of the preview file, constant for the session
+
+    proc : ``subprocess.Popen``
+        EDM process showing the preview, ``None`` until first shown
+
+    cwd : str
+        Working directory the process was started in
+    """
+    def __init__(self, designer, wd=None, oneInst=True, timeout=10):
+        self.designer  = designer
+        self.wd        = wd
+        self.oneInst   = oneInst
+        self.timeout   = timeout
+        self.directory = tempfile.mkdtemp(prefix='pedl-')
+        self.path      = os.path.join(self.directory, 'preview.edl')
+        self.proc      = None
+        self.macros    = None
+        self.cwd       = None
+
+
+    @property
+    def running(self):
+        """
+        Whether the EDM process is still open
+        """
+        return self.proc is not None and self.proc.poll() is None
+
+
+    @property
+    def options(self):
+        """
+        EDM command line options used by the session
+        """
+        return ('-oneInst',) if self.oneInst else ()
+
+
+    def write(self):
+        """
+        Replace the preview file with the current screen
+        """
+        with atomic(self.path) as handle:
+            self.designer.dump(handle)
+
+
+    def exec_(self, wait=False, **kwargs):
+        """
+        Show the current screen
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Block the main thread while the EDM preview is open
+
+        kwargs :
+            Represent macro substitutions as keyword arguments. The process
+            is restarted if these, or the working directory :attr:`.wd`,
+            differ from those already in use
+
+        Returns
+        -------
+        proc : ``subprocess.Popen``
+            Process showing the preview
+        """
+        self.write()
+
+        if (self.running and self.oneInst and kwargs == self.macros
+                and self.wd == self.cwd):
+            self.reload()
+
+        else:
+            self.terminate()
+            self.start(**kwargs)
+
+        if wait:
+            try:
+                self.proc.wait()
+
+            except KeyboardInterrupt:
+                print('Preview aborted ...')
+                self.proc.terminate()
+
+        return self.proc
+
+
+    def start(self, **kwargs):
+        """
+        Start the EDM process
+        """
+        args = command(self.path, *self.options, **kwargs)
+        logger.debug('Starting preview with the command {}'.format(args))
+
+        try:
+            self.proc = subprocess.Popen(args, cwd=self.wd)
+
+        except OSError:
+            if not shutil.which('edm'):
+                raise OSError('EDM is not in current environment')
+
+            raise
+
+        self.macros = kwargs
+        self.cwd    = self.wd
+
+
+    def reload(self):
+        """
+        Ask the running instance to open the preview file again
+
+        The request is made by a short-lived EDM process, which passes the
+        file to the running instance and exits
+        """
+        args = command(self.path, *self.options, **self.macros)
+        logger.debug('Reloading preview with the command {}'.format(args))
+
+        try:
+            subprocess.run(args, cwd=self.cwd, timeout=self.timeout)
+
+        except subprocess.TimeoutExpired:
+            logger.warning('EDM did not accept the request to reload, '
+                           'restarting the preview ...')
+            self.terminate()
+            self.start(**self.macros)
+
+
+    def terminate(self):
+        """
+        Close the EDM process
+        """
+        if self.running:
+            self.proc.terminate()
+
+            try:
+                self.proc.wait(timeout=self.timeout)
+
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
+
+
+    def close(self):
+        """
+        Close the EDM process and remove the preview file
+        """
+        self.terminate()
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -0,0 +1,372 @@
+"""
+EDM does not take the paths of displays literally, instead each
+``displayFileName`` is searched for in the directories listed by the
+``EDMDATAFILES`` environment variable. The :class:`.PathResolver` mimics this
+behavior, caching the listing of each directory in the search path so that
+each lookup is a dictionary access rather than a series of filesystem calls.
+
+The :class:`.DependencyGraph` uses this resolution to track which screens
+embed or link to one another. This is useful when generating a set of screens
+as those that embed others must be rebuilt after the displays they contain,
+and references to screens that are neither generated nor on disk can be found
+before they are ever opened in EDM.
+"""
+####################
+# Standard Library #
+####################
+import os
+import os.path
+import logging
+from collections import OrderedDict, deque
+
+####################
+#    Third Party   #
+####################
+
+####################
+#     Package      #
+####################
+from .errors  import DesignerError
+from .parser  import parse_edl, walk
+
+logger = logging.getLogger(__name__)
+
+
+class PathResolver:
+    """
+    Locate displays along an EDM search path
+
+    Parameters
+    ----------
+    paths : list or str, optional
+        Directories to search, either as a list or a colon separated string.
+        By default, the ``EDMDATAFILES`` environment variable is used, falling
+        back to the current directory
+
+    Attributes
+    ----------
+    extension : str
+        Extension EDM adds to display names that are given without one
+    """
+    extension = '.edl'
+
+    def __init__(self, paths=None):
+        if paths is None:
+            paths = os.environ.get('EDMDATAFILES') or '.'
+
+        if isinstance(paths, str):
+            paths = paths.split(':')
+
+        self.paths = [os.path.abspath(p or '.') for p in paths]
+        self.refresh()
+
+
+    def refresh(self):
+        """
+        Forget all cached directory listings and resolutions
+        """
+        self._files    = None
+        self._resolved = dict()
+
+
+    @property
+    def files(self):
+        """
+        Mapping of filename to the first matching path along the search path
+        """
+        if self._files is None:
+            self._files = dict()
+            for directory in self.paths:
+                try:
+                    names = os.listdir(directory)
+                except OSError:
+                    logger.debug('Unable to list {}'.format(directory))
+                    continue
+
+                for name in names:
+                    self._files.setdefault(name, os.path.join(directory, name))
+
+        return self._files
+
+
+    def resolve(self, name):
+        """
+        Find the file EDM would open for a display name
+
+        As with EDM, a relative name is looked for within each directory of
+        the search path in order, and is only tried as given, relative to the
+        current directory, if it is not found there. An absolute name is only
+        tried as given. A name without an extension is also tried with
+        :attr:`.extension`
+
+        Parameters
+        ----------
+        name : str
+            Display name as used by ``displayFileName``
+
+        Returns
+        -------
+        path : str or None
+            Location of the display, ``None`` if it can not be found
+        """
+        try:
+            return self._resolved[name]
+
+        except KeyError:
+            pass
+
+        candidates = [name]
+
+        if not os.path.splitext(name)[1]:
+            candidates.append(name + self.extension)
+
+        path = None
+
+        for candidate in candidates:
+            #Simple filenames are found in the directory listings
+            if os.sep not in candidate:
+                path = self.files.get(candidate)
+
+            #Files created since the listing or relative paths are tried
+            #against each directory
+            if path is None and not os.path.isabs(candidate):
+                for directory in self.paths:
+                    full = os.path.join(directory, candidate)
+                    if os.path.isfile(full):
+                        path = full
+                        break
+
+            if path is None and os.path.isfile(candidate):
+                path = candidate
+
+            if path:
+                break
+
+        #Misses are not cached as the display may be written later
+        if path:
+            self._resolved[name] = path
+
+        return path
+
+
+_default = dict()
+
+
+def resolve(name):
+    """
+    Resolve a display name using the current ``EDMDATAFILES``
+
+    The :class:`.PathResolver` for each value of the environment variable is
+    created once and reused.
+    """
+    key = os.environ.get('EDMDATAFILES')
+
+    if key not in _default:
+        _default[key] = PathResolver()
+
+    return _default[key].resolve(name)
+
+
+class DependencyGraph:
+    """
+    Graph of the references between a set of screens
+
+    Screens can be added either as :class:`.Designer` objects that have not
+    yet been written, or as existing EDL files. References are kept as
+    two types of edges, ``embedded`` for the displays within an
+    :class:`.EmbeddedWindow` and ``related`` for those launched by a
+    :class:`.RelatedDisplay`. Only embedded displays affect the content of a
+    screen, so these are the only edges considered when ordering rebuilds.
+
+    Parameters
+    ----------
+    resolver : :class:`.PathResolver`, optional
+        Resolver for references outside of the screen set
+    """
+    kinds = ('embedded', 'related')
+
+    def __init__(self, resolver=None):
+        self.resolver = resolver or PathResolver()
+        self.screens  = OrderedDict()
+        self._names   = dict()
+
+
+    def _add(self, path, references):
+        path = os.path.abspath(path)
+        self.screens[path] = references
+        self._names.setdefault(os.path.basename(path), path)
+        return path
+
+
+    def addDesigner(self, path, designer):
+        """
+        Add a screen that will be generated
+
+        Parameters
+        ----------
+        path : str
+            Location the screen will be written
+
+        designer : :class:`.Designer`
+        """
+        from .widgets import EmbeddedWindow, RelatedDisplay
+
+        references = dict((kind, list()) for kind in self.kinds)
+
+        for widget in designer.findChildren(_type=(EmbeddedWindow,
+                                                   RelatedDisplay)):
+            kind = 'embedded' if isinstance(widget, EmbeddedWindow) \
+                              else 'related'
+            references[kind].extend(d.path for d in widget.displays)
+
+        return self._add(path, references)
+
+
+    def addFile(self, path):
+        """
+        Add an existing EDL file
+
+        Parameters
+        ----------
+        path : str
+            Location of the screen
+        """
+        references = dict((kind, list()) for kind in self.kinds)
+
+        with open(path, 'r') as f:
+            screen, objects = parse_edl(f.read())
+
+        for obj in walk(objects):
+            kind = 'embedded' if obj.widgetClass == 'activePipClass' \
+                              else 'related'
+            references[kind].extend(obj.properties.get('displayFileName', []))
+
+        return self._add(path, references)
+
+
+    def locate(self, name):
+        """
+        Find the screen referred to by a display name
+
+        Screens within the graph take precedence over files found by the
+        resolver, as these may not have been written yet.
+
+        Returns
+        -------
+        path : str or None
+        """
+        path = os.path.abspath(name)
+
+        if path in self.screens:
+            return path
+
+        path = self._names.get(os.path.basename(name))
+
+        if path:
+            return path
+
+        path = self.resolver.resolve(name)
+
+        return path and os.path.abspath(path)
+
+
+    def dependencies(self, screen, kind='embedded'):
+        """
+        Screens directly referenced by a screen
+
+        Parameters
+        ----------
+        screen : str
+            Path of the screen
+
+        kind : str, optional
+            Either ``embedded``, ``related`` or ``None`` for both
+        """
+        kinds = self.kinds if kind is None else (kind,)
+        refs  = self.screens[os.path.abspath(screen)]
+        paths = (self.locate(name) for k in kinds for name in refs[k])
+        return list(OrderedDict.fromkeys(p for p in paths if p))
+
+
+    def dangling(self):
+        """
+        References that can not be resolved
+
+        Returns
+        -------
+        missing : dict
+            Mapping of screen path to the list of display names that were
+            not found either in the graph or along the search path
+        """
+        missing = OrderedDict()
+
+        for screen, refs in self.screens.items():
+            names = [name for kind in self.kinds for name in refs[kind]
+                     if not self.locate(name)]
+            if names:
+                missing[screen] = names
+
+        return missing
+
+
+    def order(self, changed=None):
+        """
+        Order screens so that embedded displays are built first
+
+        Parameters
+        ----------
+        changed : iterable, optional
+            Only return these screens and those that embed them, directly or
+            indirectly. By default, every screen is returned
+
+        Returns
+        -------
+        screens : list
+
+        Raises
+        ------
+        DesignerError:
+            If the screens embed each other in a cycle
+        """
+        #Reverse edges within the graph
+        dependents = dict((screen, list()) for screen in self.screens)
+        degree     = dict.fromkeys(self.screens, 0)
+
+        for screen in self.screens:
+            for dep in self.dependencies(screen):
+                if dep in dependents and dep != screen:
+                    dependents[dep].append(screen)
+                    degree[screen] += 1
+
+        #Kahn's algorithm in insertion order
+        queue = deque(s for (s, d) in degree.items() if not d)
+        order = list()
+
+        while queue:
+            screen = queue.popleft()
+            order.append(screen)
+            for dependent in dependents[screen]:
+                degree[dependent] -= 1
+                if not degree[dependent]:
+                    queue.append(dependent)
+
+        if len(order) != len(self.screens):
+            cycle = [s for (s, d) in degree.items() if d]
+            raise DesignerError('Screens embed each other in a cycle {}'
+                                ''.format(cycle))
+
+        if changed is None:
+            return order
+
+        #Find everything downstream of the changed screens
+        stale = set()
+        queue = deque(os.path.abspath(s) for s in changed)
+
+        while queue:
+            screen = queue.popleft()
+            if screen in stale or screen not in dependents:
+                continue
+            stale.add(screen)
+            queue.extend(dependents[screen])
+
+        return [screen for screen in order if screen in stale]
@@ -0,0 +1,371 @@
+"""
+Synoptic screens show devices joined by pipes and cables. Rather than
+calculating the points of each connecting :class:`.Lines` by hand,
+:meth:`.Designer.connect` finds an orthogonal path between two widgets that
+avoids every other widget on the screen. The screen is divided into a coarse
+grid, cells covered by a widget are marked as blocked, and the path with the
+fewest cells and bends is found with the A* search algorithm. Routes are
+cached by the :class:`.Router` until a widget is moved or added.
+"""
+####################
+# Standard Library #
+####################
+import math
+import heapq
+import logging
+
+####################
+#    Third Party   #
+####################
+import numpy as np
+
+####################
+#     Package      #
+####################
+
+logger = logging.getLogger(__name__)
+
+#Unit steps as (dx, dy) for each direction a path can travel
+steps = ((1, 0), (0, 1), (-1, 0), (0, -1))
+
+
+class Router:
+    """
+    Orthogonal connector routing around a set of widgets
+
+    Parameters
+    ----------
+    w : int
+        Width of the area to route within
+
+    h : int
+        Height of the area to route within
+
+    obstacles : iterable, optional
+        Widgets that routes must avoid
+
+    cell : int, optional
+        Size of each grid cell in pixels. Routes follow the grid lines, so
+        this is also the minimum separation between parallel routes
+
+    clearance : int, optional
+        Minimum distance between a route and any widget
+
+    bend : float, optional
+        Cost of each change of direction, in grid cells
+    """
+    def __init__(self, w, h, obstacles=(), cell=10, clearance=5, bend=3):
+        self.w, self.h  = w, h
+        self.cell       = cell
+        self.clearance  = clearance
+        self.bend       = bend
+        self.obstacles  = list()
+        self.cache      = dict()
+        self._blocked   = None
+        self._flat      = None
+
+        for widget in obstacles:
+            self.add(widget)
+
+
+    def add(self, widget):
+        """
+        Add a widget for routes to avoid
+        """
+        self.obstacles.append(widget)
+        widget.listeners.append(self.invalidate)
+        self.invalidate()
+
+
+    def clear(self):
+        """
+        Remove all obstacles and cached routes
+        """
+        for widget in self.obstacles:
+            widget.listeners.remove(self.invalidate)
+
+        self.obstacles = list()
+        self.invalidate()
+
+
+    def invalidate(self, widget=None):
+        """
+        Forget the grid and all cached routes
+        """
+        self.cache.clear()
+        self._blocked = None
+        self._flat    = None
+
+
+    @property
+    def shape(self):
+        """
+        Number of grid columns and rows
+        """
+        return (self.w // self.cell + 1, self.h // self.cell + 1)
+
+
+    @property
+    def blocked(self):
+        """
+        Boolean (rows, columns) array of the grid points inside an obstacle
+        """
+        if self._blocked is None:
+            cols, rows = self.shape
+            mask = np.zeros((rows, cols), dtype=bool)
+
+            for (x0, y0, x1, y1) in map(self._inflated, self.obstacles):
+                mask[max(self._ceil(y0), 0) : max(self._floor(y1) + 1, 0),
+                     max(self._ceil(x0), 0) : max(self._floor(x1) + 1, 0)] = True
+
+            self._blocked = mask
+
+        return self._blocked
+
+
+    def _inflated(self, widget):
+        c = self.clearance
+        return (widget.x - c, widget.y - c,
+                widget.right + c, widget.bottom + c)
+
+
+    def _ceil(self, v):
+        return int(math.ceil(v / self.cell))
+
+
+    def _floor(self, v):
+        return int(math.floor(v / self.cell))
+
+
+    def port(self, widget, target):
+        """
+        Point on the side of a widget facing a target position
+
+        Returns
+        -------
+        port : tuple
+            Point on the edge of the widget
+
+        direction : int
+            Index of the outward direction within :data:`.steps`
+        """
+        cx, cy = widget.center
+        dx, dy = target[0] - cx, target[1] - cy
+
+        if abs(dx) >= abs(dy):
+            if dx >= 0:
+                return (widget.right, cy), 0
+            return (widget.x, cy), 2
+
+        if dy >= 0:
+            return (cx, widget.bottom), 1
+
+        return (cx, widget.y), 3
+
+
+    def _exit(self, port, direction):
+        """
+        Grid point reached by leaving a port past the clearance
+        """
+        (x, y), (dx, dy) = port, steps[direction]
+        x, y = x + dx*(self.clearance + 1), y + dy*(self.clearance + 1)
+
+        #Snap outwards along the direction of travel
+        col = self._ceil(x) if dx > 0 else self._floor(x) if dx < 0 \
+                                      else int(round(x / self.cell))
+        row = self._ceil(y) if dy > 0 else self._floor(y) if dy < 0 \
+                                      else int(round(y / self.cell))
+        cols, rows = self.shape
+        return min(max(col, 0), cols - 1), min(max(row, 0), rows - 1)
+
+
+    def route(self, a, b):
+        """
+        Orthogonal path between two widgets
+
+        The path leaves each widget from the middle of the side facing the
+        other, and is cached until an obstacle changes
+
+        Parameters
+        ----------
+        a : :class:`.Widget`
+            Start of the route
+
+        b : :class:`.Widget`
+            End of the route
+
+        Returns
+        -------
+        points : ``numpy.ndarray``
+            (N, 2) array of the corners of the route
+        """
+        key = (a.geometry, b.geometry)
+
+        if key not in self.cache:
+            self.cache[key] = self._route(a, b)
+
+        return self.cache[key]
+
+
+    def _route(self, a, b):
+        start, out = self.port(a, b.center)
+        end,   into = self.port(b, a.center)
+        first, last = self._exit(start, out), self._exit(end, into)
+
+        path = self.search(first, last)
+
+        if path is None:
+            logger.warning('Unable to route around obstacles from {} to {}'
+                           ''.format(a.name, b.name))
+            points = [start, end]
+
+        else:
+            grid   = [(c*self.cell, r*self.cell) for (c, r) in path]
+            points = ([start, self._stub(start, out, grid[0])] + grid
+                      + [self._stub(end, into, grid[-1]), end])
+
+        return orthogonal(points)
+
+
+    def _stub(self, port, direction, point):
+        """
+        Point straight out from a port, level with a grid point
+        """
+        if steps[direction][0]:
+            return (point[0], port[1])
+
+        return (port[0], point[1])
+
+
+    def search(self, start, goal):
+        """
+        A* search for the cheapest path between two grid points
+
+        Parameters
+        ----------
+        start : tuple
+            Column and row of the first grid point
+
+        goal : tuple
+            Column and row of the final grid point
+
+        Returns
+        -------
+        path : list or None
+            Column and row of each grid point along the path, ``None`` if
+            the goal can not be reached
+        """
+        cols, rows = self.shape
+        source     = start[1]*cols + start[0]
+        target     = goal[1]*cols + goal[0]
+        gx, gy     = goal
+
+        #Flat list of the grid for quick lookup
+        if self._flat is None:
+            self._flat = self.blocked.ravel().tolist()
+
+        blocked = self._flat
+
+        #Distance to the goal, with a bend if it is not in line
+        def estimate(x, y):
+            return (abs(x - gx) + abs(y - gy)
+                    + (self.bend if x != gx and y != gy else 0))
+
+        #States are a grid point and the direction used to reach it. Ties
+        #are broken towards the goal, to search along one of the many paths
+        #of equal cost rather than all of them
+        offsets = [(dx, dy, dy*cols + dx) for (dx, dy) in steps]
+        bend    = self.bend
+        h       = estimate(*start)
+        cost    = {(source, -1) : 0}
+        parent  = dict()
+        heap    = [(h, h, 0, source, -1)]
+
+        while heap:
+            f, h, g, node, d = heapq.heappop(heap)
+
+            if node == target:
+                path = [node]
+                state = (node, d)
+                while state in parent:
+                    state = parent[state]
+                    path.append(state[0])
+                return [(n % cols, n // cols) for n in reversed(path)]
+
+            if g > cost[(node, d)]:
+                continue
+
+            x, y = node % cols, node // cols
+
+            for nd, (dx, dy, offset) in enumerate(offsets):
+                nx, ny = x + dx, y + dy
+
+                #Never turn back on the path
+                if (d - nd) % 4 == 2 and d >= 0:
+                    continue
+
+                if not (0 <= nx < cols and 0 <= ny < rows):
+                    continue
+
+                neighbor = node + offset
+
+                #Ends of each route lie next to the widgets they connect
+                if blocked[neighbor] and neighbor != target:
+                    continue
+
+                ng = g + 1 + (bend if d >= 0 and nd != d else 0)
+                state = (neighbor, nd)
+
+                if ng < cost.get(state, ng + 1):
+                    cost[state]   = ng
+                    parent[state] = (node, d)
+                    nh = abs(nx - gx) + abs(ny - gy)
+                    if nx != gx and ny != gy:
+                        nh += bend
+                    heapq.heappush(heap, (ng + nh, nh, ng, neighbor, nd))
+
+        return None
+
+
+def orthogonal(points):
+    """
+    Make a path orthogonal and keep only its corners
+
+    A corner is inserted between consecutive points that differ in both
+    coordinates, then repeated points and points in the middle of a straight
+    segment are removed
+
+    Parameters
+    ----------
+    points : list
+        Points as (x, y) tuples
+
+    Returns
+    -------
+    points : ``numpy.ndarray``
+        (N, 2) integer array
+    """
+    path = [tuple(points[0])]
+
+    for (x, y) in points[1:]:
+        px, py = path[-1]
+        if px != x and py != y:
+            path.append((x, py))
+        path.append((x, y))
+
+    corners = [path[0]]
+
+    for point in path[1:]:
+        if point == corners[-1]:
+            continue
+
+        #Extend a straight segment rather than adding a point
+        if len(corners) > 1:
+            (ax, ay), (bx, by) = corners[-2], corners[-1]
+            if (ax == bx == point[0]) or (ay == by == point[1]):
+                corners[-1] = point
+                continue
+
+        corners.append(point)
+
+    return np.array(corners, dtype=int).reshape(-1, 2)
@@ -0,0 +1,345 @@
+"""
+Screens accumulate quickly, and answering which of them reference a given PV,
+embed a given display or use a given color by searching the raw text is slow.
+The :class:`.ScreenDatabase` walks a directory tree, parses each screen in a
+pool of processes and stores a summary of each file in SQLite. Subsequent
+scans only reparse files whose modification time has changed, and queries
+are answered from indexed tables.
+
+Example
+-------
+.. code::
+
+    db = ScreenDatabase('screens.db')
+    db.update('/path/to/screens')
+    db.screensWithPv('TST:PV')
+"""
+####################
+# Standard Library #
+####################
+import os
+import fnmatch
+import sqlite3
+import logging
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+####################
+#    Third Party   #
+####################
+
+####################
+#     Package      #
+####################
+from .parser import parse_edl, walk
+
+logger = logging.getLogger(__name__)
+
+_schema = """
+CREATE TABLE IF NOT EXISTS screens (
+    id     INTEGER PRIMARY KEY,
+    path   TEXT UNIQUE NOT NULL,
+    mtime  INTEGER NOT NULL,
+    size   INTEGER NOT NULL,
+    w      INTEGER,
+    h      INTEGER
+);
+CREATE TABLE IF NOT EXISTS objects (
+    screen INTEGER NOT NULL REFERENCES screens(id) ON DELETE CASCADE,
+    class  TEXT NOT NULL,
+    count  INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pvs (
+    screen   INTEGER NOT NULL REFERENCES screens(id) ON DELETE CASCADE,
+    property TEXT NOT NULL,
+    pv       TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS displays (
+    screen INTEGER NOT NULL REFERENCES screens(id) ON DELETE CASCADE,
+    path   TEXT NOT NULL,
+    name   TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS colors (
+    screen   INTEGER NOT NULL REFERENCES screens(id) ON DELETE CASCADE,
+    property TEXT NOT NULL,
+    color    INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS objects_class ON objects(class);
+CREATE INDEX IF NOT EXISTS pvs_pv        ON pvs(pv);
+CREATE INDEX IF NOT EXISTS displays_path ON displays(path);
+CREATE INDEX IF NOT EXISTS displays_name ON displays(name);
+CREATE INDEX IF NOT EXISTS colors_color  ON colors(color);
+CREATE INDEX IF NOT EXISTS objects_screen  ON objects(screen);
+CREATE INDEX IF NOT EXISTS pvs_screen      ON pvs(screen);
+CREATE INDEX IF NOT EXISTS displays_screen ON displays(screen);
+CREATE INDEX IF NOT EXISTS colors_screen   ON colors(screen);
+"""
+
+
+def summarize(path):
+    """
+    Summarize the contents of a single EDL file
+
+    Parameters
+    ----------
+    path : str
+        Path to the EDL file
+
+    Returns
+    -------
+    summary : dict
+        Dimensions, object counts per class, PVs, referenced displays and
+        colors of the screen. ``None`` if the file can not be read
+    """
+    try:
+        with open(path, 'r', errors='replace') as f:
+            screen, objects = parse_edl(f.read())
+
+        #Objects within groups are counted alongside the others
+        objects = list(walk(objects))
+
+    except OSError as e:
+        logger.warning('Unable to read {}, {}'.format(path, e))
+        return None
+
+    pvs, displays, colors = set(), set(), set()
+
+    for obj in objects:
+        for key, value in obj.properties.items():
+
+            if key.lower().endswith('pv') and isinstance(value, str):
+                pvs.add((key, value))
+
+            elif key == 'displayFileName' and isinstance(value, list):
+                displays.update(value)
+
+            elif isinstance(value, str) and value.startswith('index '):
+                try:
+                    colors.add((key, int(value.split()[1])))
+                except ValueError:
+                    pass
+
+    def dimension(key):
+        try:
+            return int(screen[key])
+        except (KeyError, ValueError):
+            return None
+
+    return {'w'        : dimension('w'),
+            'h'        : dimension('h'),
+            'objects'  : Counter(obj.widgetClass for obj in objects),
+            'pvs'      : sorted(pvs),
+            'displays' : sorted(displays),
+            'colors'   : sorted(colors)}
+
+
+class ScreenDatabase:
+    """
+    SQLite index of a collection of EDL files
+
+    Parameters
+    ----------
+    path : str, optional
+        Location of the database, by default it is held in memory
+
+    Attributes
+    ----------
+    pattern : str
+        Glob pattern used to select screens when walking a directory
+
+    chunksize : int
+        Number of files handed to a worker process at once
+    """
+    pattern   = '*.edl'
+    chunksize = 16
+
+    def __init__(self, path=':memory:'):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        self.conn.executescript(_schema)
+
+
+    def walk(self, root):
+        """
+        All of the screens within a directory tree
+        """
+        for dirpath, dirnames, filenames in os.walk(root):
+            for filename in fnmatch.filter(filenames, self.pattern):
+                yield os.path.join(dirpath, filename)
+
+
+    def update(self, root, workers=None):
+        """
+        Scan a directory tree
+
+        Only screens that are new or have a different modification time than
+        the last scan are parsed. Screens that no longer exist beneath the
+        root are removed from the database.
+
+        Parameters
+        ----------
+        root : str
+            Directory to search for screens
+
+        workers : int, optional
+            Number of processes used to parse screens, by default the number
+            of processors on the machine. A value of 1 parses in the current
+            process
+
+        Returns
+        -------
+        changed : list
+            Paths of the screens that were parsed
+        """
+        root  = os.path.abspath(root)
+        known = dict(self.conn.execute('SELECT path, mtime FROM screens'))
+        stale = list()
+        found = set()
+
+        for path in self.walk(root):
+            try:
+                info = os.stat(path)
+            except OSError:
+                continue
+
+            found.add(path)
+
+            if known.get(path) != info.st_mtime_ns:
+                stale.append((path, info))
+
+        #Parse modified screens
+        paths = [path for (path, info) in stale]
+
+        if workers == 1 or len(paths) < 2:
+            summaries = [summarize(path) for path in paths]
+
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                summaries = list(executor.map(summarize, paths,
+                                              chunksize=self.chunksize))
+
+        with self.conn:
+            for (path, info), summary in zip(stale, summaries):
+                self._store(path, info, summary)
+
+            #Remove deleted screens
+            for path in known:
+                if path not in found and path.startswith(root + os.sep):
+                    self.conn.execute('DELETE FROM screens WHERE path=?',
+                                      (path,))
+
+        logger.info('Parsed {} of {} screens beneath {}'
+                    ''.format(len(paths), len(found), root))
+        return paths
+
+
+    def _store(self, path, info, summary):
+        """
+        Replace the record of a single screen
+        """
+        self.conn.execute('DELETE FROM screens WHERE path=?', (path,))
+
+        if summary is None:
+            return
+
+        cursor = self.conn.execute('INSERT INTO screens (path, mtime, size, w, h)'
+                                   ' VALUES (?, ?, ?, ?, ?)',
+                                   (path, info.st_mtime_ns, info.st_size,
+                                    summary['w'], summary['h']))
+        screen = cursor.lastrowid
+
+        self.conn.executemany('INSERT INTO objects VALUES (?, ?, ?)',
+                              [(screen, cls, count) for (cls, count)
+                               in summary['objects'].items()])
+        self.conn.executemany('INSERT INTO pvs VALUES (?, ?, ?)',
+                              [(screen, key, pv) for (key, pv)
+                               in summary['pvs']])
+        self.conn.executemany('INSERT INTO displays VALUES (?, ?, ?)',
+                              [(screen, display, os.path.basename(display))
+                               for display in summary['displays']])
+        self.conn.executemany('INSERT INTO colors VALUES (?, ?, ?)',
+                              [(screen, key, color) for (key, color)
+                               in summary['colors']])
+
+
+    def _screens(self, query, *args):
+        """
+        Sorted unique screen paths from a query
+        """
+        return [row[0] for row in self.conn.execute(query, args)]
+
+
+    @property
+    def screens(self):
+        """
+        Paths of all indexed screens
+        """
+        return self._screens('SELECT path FROM screens ORDER BY path')
+
+
+    def screensWithPv(self, pv, property=None):
+        """
+        Screens that reference a PV
+
+        Parameters
+        ----------
+        pv : str
+            Name of the PV
+
+        property : str, optional
+            Limit the search to a single property e.g ``controlPv``
+        """
+        query = ('SELECT DISTINCT s.path FROM screens s '
+                 'JOIN pvs p ON p.screen = s.id WHERE p.pv = ?')
+
+        if property:
+            return self._screens(query + ' AND p.property = ? ORDER BY s.path',
+                                 pv, property)
+
+        return self._screens(query + ' ORDER BY s.path', pv)
+
+
+    def screensWithDisplay(self, display):
+        """
+        Screens that embed or link to a display
+
+        Parameters
+        ----------
+        display : str
+            Either the path as written in the screen, or just the filename
+        """
+        return self._screens('SELECT DISTINCT s.path FROM screens s '
+                             'JOIN displays d ON d.screen = s.id '
+                             'WHERE d.path = ? OR d.name = ? ORDER BY s.path',
+                             display, display)
+
+
+    def screensWithColor(self, color):
+        """
+        Screens that use a color index
+
+        Parameters
+        ----------
+        color : int or :class:`.ColorChoice`
+        """
+        color = getattr(color, 'value', color)
+        return self._screens('SELECT DISTINCT s.path FROM screens s '
+                             'JOIN colors c ON c.screen = s.id '
+                             'WHERE c.color = ? ORDER BY s.path', int(color))
+
+
+    def screensWithClass(self, widgetClass):
+        """
+        Screens that contain at least one object of a widget class
+        """
+        return self._screens('SELECT DISTINCT s.path FROM screens s '
+                             'JOIN objects o ON o.screen = s.id '
+                             'WHERE o.class = ? ORDER BY s.path', widgetClass)
+
+
+    def close(self):
+        """
+        Close the connection to the database
+        """
+        self.conn.close()
@@ -0,0 +1,276 @@
+"""
+Generated screens can easily end up with widgets accidentally placed on top
+of one another, and comparing every pair of widgets quickly becomes too slow
+for large screens. The :class:`.SpatialIndex` buckets each widget into the
+cells of a uniform grid so that point, region and overlap queries only have
+to consider widgets that share a cell. The index listens for geometry changes
+on each widget, so it stays current as widgets are moved or resized.
+"""
+####################
+# Standard Library #
+####################
+import logging
+from itertools import combinations
+from collections import defaultdict, OrderedDict
+
+####################
+#    Third Party   #
+####################
+
+####################
+#     Package      #
+####################
+
+logger = logging.getLogger(__name__)
+
+
+class SpatialIndex:
+    """
+    Uniform grid of widget bounding boxes
+
+    Parameters
+    ----------
+    widgets : iterable, optional
+        Initial widgets to index
+
+    cell : int, optional
+        Size of each grid cell in pixels. This should be roughly the size of
+        a typical widget
+    """
+    def __init__(self, widgets=(), cell=64):
+        self.cell    = cell
+        self.cells   = defaultdict(set)
+        self.bounds  = OrderedDict()
+        self.order   = dict()
+        self._count  = 0
+
+        for widget in widgets:
+            self.insert(widget)
+
+
+    def _box(self, widget):
+        return (widget.x, widget.y, widget.right, widget.bottom)
+
+
+    def _span(self, box):
+        """
+        Range of cells covered by a bounding box
+        """
+        c = self.cell
+        return (range(box[0]//c, box[2]//c + 1),
+                range(box[1]//c, box[3]//c + 1))
+
+
+    def _cells(self, box):
+        cols, rows = self._span(box)
+        return ((i, j) for i in cols for j in rows)
+
+
+    def insert(self, widget):
+        """
+        Add a widget to the index
+        """
+        if widget in self.bounds:
+            return
+
+        box = self._box(widget)
+        self.bounds[widget] = box
+        self.order[widget]  = self._count
+        self._count += 1
+
+        for key in self._cells(box):
+            self.cells[key].add(widget)
+
+        widget.listeners.append(self.update)
+
+
+    def remove(self, widget):
+        """
+        Remove a widget from the index
+        """
+        box = self.bounds.pop(widget)
+        del self.order[widget]
+
+        for key in self._cells(box):
+            bucket = self.cells[key]
+            bucket.discard(widget)
+            if not bucket:
+                del self.cells[key]
+
+        widget.listeners.remove(self.update)
+
+
+    def update(self, widget):
+        """
+        Move a widget to the cells covered by its current geometry
+        """
+        old = self.bounds[widget]
+        new = self._box(widget)
+
+        if old == new:
+            return
+
+        self.bounds[widget] = new
+        previous, current = set(self._cells(old)), set(self._cells(new))
+
+        for key in previous - current:
+            bucket = self.cells[key]
+            bucket.discard(widget)
+            if not bucket:
+                del self.cells[key]
+
+        for key in current - previous:
+            self.cells[key].add(widget)
+
+
+    def clear(self):
+        """
+        Remove all widgets from the index
+        """
+        for widget in list(self.bounds):
+            self.remove(widget)
+
+
+    def at(self, x, y):
+        """
+        Widgets that contain a point
+
+        Returns
+        -------
+        widgets : list
+            Matching widgets in the order they were indexed
+        """
+        bucket = self.cells.get((x//self.cell, y//self.cell), ())
+        found  = set()
+
+        for widget in bucket:
+            x0, y0, x1, y1 = self.bounds[widget]
+            if x0 <= x <= x1 and y0 <= y <= y1:
+                found.add(widget)
+
+        return self._sorted(found)
+
+
+    def within(self, rect, contained=False):
+        """
+        Widgets that intersect a rectangle
+
+        Parameters
+        ----------
+        rect : tuple
+            Region as (x, y, w, h)
+
+        contained : bool, optional
+            Only return widgets that lie entirely within the region
+
+        Returns
+        -------
+        widgets : list
+            Matching widgets in the order they were indexed
+        """
+        x, y, w, h = rect
+        box   = (x, y, x + w, y + h)
+        found = set()
+
+        for key in self._cells(box):
+            for widget in self.cells.get(key, ()):
+                x0, y0, x1, y1 = self.bounds[widget]
+
+                if contained:
+                    match = (x0 >= box[0] and y0 >= box[1]
+                             and x1 <= box[2] and y1 <= box[3])
+                else:
+                    match = (x0 <= box[2] and box[0] <= x1
+                             and y0 <= box[3] and box[1] <= y1)
+
+                if match:
+                    found.add(widget)
+
+        return self._sorted(found)
+
+
+    def overlaps(self, exclude=None):
+        """
+        Pairs of widgets whose areas overlap
+
+        Widgets that only share an edge are not considered overlapping
+
+        Parameters
+        ----------
+        exclude : type, optional
+            Layout type, pairs of widgets that are both members of the same
+            instance of this layout are ignored, e.g :class:`.StackedLayout`
+
+        Returns
+        -------
+        pairs : list
+            Tuples of overlapping widgets
+        """
+        order = self.order
+        seen  = set()
+        pairs = list()
+        group = dict()
+
+        def ancestors(widget):
+            if widget not in group:
+                parents, parent = set(), widget.parent
+                while parent is not None and exclude:
+                    if isinstance(parent, exclude):
+                        parents.add(id(parent))
+                    parent = getattr(parent, 'parent', None)
+                group[widget] = parents
+            return group[widget]
+
+        for bucket in self.cells.values():
+            if len(bucket) < 2:
+                continue
+
+            for a, b in combinations(sorted(bucket, key=order.get), 2):
+                if (a, b) in seen:
+                    continue
+
+                seen.add((a, b))
+                ax0, ay0, ax1, ay1 = self.bounds[a]
+                bx0, by0, bx1, by1 = self.bounds[b]
+
+                if not (ax0 < bx1 and bx0 < ax1 and ay0 < by1 and by0 < ay1):
+                    continue
+
+                if exclude and ancestors(a) & ancestors(b):
+                    continue
+
+                pairs.append((a, b))
+
+        return sorted(pairs, key=lambda p : (order[p[0]], order[p[1]]))
+
+
+    def duplicates(self):
+        """
+        Groups of widgets of the same type with identical geometry
+
+        Returns
+        -------
+        groups : list
+            Lists of duplicated widgets
+        """
+        groups = OrderedDict()
+
+        for widget, box in self.bounds.items():
+            groups.setdefault((type(widget), box), list()).append(widget)
+
+        return [g for g in groups.values() if len(g) > 1]
+
+
+    def _sorted(self, widgets):
+        """
+        Widgets sorted by the order in which they were indexed
+        """
+        return sorted(widgets, key=self.order.get)
+
+
+    def __contains__(self, widget):
+        return widget in self.bounds
+
+
+    def __len__(self):
+        return len(self.bounds)
@@ -0,0 +1,379 @@
+"""
+Standard device panels are easier to describe as data than as code. A screen
+specification is a JSON or YAML document naming the class and properties of
+each object, with layouts holding their children:
+
+.. code:: json
+
+    {"window"  : {"name" : "Valve", "background" : "Grey"},
+     "layout"  : {"type" : "VBoxLayout", "spacing" : 4,
+                  "children" : [{"type" : "StaticText", "text" : "VGC:01",
+                                 "w" : 100, "h" : 20},
+                                {"type" : "Rectangle", "w" : 100, "h" : 50,
+                                 "fill" : "Green"}]}}
+
+The top level may also hold ``template_dir``, a list of ``widgets`` placed at
+their own positions, and ``resize`` to control whether the window is fitted
+to the layout. Choices are given by either their name or value, fonts and
+visibility settings as objects of their keyword arguments, displays as paths
+or objects of ``name``, ``path`` and ``macros``, and the children of a
+:class:`.GridLayout` may hold ``row``, ``col``, ``rowSpan`` and ``colSpan``.
+
+Documents describing thousands of panels repeat the same few combinations
+of class and properties. Each combination is compiled once into a
+:class:`.Plan`, which records how every property is converted and stored. For
+widgets without their own constructor, properties are written directly into
+the attributes of the widget and the :class:`.GeometryStore`, rather than
+through the descriptor of each property.
+"""
+####################
+# Standard Library #
+####################
+import copy
+import json
+import os.path
+import inspect
+import logging
+from enum import Enum
+
+####################
+#    Third Party   #
+####################
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+####################
+#     Package      #
+####################
+from .widget   import PedlObject, MainWindow
+from .layout   import (Layout, HBoxLayout, VBoxLayout, StackedLayout,
+                       GridLayout, FlowLayout, PackedLayout)
+from .geometry import store, geometryproperty
+from .utils    import pedlproperty
+from .designer import Designer
+from .widgets  import (StaticText, Shape, GateValve, Stopper, Camera,
+                       Rectangle, Circle, MessageButton, MenuButton,
+                       RelatedDisplay, ShellCommand, EmbeddedWindow, Display)
+from .widgets.button import Command
+from .widgets.shape  import Lines
+
+logger = logging.getLogger(__name__)
+
+#Classes that can be named by the type of a specification
+types = {cls.__name__: cls for cls in
+         (StaticText, Shape, Lines, GateValve, Stopper, Camera, Rectangle,
+          Circle, MessageButton, MenuButton, RelatedDisplay, ShellCommand,
+          EmbeddedWindow, HBoxLayout, VBoxLayout, StackedLayout, GridLayout,
+          FlowLayout, PackedLayout)}
+
+#Property defaults that are shared rather than copied
+immutable = (type(None), bool, int, float, str, tuple, Enum)
+
+#Keys describing the position of a child within a GridLayout
+cell = ('row', 'col', 'rowSpan', 'colSpan')
+
+
+def display(value):
+    """
+    Convert a path or mapping into a :class:`.Display`
+    """
+    if isinstance(value, dict):
+        return Display(value['name'], value['path'], value.get('macros'))
+
+    return Display.from_edl(value)
+
+
+#Conversion of properties holding lists of other objects
+converters = {'displays': lambda v: [d if isinstance(d, Display)
+                                     else display(d) for d in v],
+              'commands': lambda v: [Command(*c) for c in v]}
+
+
+def coercer(prop):
+    """
+    Function converting a specification value into a property value
+
+    Choices are found by either name or value
+    """
+    _type = prop.type
+
+    if isinstance(_type, type) and issubclass(_type, Enum):
+        lookup = {m.name: m for m in _type}
+        lookup.update((m.value, m) for m in _type)
+
+        def choice(value):
+            try:
+                return lookup[value]
+            except (KeyError, TypeError):
+                return _type(value)
+
+        return choice
+
+    return _type
+
+
+class Plan:
+    """
+    Compiled constructor for one class and set of properties
+
+    Parameters
+    ----------
+    cls : type
+        Class of the object
+
+    keys : tuple
+        Properties given by the specification, in order
+
+    Attributes
+    ----------
+    init : list
+        Keyword arguments passed to the constructor, with their conversion
+
+    fast : list
+        Properties written directly into :attr:`.PedlObject.attributes`,
+        with their conversion
+
+    axes : list
+        Rows of the :class:`.GeometryStore` written directly
+
+    geometry : list
+        Keys holding the value of each of :attr:`.axes`
+
+    Raises
+    ------
+    ValueError:
+        If a key is not a property of the class
+    """
+    def __init__(self, cls, keys):
+        self.cls      = cls
+        self.keys     = keys
+        self.init     = list()
+        self.fast     = list()
+        self.axes     = list()
+        self.geometry = list()
+
+        #Properties can only bypass the class when it has no constructor of
+        #its own that depends on them
+        self.direct = direct = (cls.__init__ is PedlObject.__init__
+                                and cls._stored)
+        params = set(inspect.signature(cls.__init__).parameters)
+
+        #Default values of every property, only those that can be modified
+        #in place are copied for each object
+        self.static  = dict()
+        self.mutable = list()
+        self.vector  = [0] * len(store.axes)
+
+        for attr, prop in cls._pedl.items():
+            if isinstance(prop, geometryproperty):
+                self.vector[prop.axis] = prop.default
+
+            elif isinstance(prop.default, immutable):
+                self.static[attr] = prop.default
+
+            else:
+                self.mutable.append((attr, prop.default))
+
+        for key in keys:
+            prop = cls._pedl.get(key)
+
+            if prop is None and not (hasattr(cls, key) or key in params
+                                     or key == 'name'):
+                raise ValueError('{} has no property {}'
+                                 ''.format(cls.__name__, key))
+
+            if direct and key == 'name':
+                continue
+
+            if direct and isinstance(prop, geometryproperty):
+                self.axes.append(prop.axis)
+                self.geometry.append(key)
+
+            elif (direct and isinstance(prop, pedlproperty)
+                  and not (prop.fset or prop.cb) and key not in converters):
+                self.fast.append((key, coercer(prop)))
+
+            elif key in converters:
+                self.init.append((key, converters[key]))
+
+            #Custom setters convert their own values
+            elif (isinstance(prop, pedlproperty) and prop.type is not None
+                  and not prop.fset):
+                self.init.append((key, coercer(prop)))
+
+            else:
+                self.init.append((key, None))
+
+
+    def create(self, spec):
+        """
+        Create an object from a specification matching the plan
+        """
+        if not self.direct:
+            kwargs = {key: spec[key] if conv is None or spec[key] is None
+                           else conv(spec[key])
+                      for (key, conv) in self.init}
+            return self.cls(**kwargs)
+
+        #Equivalent to PedlObject.__init__ without a descriptor per property
+        obj = self.cls.__new__(self.cls)
+        obj.name      = spec.get('name') or self.cls.widgetClass
+        obj.parent    = None
+        obj.listeners = list()
+        obj._slot     = store.allocate()
+
+        attrs = dict(self.static)
+        for attr, default in self.mutable:
+            attrs[attr] = copy.copy(default)
+
+        for key, conv in self.fast:
+            value = spec[key]
+            attrs[key] = None if value is None else conv(value)
+
+        obj.attributes = attrs
+
+        vector = list(self.vector)
+        for axis, key in zip(self.axes, self.geometry):
+            vector[axis] = spec[key]
+
+        store.data[:, obj._slot] = vector
+        return obj
+
+
+#Compiled plans by class name and keys
+plans = dict()
+
+
+def plan(name, keys):
+    """
+    Compiled :class:`.Plan` for a class name and properties, created once
+    """
+    try:
+        return plans[(name, keys)]
+
+    except KeyError:
+        pass
+
+    try:
+        cls = types[name]
+
+    except KeyError:
+        raise ValueError('Unknown type {}'.format(name))
+
+    plans[(name, keys)] = Plan(cls, keys)
+    return plans[(name, keys)]
+
+
+def create(spec):
+    """
+    Create a widget or layout from a specification
+
+    Parameters
+    ----------
+    spec : dict
+        Specification with a ``type`` key naming the class
+
+    Returns
+    -------
+    obj : :class:`.Widget` or :class:`.Layout`
+    """
+    keys = tuple(k for k in spec
+                 if k not in ('type', 'children') and k not in cell)
+    obj  = plan(spec.get('type'), keys).create(spec)
+
+    if isinstance(obj, Layout):
+        for child in spec.get('children', ()):
+            add(obj, create(child), child)
+
+    return obj
+
+
+def add(layout, obj, spec):
+    """
+    Add a created object to a layout, in the cell given by its specification
+    """
+    kwargs = dict()
+
+    if isinstance(layout, GridLayout):
+        kwargs = {k: spec[k] for k in cell if k in spec}
+
+    if isinstance(obj, Layout):
+        layout.addLayout(obj, **kwargs)
+
+    else:
+        layout.addWidget(obj, **kwargs)
+
+
+def build(spec):
+    """
+    Create a :class:`.Designer` from a screen specification
+
+    Parameters
+    ----------
+    spec : dict
+
+    Returns
+    -------
+    designer : :class:`.Designer`
+    """
+    d = Designer(template_dir=spec.get('template_dir'))
+
+    for key, value in spec.get('window', {}).items():
+        if key not in MainWindow._pedl and key != 'name':
+            raise ValueError('MainWindow has no property {}'.format(key))
+
+        setattr(d.window, key, value if key not in MainWindow._pedl
+                          else coercer(MainWindow._pedl[key])(value))
+
+    if 'layout' in spec:
+        d.window.setLayout(create(spec['layout']),
+                           resize=spec.get('resize', True))
+
+    for widget in spec.get('widgets', ()):
+        d.addWidget(create(widget))
+
+    return d
+
+
+def loads(text, format='json'):
+    """
+    Create a :class:`.Designer` from the text of a specification
+
+    Parameters
+    ----------
+    text : str
+
+    format : str, optional
+        Either ``json`` or ``yaml``
+
+    Returns
+    -------
+    designer : :class:`.Designer`
+    """
+    if format == 'json':
+        return build(json.loads(text))
+
+    if format == 'yaml':
+        if yaml is None:
+            raise ImportError('PyYAML is required to read YAML '
+                              'specifications')
+
+        return build(yaml.safe_load(text))
+
+    raise ValueError('Unknown specification format {}'.format(format))
+
+
+def load(path):
+    """
+    Create a :class:`.Designer` from a specification file
+
+    The format is chosen by the extension, ``.yaml`` and ``.yml`` files are
+    read as YAML, anything else as JSON
+    """
+    ext = os.path.splitext(path)[1].lower()
+
+    with open(path, 'r') as handle:
+        return loads(handle.read(),
+                     format='yaml' if ext in ('.yaml', '.yml') else 'json')
@@ -8,10 +8,14 @@ import os
 import re
 import sys
 import math
+import stat
+import uuid
 import copy
+import asyncio
 import logging
 import subprocess
 from enum import Enum
+from contextlib import contextmanager
 from distutils.spawn import find_executable
 ###############
 # Third Party #
@@ -66,13 +70,7 @@ def launch(path, wait=True, wd=None, **kwargs):
     if not os.path.exists(path):
         raise FileNotFoundError(path)
 
-    edm_args = ['edm', '-x', '-eolc']
-
-    if kwargs:
-        edm_args.append(','.join(['='.join([key,value])
-                        for (key,value) in kwargs.items()]))
-
-    edm_args.append(path)
+    edm_args = command(path, **kwargs)
 
     try:
         logger.debug("Launching {} with the following command {}"
@@ -95,6 +93,212 @@ def launch(path, wait=True, wd=None, **kwargs):
     return proc
 
 
+async def launch_async(path, wait=True, wd=None, **kwargs):
+    """
+    Launch an EDL file without blocking the event loop
+
+    If the coroutine is cancelled while waiting, EDM is terminated before the
+    cancellation is passed on
+
+    Parameters
+    ----------
+    path : str
+        Path to file
+
+    wait : bool, optional
+        Wait for the EDM preview to close
+
+    wd : str, optional
+        Working directory to launch screen, otherwise the current directory
+        is used
+
+    kwargs : optional
+        Represent EDM macros as keyword arguments
+
+    Returns
+    -------
+    proc : ``asyncio.subprocess.Process``
+        Process containing EDM launch
+
+    Raises
+    ------
+    FileNotFoundError:
+        If the .edl file does not exist
+
+    OSError:
+        If the ``edm`` executable is not in the system path
+
+    Example
+    -------
+    .. code::
+
+        proc = await launch_async('path/to/my.edl', MACRO='TST:MACRO')
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+
+    edm_args = command(path, **kwargs)
+
+    try:
+        logger.debug("Launching {} with the following command {}"
+                     "".format(path, edm_args))
+        proc = await asyncio.create_subprocess_exec(*edm_args, cwd=wd)
+
+    except OSError:
+        if not find_executable('edm'):
+            raise OSError('EDM is not in current environment')
+
+        raise
+
+    if wait:
+        try:
+            await proc.wait()
+
+        except asyncio.CancelledError:
+            logger.debug('Preview cancelled ...')
+            if proc.returncode is None:
+                proc.terminate()
+                await proc.wait()
+            raise
+
+    return proc
+
+
+def command(path, *options, **kwargs):
+    """
+    Arguments to launch an EDL file in EDM
+
+    Parameters
+    ----------
+    path : str
+        Path to file
+
+    options : str, optional
+        Additional EDM command line options, e.g ``-oneInst``
+
+    kwargs : optional
+        Represent EDM macros as keyword arguments
+
+    Returns
+    -------
+    args : list
+    """
+    edm_args = ['edm', '-x', '-eolc']
+    edm_args.extend(options)
+
+    if kwargs:
+        edm_args.append(','.join(['='.join([key,value])
+                        for (key,value) in kwargs.items()]))
+
+    edm_args.append(path)
+    return edm_args
+
+
+def keep_mode(path, original):
+    """
+    Give a file replacing another the permissions of the original
+
+    A file with no original keeps the permissions it was created with, to
+    which the kernel has already applied the umask
+    """
+    try:
+        mode = os.stat(original).st_mode
+
+    except FileNotFoundError:
+        return
+
+    os.chmod(path, stat.S_IMODE(mode))
+
+
+@contextmanager
+def atomic(path, mode='w'):
+    """
+    Write a file so that readers only ever see the old or new contents
+
+    The contents are written to a temporary file in the same directory, which
+    then replaces the original. The new file keeps the permissions of the
+    original, or those of any other newly created file. A partially written
+    file is removed if an exception is raised
+
+    Parameters
+    ----------
+    path : str
+        Destination of the file
+
+    mode : str, optional
+        Mode used to open the temporary file
+
+    Example
+    -------
+    .. code::
+
+        with atomic('screen.edl') as handle:
+            designer.dump(handle)
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    prefix, suffix  = '.' + name + '.', os.path.splitext(name)[1]
+
+    #Created with 0o666 so that the kernel applies the umask
+    def create(tmp, flags):
+        return os.open(tmp, flags | os.O_CREAT | os.O_EXCL | os.O_WRONLY,
+                       0o666)
+
+    while True:
+        tmp = os.path.join(directory, prefix + uuid.uuid4().hex[:8] + suffix)
+
+        try:
+            handle = open(tmp, mode, opener=create)
+            break
+
+        except FileExistsError:
+            continue
+
+    try:
+        with handle:
+            yield handle
+        keep_mode(tmp, path)
+        os.replace(tmp, path)
+
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def write_if_changed(path, text):
+    """
+    Write text to a file, unless the file already holds the same text
+
+    Leaving unchanged files alone preserves their modification time, so that
+    tools watching the output only see the files that really changed
+
+    Parameters
+    ----------
+    path : str
+        Location of the file
+
+    text : str
+        Contents of the file
+
+    Returns
+    -------
+    written : bool
+        Whether the file was written
+    """
+    try:
+        with open(path, 'r') as handle:
+            if handle.read() == text:
+                return False
+
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
+
+    with atomic(path) as handle:
+        handle.write(text)
+
+    return True
+
+
 class Visibility:
     """
     Visibility Settings for Widget
@@ -269,7 +473,7 @@ class Font:
         self.size       = size
         self.bold       = bold
         self.font       = font
-        self.italiczied = italicized
+        self.italicized = italicized
 
     @property
     def bold(self):
@@ -319,8 +523,16 @@ class Font:
             self._size = float(value)
         else:
             print('Invalid size, rounding to nearest value')
-            distance = [math.fabs(i-value) for i in self.sizes]
-            self._size =  self.sizes[distance.index(min(distance))]   
+            self._size = self.nearest(value)
+
+
+    @classmethod
+    def nearest(cls, size):
+        """
+        Closest available size to a requested font size
+        """
+        distance = [math.fabs(i-size) for i in cls.sizes]
+        return cls.sizes[distance.index(min(distance))]
 
     @property
     def tag(self):
@@ -406,6 +618,48 @@ class Font:
                     bold=self.bold, font=self.font)
 
 
+class Param:
+    """
+    Placeholder for a value given when a compiled screen is rendered
+
+    A parameter can be assigned to any property, including choices such as
+    colors, and is rendered as the EDM macro ``$(name)``. Within strings,
+    such as PV names, the macro can be written directly. See
+    :meth:`.Designer.compile`
+
+    Parameters
+    ----------
+    name : str
+        Name of the parameter
+    """
+    def __init__(self, name):
+        self.name = name
+
+
+    @property
+    def value(self):
+        """
+        Macro rendered in place of the value, matching ``Enum.value``
+        """
+        return '$({})'.format(self.name)
+
+
+    def __str__(self):
+        return self.value
+
+
+    def __repr__(self):
+        return 'Param({!r})'.format(self.name)
+
+
+    def __eq__(self, other):
+        return isinstance(other, Param) and other.name == self.name
+
+
+    def __hash__(self):
+        return hash(self.name)
+
+
 class pedlproperty:
     """
     Reimplementation of Python property
@@ -469,7 +723,8 @@ class pedlproperty:
 
         #Enforce value
         else:
-            if value is not None and self.type is not None:
+            if (value is not None and self.type is not None
+                and not isinstance(value, Param)):
                 value = self.type(value)
 
             #Store previous value for comparison
@@ -0,0 +1,221 @@
+"""
+Many mistakes in a screen only surface once it is rendered, or are silently
+ignored altogether. :meth:`.Designer.validate` checks the complete tree of
+objects in a single pass before anything is rendered, and collects every
+problem into a :class:`.ValidationReport`, rather than stopping at the first.
+"""
+####################
+# Standard Library #
+####################
+import logging
+from enum import Enum
+from collections import namedtuple, defaultdict
+
+####################
+#    Third Party   #
+####################
+from jinja2 import TemplateNotFound
+
+####################
+#     Package      #
+####################
+from .widget import Widget
+from .layout import Layout
+from .errors import DesignerError
+from .utils  import Param
+
+logger = logging.getLogger(__name__)
+
+Problem = namedtuple('Problem', ['widget', 'check', 'message'])
+
+
+class ValidationReport:
+    """
+    Collection of problems found within a screen
+
+    Parameters
+    ----------
+    problems : list
+        :class:`.Problem` entries, each with the offending object, the name
+        of the failed check and a description
+    """
+    def __init__(self, problems=None):
+        self.problems = list(problems or [])
+
+
+    @property
+    def valid(self):
+        """
+        Whether no problems were found
+        """
+        return not self.problems
+
+
+    def filter(self, check):
+        """
+        Problems found by a single check
+        """
+        return [p for p in self.problems if p.check == check]
+
+
+    def raiseErrors(self):
+        """
+        Raise an exception describing every problem
+
+        Raises
+        ------
+        DesignerError:
+            If any problems were found
+        """
+        if self.problems:
+            raise DesignerError('{} problems found in screen\n{}'
+                                ''.format(len(self.problems), self))
+
+
+    def __len__(self):
+        return len(self.problems)
+
+
+    def __iter__(self):
+        return iter(self.problems)
+
+
+    def __str__(self):
+        return '\n'.join('{} ({}) : {}'.format(p.widget.name, p.check, p.message)
+                         for p in self.problems)
+
+
+class Validator:
+    """
+    Checks applied to each object in a screen
+
+    Parameters
+    ----------
+    designer : :class:`.Designer`
+        Designer containing the screen
+    """
+    def __init__(self, designer):
+        self.designer  = designer
+        self.problems  = list()
+        self.templates = dict()
+        self.names     = defaultdict(list)
+
+
+    def report(self, widget, check, message):
+        self.problems.append(Problem(widget, check, message))
+
+
+    def run(self):
+        """
+        Check the window and every object beneath it
+
+        Returns
+        -------
+        report : :class:`.ValidationReport`
+        """
+        window = self.designer.window
+        self.properties(window)
+
+        stack = list(reversed(self.designer.widgets))
+
+        while stack:
+            obj = stack.pop()
+            self.properties(obj)
+
+            if isinstance(obj, Layout):
+                if not obj.widgets:
+                    self.report(obj, 'empty', 'Layout has no widgets')
+                stack.extend(reversed(obj.widgets))
+
+            elif isinstance(obj, Widget):
+                self.widget(obj, window)
+
+        #Names are only compared once they have been chosen by the user
+        for name, widgets in self.names.items():
+            if len(widgets) > 1:
+                for widget in widgets:
+                    self.report(widget, 'name', 'Name is used by {} widgets'
+                                                ''.format(len(widgets)))
+
+        return ValidationReport(self.problems)
+
+
+    def template(self, widget):
+        """
+        Whether the template of a widget can be loaded
+        """
+        try:
+            return self.templates[widget.template]
+
+        except KeyError:
+            try:
+                self.designer.env.get_template(widget.template)
+                found = True
+
+            except TemplateNotFound:
+                found = False
+
+            self.templates[widget.template] = found
+            return found
+
+
+    def properties(self, obj):
+        """
+        Check that each choice property holds a valid member
+        """
+        for attr, prop in obj._pedl.items():
+            if not (isinstance(prop.type, type) and issubclass(prop.type, Enum)):
+                continue
+
+            value  = obj.attributes.get(attr)
+            values = value if isinstance(value, list) else [value]
+
+            for value in values:
+                if value is not None and not isinstance(value, (prop.type,
+                                                                Param)):
+                    try:
+                        prop.type(value)
+                        message = 'Uncoerced value {!r} for {}'
+                    except ValueError:
+                        message = 'Invalid value {!r} for {}'
+
+                    self.report(obj, 'enum', message.format(value, attr))
+
+
+    def widget(self, widget, window):
+        """
+        Check a single widget
+        """
+        if not self.template(widget):
+            self.report(widget, 'template', 'Non-existant template {}'
+                                            ''.format(widget.template))
+
+        #Visibility
+        if widget.visibility.entered and not widget.visibility.valid:
+            self.report(widget, 'visibility', 'Incomplete visibility settings '
+                                              'will be ignored')
+
+        #Lines may be flat in one dimension, but need at least two points
+        if hasattr(widget, 'points'):
+            empty = widget.numPoints < 2
+        else:
+            empty = widget.w <= 0 or widget.h <= 0
+
+        if empty:
+            self.report(widget, 'size', 'Widget has size {}x{}'
+                                        ''.format(widget.w, widget.h))
+
+        if (widget.x < 0 or widget.y < 0
+            or widget.right > window.w or widget.bottom > window.h):
+            self.report(widget, 'geometry', 'Widget at ({}, {}) with size '
+                                            '{}x{} exceeds the screen'
+                                            ''.format(widget.x, widget.y,
+                                                      widget.w, widget.h))
+
+        #Lists of actions
+        for attr in ('displays', 'commands'):
+            if attr in widget._pedl and not getattr(widget, attr):
+                self.report(widget, 'empty', 'Widget has no {}'.format(attr))
+
+        if widget.name and widget.name != widget.widgetClass:
+            self.names[widget.name].append(widget)
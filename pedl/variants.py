@@ -0,0 +1,206 @@
+"""
+Consoles of different resolutions need the same screen at several scales.
+Rather than copying and rendering the complete tree of widgets for every
+resolution, :meth:`.Designer.save_variants` renders the screen once and
+divides the text at each value that depends on the scale: the position and
+size of the window and every object, the points of each :class:`.Lines` and
+the size of each font. Each variant then scales these values as a single
+array operation and joins the strings together.
+
+The values are scaled in the same way as :meth:`.Designer.scaled`. The edges
+of each object are scaled and rounded rather than its size, so that objects
+that touch still touch afterwards, and fonts are given the closest size in
+:attr:`.Font.sizes`.
+
+.. code::
+
+    screen = ScalableScreen(d.dumps())
+
+    for suffix, factor in {'_hd' : 1, '_4k' : 2}.items():
+        screen.save('overview' + suffix + '.edl', factor)
+"""
+####################
+# Standard Library #
+####################
+import re
+import logging
+
+####################
+#    Third Party   #
+####################
+import numpy as np
+
+####################
+#     Package      #
+####################
+from .utils import Font, atomic, write_if_changed
+
+logger = logging.getLogger(__name__)
+
+#Lines holding a value that depends on the scale
+_edge  = re.compile(r'^([xywh] )(-?\d+)$')
+_point = re.compile(r'^(\s*\d+ )(-?\d+)$')
+_font  = re.compile(r'^(font "?\S+-)(\d+(?:\.\d+)?)("?)$')
+
+#Kinds of slot
+NEAR, FAR, POINT, FONT = range(4)
+
+
+class ScalableScreen:
+    """
+    A rendered screen with slots for every value that depends on the scale
+
+    Parameters
+    ----------
+    text : str
+        Rendered screen, as returned by :meth:`.Designer.dumps`
+    """
+    def __init__(self, text):
+        #Alternating literal text and scaled values
+        self.parts = list()
+        kinds, values, origins = list(), list(), list()
+        literal    = list()
+        near, obj  = dict(), False
+        block      = None
+
+        def slot(head, kind, value, origin=0):
+            literal.append(head)
+            self.parts.append(''.join(literal))
+            literal.clear()
+            kinds.append(kind)
+            values.append(value)
+            origins.append(origin)
+
+        for line in text.split('\n'):
+            stripped = line.strip()
+            match    = None
+
+            if block is not None:
+                if stripped == '}':
+                    block = None
+
+                elif block:
+                    match = _point.match(line)
+
+                if match:
+                    slot(match.group(1), POINT, int(match.group(2)))
+                    literal.append('\n')
+                    continue
+
+            elif stripped in ('beginObjectProperties',
+                              'beginScreenProperties'):
+                near, obj = dict(), stripped == 'beginObjectProperties'
+
+            elif stripped.endswith('{'):
+                block = stripped in ('xPoints {', 'yPoints {')
+
+            else:
+                match = _edge.match(stripped)
+
+                if match:
+                    axis, value = match.group(1)[0], int(match.group(2))
+
+                    #Far edges are found from the near edge already seen
+                    if axis in 'wh':
+                        origin = near.get('x' if axis == 'w' else 'y', 0)
+                        slot(match.group(1), FAR, value, origin)
+
+                    else:
+                        near[axis] = value
+                        slot(match.group(1), NEAR, value)
+
+                    literal.append('\n')
+                    continue
+
+                #Fonts of the window are fixed by the template
+                match = obj and _font.match(stripped)
+
+                if match:
+                    slot(match.group(1), FONT, float(match.group(2)))
+                    literal.append(match.group(3) + '\n')
+                    continue
+
+            literal.append(line + '\n')
+
+        self.parts.append(''.join(literal)[:-1])
+        self.kinds   = np.array(kinds, dtype=np.int8)
+        self.values  = np.array(values, dtype=np.float64)
+        self.origins = np.array(origins, dtype=np.float64)
+
+
+    def scale(self, factor):
+        """
+        Every value of the screen at a scale
+
+        Parameters
+        ----------
+        factor : float
+            Scale factor applied to both axes
+
+        Returns
+        -------
+        values : list
+            Text of each slot, in order
+        """
+        kinds, values = self.kinds, self.values
+        near    = np.rint(self.origins * factor)
+        scaled  = np.rint(values * factor)
+        far     = kinds == FAR
+        scaled[far] = np.rint((self.origins[far] + values[far]) * factor)\
+                      - near[far]
+        text    = [str(v) for v in scaled.astype(np.int64).tolist()]
+
+        #Fonts snap to the available sizes
+        for i in np.flatnonzero(kinds == FONT).tolist():
+            text[i] = '{:.1f}'.format(Font.nearest(values[i] * factor))
+
+        return text
+
+
+    def render(self, factor):
+        """
+        Text of the screen at a scale
+
+        Parameters
+        ----------
+        factor : float
+            Scale factor applied to both axes
+
+        Returns
+        -------
+        edl : str
+        """
+        text = self.scale(factor)
+        text.append('')
+        return ''.join([p for pair in zip(self.parts, text) for p in pair])
+
+
+    def save(self, path, factor, only_changed=False):
+        """
+        Save the screen at a scale to an EDL file
+
+        Parameters
+        ----------
+        path : str
+            Location of the new file
+
+        factor : float
+            Scale factor applied to both axes
+
+        only_changed : bool, optional
+            Leave the file untouched if it already holds this screen
+
+        Returns
+        -------
+        written : bool
+            Whether the file was written
+        """
+        text = self.render(factor)
+
+        if only_changed:
+            return write_if_changed(path, text)
+
+        with atomic(path) as handle:
+            handle.write(text)
+
+        return True
@@ -0,0 +1,567 @@
+"""
+Regenerating every screen of a large package after each edit makes for a slow
+edit, regenerate and look loop. ``pedl watch`` imports a module of
+:func:`.factory` functions, builds their screens once, then watches the
+Python sources beneath the module and the template directories of the
+screens it created. When files change, only the factories affected are run
+again:
+
+* A change to the file defining a factory runs the factories in that file
+* A change to any other Python file, e.g a module of shared helpers, runs
+  every factory
+* A change to a template runs the factories whose screens use it, directly
+  or through ``{% extends %}``
+
+Changes are detected with inotify on Linux, falling back to polling the
+modification time of each file elsewhere. A burst of saves is collected into
+a single rebuild, and each screen is only written if its contents changed.
+"""
+####################
+# Standard Library #
+####################
+import os
+import sys
+import time
+import ctypes
+import select
+import struct
+import logging
+import importlib
+import ctypes.util
+from collections import defaultdict
+
+####################
+#    Third Party   #
+####################
+from jinja2 import meta, TemplateNotFound
+
+####################
+#     Package      #
+####################
+from .factory import registry, load, root, factories, run
+
+logger = logging.getLogger(__name__)
+
+
+class PollingWatcher:
+    """
+    Detect changes by comparing the modification time of files
+
+    Parameters
+    ----------
+    paths : iterable
+        Files and directories to watch. Directories are watched recursively
+
+    interval : float, optional
+        Time in seconds between each scan
+    """
+    def __init__(self, paths, interval=0.5):
+        self.paths    = set()
+        self.interval = interval
+        self.snapshot = dict()
+
+        for path in paths:
+            self.add(path)
+
+
+    def add(self, path):
+        """
+        Watch another file or directory
+        """
+        self.paths.add(os.path.abspath(path))
+        self.snapshot.update(self.scan([path]))
+
+
+    def scan(self, paths=None):
+        """
+        Modification time of every watched file
+        """
+        times = dict()
+
+        for path in (self.paths if paths is None else paths):
+            if os.path.isdir(path):
+                files = (os.path.join(d, f) for (d, _, fs) in os.walk(path)
+                                            for f in fs)
+            else:
+                files = [path]
+
+            for f in files:
+                try:
+                    times[os.path.abspath(f)] = os.stat(f).st_mtime_ns
+                except FileNotFoundError:
+                    pass
+
+        return times
+
+
+    def read(self, timeout=None):
+        """
+        Wait for files to change
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time to wait in seconds, forever if ``None``
+
+        Returns
+        -------
+        changes : set
+            Paths of each file that was created, modified or deleted
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            current = self.scan()
+            changes = {path for path in set(current) | set(self.snapshot)
+                       if current.get(path) != self.snapshot.get(path)}
+            self.snapshot = current
+
+            if changes:
+                return changes
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return changes
+
+                time.sleep(min(self.interval, remaining))
+
+            else:
+                time.sleep(self.interval)
+
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """
+    Detect changes with the inotify interface of the Linux kernel
+
+    Parameters
+    ----------
+    paths : iterable
+        Files and directories to watch. Directories are watched recursively,
+        including those created later
+
+    Raises
+    ------
+    OSError:
+        If inotify is not available
+    """
+    IN_MODIFY      = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM  = 0x00000040
+    IN_MOVED_TO    = 0x00000080
+    IN_CREATE      = 0x00000100
+    IN_DELETE      = 0x00000200
+    IN_ISDIR       = 0x40000000
+    mask = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+            | IN_CREATE | IN_DELETE)
+
+    #Header of each event, followed by the name of the file
+    header = struct.Struct('iIII')
+
+    def __init__(self, paths):
+        name = ctypes.util.find_library('c')
+        self.libc = ctypes.CDLL(name, use_errno=True)
+        self.fd   = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+
+        if self.fd < 0:
+            code = ctypes.get_errno()
+            raise OSError(code, os.strerror(code))
+
+        self.watches = dict()
+        self.files   = set()
+
+        for path in paths:
+            self.add(path)
+
+
+    def add(self, path):
+        """
+        Watch another file or directory
+        """
+        path = os.path.abspath(path)
+
+        if os.path.isdir(path):
+            for (directory, _, _) in os.walk(path):
+                self._watch(directory)
+
+        #Files are watched through their directory, so that a file replaced
+        #by renaming is still seen
+        else:
+            self.files.add(path)
+            self._watch(os.path.dirname(path))
+
+
+    def _watch(self, directory):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory),
+                                         self.mask)
+        if wd < 0:
+            code = ctypes.get_errno()
+            raise OSError(code, os.strerror(code), directory)
+
+        self.watches[wd] = directory
+
+
+    def read(self, timeout=None):
+        """
+        Wait for files to change
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time to wait in seconds, forever if ``None``
+
+        Returns
+        -------
+        changes : set
+            Paths of each file that was created, modified or deleted
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        changes = set()
+
+        if not ready:
+            return changes
+
+        data = b''
+        while True:
+            try:
+                data += os.read(self.fd, 65536)
+            except BlockingIOError:
+                break
+
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = self.header.unpack_from(data, offset)
+            offset += self.header.size
+            name    = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+
+            if wd not in self.watches:
+                continue
+
+            path = os.path.join(self.watches[wd], os.fsdecode(name))
+
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    self.add(path)
+
+            else:
+                changes.add(path)
+
+        return changes
+
+
+    def close(self):
+        os.close(self.fd)
+
+
+def watcher(paths, poll=False, interval=0.5):
+    """
+    Watch a set of files and directories, using inotify where available
+
+    Parameters
+    ----------
+    paths : iterable
+        Files and directories to watch
+
+    poll : bool, optional
+        Always poll the modification times of files
+
+    interval : float, optional
+        Time in seconds between each scan when polling
+    """
+    if not poll:
+        try:
+            return InotifyWatcher(paths)
+
+        except (OSError, AttributeError, TypeError) as exc:
+            logger.info('Unable to use inotify, polling for changes '
+                        'instead ({})'.format(exc))
+
+    return PollingWatcher(paths, interval=interval)
+
+
+def debounce(watcher, delay=0.2, timeout=None):
+    """
+    Wait for a burst of changes to finish
+
+    Parameters
+    ----------
+    watcher : :class:`.InotifyWatcher` or :class:`.PollingWatcher`
+
+    delay : float, optional
+        Time in seconds without a change that ends the burst
+
+    timeout : float, optional
+        Maximum time to wait for the first change, forever if ``None``
+
+    Returns
+    -------
+    changes : set
+        Paths of each file changed during the burst
+    """
+    changes = watcher.read(timeout)
+
+    while changes:
+        more = watcher.read(delay)
+
+        if not more:
+            break
+
+        changes |= more
+
+    return changes
+
+
+def dependencies(env, name):
+    """
+    Names of a template and every template it extends, includes or imports
+    """
+    found, pending = set(), [name]
+
+    while pending:
+        name = pending.pop()
+        if name in found:
+            continue
+
+        found.add(name)
+
+        try:
+            source, _, _ = env.loader.get_source(env, name)
+        except TemplateNotFound:
+            continue
+
+        pending.extend(n for n in meta.find_referenced_templates(
+                                                    env.parse(source)) if n)
+
+    return found
+
+
+class Regenerator:
+    """
+    Rebuild the screens of a module of factories as its sources change
+
+    Parameters
+    ----------
+    module : str
+        Dotted name or path of the module defining the factories
+
+    directory : str, optional
+        Root of the output tree
+
+    poll : bool, optional
+        Always poll for changes rather than use inotify
+
+    interval : float, optional
+        Time in seconds between each scan when polling
+
+    delay : float, optional
+        Time in seconds without a change before screens are rebuilt
+
+    Attributes
+    ----------
+    templates : dict
+        Template files used by the last screen of each factory
+    """
+    def __init__(self, module, directory='.', poll=False, interval=0.5,
+                 delay=0.2):
+        self.module    = load(module)
+        self.directory = directory
+        self.delay     = delay
+        self.templates = defaultdict(set)
+        self.build()
+        self.watcher   = watcher(self.paths, poll=poll, interval=interval)
+
+
+    @property
+    def root(self):
+        """
+        Directory of the Python sources that are watched
+        """
+        return root(self.module)
+
+
+    @property
+    def paths(self):
+        """
+        Files and directories watched for changes
+        """
+        dirs = {os.path.dirname(path) for paths in self.templates.values()
+                                      for path in paths}
+        return [self.root] + sorted(dirs - {self.root})
+
+
+    def modules(self):
+        """
+        Loaded modules with a source file beneath :attr:`.root`
+        """
+        base = os.path.join(self.root, '')
+        return [m for m in list(sys.modules.values())
+                if os.path.abspath(getattr(m, '__file__', None)
+                                   or os.devnull).startswith(base)]
+
+
+    def build(self, paths=None):
+        """
+        Run factories and save their screens
+
+        Parameters
+        ----------
+        paths : iterable, optional
+            Output paths of the factories to run, by default every factory
+            of the module
+
+        Returns
+        -------
+        written : list
+            Output path of each screen that changed
+        """
+        written = list()
+
+        for factory in factories(self.module):
+            if paths is not None and factory.path not in paths:
+                continue
+
+            try:
+                designer, changed = run(factory, self.directory)
+
+            except Exception:
+                logger.exception('Unable to create {}'.format(factory.path))
+                continue
+
+            self.templates[factory.path] = self.used(designer)
+
+            if changed:
+                logger.info('Wrote {}'.format(factory.path))
+                written.append(factory.path)
+
+        return written
+
+
+    @staticmethod
+    def used(designer):
+        """
+        Paths of the template files used by a screen
+        """
+        #Compiled screens no longer know their templates
+        if not getattr(designer, 'template_dir', None):
+            return set()
+
+        names = {designer.window.template}
+        names.update(w.template for w in designer.findChildren())
+
+        env   = designer.env
+        found = set().union(*(dependencies(env, n) for n in names))
+        return {os.path.abspath(os.path.join(designer.template_dir, n))
+                for n in found}
+
+
+    def affected(self, changes):
+        """
+        Output paths of the factories affected by a set of changed files
+        """
+        sources = {os.path.abspath(getattr(m, '__file__', None) or '')
+                   for m in self.modules()}
+        python  = {path for path in changes if path.endswith('.py')
+                   and (path in sources
+                        or path.startswith(os.path.join(self.root, '')))}
+        defined = {f.source: f.path for f in factories(self.module)}
+
+        #Shared code may be used by any screen
+        if python - set(defined):
+            return {f.path for f in factories(self.module)}
+
+        paths = {defined[path] for path in python}
+        paths.update(name for (name, used) in self.templates.items()
+                     if used & changes)
+        return paths
+
+
+    def reload(self, changes):
+        """
+        Reload the Python modules that changed
+
+        When only files defining factories changed those modules are
+        reloaded, otherwise every module beneath :attr:`.root` is reloaded
+        so that names imported from shared code are bound again
+        """
+        defined  = {f.source for f in factories(self.module)}
+        modules  = self.modules()
+        changed  = [m for m in modules
+                    if os.path.abspath(m.__file__) in changes]
+
+        if not changed:
+            return
+
+        if any(os.path.abspath(m.__file__) not in defined for m in changed):
+            changed += [m for m in modules if m not in changed]
+
+        #Forget the factories of each reloaded module, so that removed
+        #factories are not run again
+        names = {m.__name__ for m in changed}
+        for path, factory in list(registry.items()):
+            if factory.module in names:
+                del registry[path]
+
+        for m in changed:
+            try:
+                importlib.reload(m)
+
+            except Exception:
+                logger.exception('Unable to reload {}'.format(m.__name__))
+
+        self.module = sys.modules[self.module.__name__]
+
+
+    def step(self, timeout=None):
+        """
+        Wait for changes and rebuild the affected screens
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time to wait for a change, forever if ``None``
+
+        Returns
+        -------
+        written : list
+            Output path of each screen that changed
+        """
+        changes = debounce(self.watcher, delay=self.delay, timeout=timeout)
+
+        if not changes:
+            return list()
+
+        logger.debug('Changed files {}'.format(sorted(changes)))
+        before = set(self.paths)
+        self.reload(changes)
+        paths = self.affected(changes)
+        #Factories added by the reload have not been built before
+        paths.update(f.path for f in factories(self.module)
+                     if f.path not in self.templates)
+        written = self.build(paths)
+
+        #Watch any new template directories
+        for path in set(self.paths) - before:
+            self.watcher.add(path)
+
+        return written
+
+
+    def run(self):
+        """
+        Rebuild screens until interrupted
+        """
+        try:
+            while True:
+                for path in self.step():
+                    print('Regenerated {}'.format(path))
+
+        except KeyboardInterrupt:
+            pass
+
+        finally:
+            self.watcher.close()
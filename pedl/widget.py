@@ -12,7 +12,8 @@ import six
 ####################
 #     Package      #
 ####################
-from .utils   import pedlproperty, Visibility
+from .utils    import pedlproperty, Visibility
+from .geometry import store, geometryproperty
 from .choices import ColorChoice
 from .errors  import DesignerError
 
@@ -48,6 +49,11 @@ class PedlMeta(type):
         for attr, prop in clsobj._pedl.items():
             prop.attr = attr
 
+        #Whether the geometry is held directly in the shared store
+        clsobj._stored = all(isinstance(getattr(clsobj, axis, None),
+                                        geometryproperty)
+                             for axis in store.axes)
+
         return clsobj
 
 
@@ -67,21 +73,53 @@ class PedlObject(six.with_metaclass(PedlMeta, object)):
 
     attributes : dict
         All properties that are directly interepreted by a pedl template
+
+    listeners : list
+        Callables notified with the object whenever its geometry changes
+
+    Notes
+    -----
+    The geometry of each object is not stored in :attr:`.attributes`, but in
+    the :class:`.GeometryStore` shared by all objects. The object only holds
+    the index of its slot
     """
     widgetClass = None
     
-    w = pedlproperty(int, default=0, doc='Width of the widget')
-    h = pedlproperty(int, default=0, doc='Height of the widget')
-    x = pedlproperty(int, default=0, doc='Horizontal position of the widget')
-    y = pedlproperty(int, default=0, doc='Vertical position of the widget')
+    x = geometryproperty(0, doc='Horizontal position of the widget')
+    y = geometryproperty(1, doc='Vertical position of the widget')
+    w = geometryproperty(2, doc='Width of the widget')
+    h = geometryproperty(3, doc='Height of the widget')
+
+    @w.callback
+    def w(self):
+        self.geometryChanged()
+
+    @h.callback
+    def h(self):
+        self.geometryChanged()
+
+    @x.callback
+    def x(self):
+        self.geometryChanged()
+
+    @y.callback
+    def y(self):
+        self.geometryChanged()
 
     def __init__(self, name=None, parent=None, **kwargs):
         self.name       = name or self.widgetClass
         self.parent     = parent
+        self.listeners  = list()
+        self._slot      = store.allocate()
 
         #Store default value within the class
-        self.attributes = dict((prop.attr, copy(prop.default)) for prop in
-                                self._pedl.values())
+        self.attributes = dict()
+
+        for prop in self._pedl.values():
+            if isinstance(prop, geometryproperty):
+                store.data[prop.axis, self._slot] = prop.default
+            else:
+                self.attributes[prop.attr] = copy(prop.default)
 
         #Update kwargs 
         for key, val in kwargs.items():
@@ -101,6 +139,14 @@ class PedlObject(six.with_metaclass(PedlMeta, object)):
         return list(self._pedl.keys())
 
 
+    def geometryChanged(self):
+        """
+        Notify all listeners that the position or size has changed
+        """
+        for listener in self.listeners:
+            listener(self)
+
+
     @property
     def center(self):
         """
@@ -152,8 +198,44 @@ class PedlObject(six.with_metaclass(PedlMeta, object)):
 
         return self.x, self.y
 
+    @property
+    def geometry(self):
+        """
+        Position and size of the object as (x, y, w, h)
+        """
+        return (self.x, self.y, self.w, self.h)
+
+
     def __copy__(self):
-        return self.__class__(**self.attributes)
+        kwargs = dict(self.attributes)
+
+        #Only copy geometry that is not derived from other properties
+        for axis in store.axes:
+            if isinstance(getattr(type(self), axis), geometryproperty):
+                kwargs[axis] = getattr(self, axis)
+
+        return self.__class__(**kwargs)
+
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state['listeners'] = list()
+        #Geometry is stored by value outside of the shared arrays
+        state['_slot'] = tuple(store.data[:, self._slot].tolist())
+        return state
+
+
+    def __setstate__(self, state):
+        geometry = state.pop('_slot')
+        self.__dict__.update(state)
+        self._slot = store.allocate()
+        store.data[:, self._slot] = geometry
+
+
+    def __del__(self):
+        slot = getattr(self, '_slot', None)
+        if slot is not None and store is not None:
+            store.release(slot)
 
 
 class Widget(PedlObject):
@@ -273,6 +355,9 @@ class MainWindow(PedlObject):
             will be placed in the upper left hand corner, seperated from the
             edge of the screen by the :attr:`.margin` 
 
+            A :class:`.FlowLayout` without a ``maxWidth`` is first wrapped to
+            the current width of the screen within the margins
+
         origin : tuple, optional
             (x,y) location for the top left corner of the layout
 
@@ -287,6 +372,10 @@ class MainWindow(PedlObject):
         if not layout.widgets:
             raise ValueError("Provided layout has not Widgets!")
 
+        #Wrap layouts that fill the screen at the window width
+        if getattr(layout, 'maxWidth', 0) is None:
+            layout.maxWidth = self.w - 2*self.margin
+
         #Resize screen
         if resize:
             logger.debug("Resizing screen to fit layout ...")
@@ -305,6 +394,7 @@ class MainWindow(PedlObject):
 
         #Check screen size
         if layout.right  > self.right or layout.bottom > self.h:
-            logger.warning("Layout exceeds the boundary of the screen")
+            logger.warning("Layout exceeds the boundary of the screen, "
+                           "see Designer.paginate to divide it into pages")
 
         self.parent.widgets = [layout]
@@ -215,8 +215,12 @@ class RelatedDisplay(Button):
     release  = 0
     template = 'display.edl'
 
+    label    = pedlproperty(str, default='', doc='Label of Button')
     displays = pedlproperty(list, default=[],
                             doc='List of external displays')
+    closeCurrent = pedlproperty(bool, default=False,
+                                doc='Close the current screen when a '
+                                    'display is opened')
         
     def __init__(self, *args, **kwargs):
         super(RelatedDisplay, self).__init__(*args, **kwargs)
@@ -17,9 +17,29 @@ import six
 ##########
 from ..widget  import Widget
 from ..utils   import LocalPv, find_screen_size, pedlproperty
+from ..resolve import resolve
 
 logger = logging.getLogger(__name__)
 
+#Sizes of previously read screens
+_sizes = dict()
+
+
+def screen_size(path):
+    """
+    Width and height of an EDL file
+
+    The size of each screen is only read again once the file is modified,
+    so that many windows embedding the same display only parse it once
+    """
+    stamp = os.stat(path).st_mtime_ns
+
+    if path not in _sizes or _sizes[path][0] != stamp:
+        _sizes[path] = (stamp, find_screen_size(open(path, 'r')))
+
+    return _sizes[path][1]
+
+
 class Display(object):
     """
     Data structure to represent Embedded Display
@@ -33,9 +53,14 @@ class Display(object):
     def from_edl(cls, edl):
         """
         Form a generic Display from an EDL file
+
+        The file is found in the same way as EDM, see :meth:`.locate`, so
+        that the extension may be left out of the name of a display along
+        ``EDMDATAFILES``. The path is kept as given, for EDM to search for
+        when the screen is opened
         """
-        #Find filename
-        name, ext = os.path.splitext(os.path.basename(edl))
+        #Find filename, using the file EDM will open if there is one
+        name, ext = os.path.splitext(os.path.basename(resolve(edl) or edl))
 
         #Check extension is .edl
         if not ext == '.edl':
@@ -45,6 +70,27 @@ class Display(object):
         return cls(name, edl, None)
 
 
+    def locate(self):
+        """
+        Find the file EDM will open for this display
+
+        A relative path is searched for along ``EDMDATAFILES`` first, and
+        only tried as given if it is not found there, see
+        :meth:`.PathResolver.resolve`
+
+        Raises
+        ------
+        FileNotFoundError:
+            If the display can not be found
+        """
+        path = resolve(self.path)
+
+        if not path:
+            raise FileNotFoundError(self.path)
+
+        return path
+
+
 class EmbeddedWindow(Widget):
     """
     Embedded Window
@@ -142,8 +188,9 @@ class EmbeddedWindow(Widget):
         """
         Resize the widget to fully fit each embedded display
 
-        Requires that all embedded displays have their file path readable so
-        that the width and height of each can be parsed.
+        Requires that all embedded displays can be found, either as given or
+        along the ``EDMDATAFILES`` search path, so that the width and height
+        of each can be parsed.
 
         Returns
         -------
@@ -153,8 +200,7 @@ class EmbeddedWindow(Widget):
         if not self.displays:
             return 
 
-        dimensions = [find_screen_size(open(d.path, 'r'))
-                      for d in self.displays]
+        dimensions = [screen_size(d.locate()) for d in self.displays]
         self.w = max(dimensions, key= lambda d : d[0])[0] 
         self.h = max(dimensions, key= lambda d : d[1])[1] 
         return self.w, self.h 
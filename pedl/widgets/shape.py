@@ -6,10 +6,13 @@ drawing command, we have a shared :class:`.Shape` object that each inherits
 ####################
 # Standard Library #
 ####################
+import logging
 from copy import copy
+
 ####################
 #    Third Party   #
 ####################
+import numpy as np
 
 ####################
 #     Package      #
@@ -18,6 +21,8 @@ from ..widget  import Widget
 from ..choices import ColorChoice 
 from ..utils   import pedlproperty
 
+logger = logging.getLogger(__name__)
+
 class Shape(Widget):
     """
     Basic Shape Widget
@@ -32,26 +37,173 @@ class Shape(Widget):
                               'alarm state of the PV')
 
 
+def as_points(points):
+    """
+    Convert a sequence of (x, y) pairs into an (N, 2) integer array
+
+    The returned array is read-only so that the cached bounding box of a
+    :class:`.Lines` widget can not be invalidated by modifying it in place
+    """
+    points = np.array(points, dtype=int).reshape(-1, 2)
+    points.flags.writeable = False
+    return points
+
+
+def simplify(points, tolerance):
+    """
+    Simplify a polyline with the Ramer-Douglas-Peucker algorithm
+
+    Points are snapped to integer pixels and consecutive duplicates are
+    removed before simplifying. The first and last points are always kept.
+
+    Parameters
+    ----------
+    points : array-like
+        (N, 2) array of points
+
+    tolerance : float
+        Maximum perpendicular distance in pixels of a removed point from the
+        simplified line
+
+    Returns
+    -------
+    points : ``numpy.ndarray``
+        Simplified (M, 2) integer array
+    """
+    points = np.rint(np.asarray(points, dtype=float)).astype(int).reshape(-1, 2)
+
+    #Remove consecutive duplicates
+    if len(points) > 1:
+        keep   = np.any(np.diff(points, axis=0) != 0, axis=1)
+        points = points[np.concatenate(([True], keep))]
+
+    if len(points) < 3:
+        return as_points(points)
+
+    keep  = np.zeros(len(points), dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, len(points) - 1)]
+
+    while stack:
+        first, last = stack.pop()
+
+        if last - first < 2:
+            continue
+
+        start, end = points[first], points[last]
+        inner      = points[first+1:last] - start
+        segment    = end - start
+        length     = np.hypot(*segment)
+
+        #Distance from the chord, or from the start for a closed segment
+        if length:
+            dist = np.abs(segment[0]*inner[:, 1]
+                          - segment[1]*inner[:, 0]) / length
+        else:
+            dist = np.hypot(inner[:, 0], inner[:, 1])
+
+        i = int(np.argmax(dist))
+
+        if dist[i] > tolerance:
+            i += first + 1
+            keep[i] = True
+            stack.extend([(first, i), (i, last)])
+
+    return as_points(points[keep])
+
+
 class Lines(Shape):
     """
+    Polyline Widget
+
+    The points of the line are stored as an (N, 2) integer array, with the
+    bounding box cached between modifications. Moving or resizing the widget
+    translates or scales the entire array at once. The array is read-only, to
+    modify the line assign a new set of points
+
+    Lines drawn from measured data often contain many more points than can
+    be distinguished on screen. Setting a :attr:`.tolerance` simplifies the
+    line when it is rendered, leaving :attr:`.points` untouched. The fraction
+    of points removed is available as :attr:`.reduction`
     """
     widgetClass = 'activeLineClass'
     template    = 'lines.edl'
     minor       = 0
     release     = 1
     
-    points = pedlproperty(list, default=list(),
-                          doc="List of (x,y) points to draw line")
+    points = pedlproperty(as_points, default=as_points([]),
+                          doc="Array of (x,y) points to draw line")
+
+    closed = pedlproperty(bool, default=True,
+                          doc='Join the last point back to the first')
+
+    tolerance = pedlproperty(float, doc='Maximum distance in pixels a point '
+                                        'may be moved when the line is '
+                                        'simplified for rendering. By '
+                                        'default, every point is drawn')
+
+    @tolerance.callback
+    def tolerance(self):
+        self._simplified = None
+
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        #Protect the default points from modification
+        if 'points' not in kwargs:
+            self.points = self.points
+
+
+    @points.setter
+    def points(self, points):
+        self.attributes['points'] = as_points(points)
+        self._bounds     = None
+        self._simplified = None
+        self.geometryChanged()
+
+
+    @classmethod
+    def from_array(cls, points, **kwargs):
+        """
+        Create a line from an array of points
+
+        Parameters
+        ----------
+        points : array-like
+            (N, 2) array of x and y positions
+
+        kwargs :
+            Additional widget properties
+
+        Returns
+        -------
+        line : :class:`.Lines`
+        """
+        return cls(points=points, **kwargs)
+
+
+    @property
+    def bounds(self):
+        """
+        Minimum and maximum of the points as (x0, y0, x1, y1)
+        """
+        if getattr(self, '_bounds', None) is None:
+            if not self.numPoints:
+                self._bounds = (0, 0, 0, 0)
+            else:
+                lo, hi = self.points.min(axis=0), self.points.max(axis=0)
+                self._bounds = (int(lo[0]), int(lo[1]),
+                                int(hi[0]), int(hi[1]))
+
+        return self._bounds
+
 
     @property
     def x(self):
         """
         Horizontal position
         """
-        if not self.points:
-            return 0
-
-        return min([p[0] for p in self.points])
+        return self.bounds[0]
 
 
     @property
@@ -59,24 +211,19 @@ class Lines(Shape):
         """
         Vertical Position
         """
-        if not self.points:
-            return 0
-
-        return min([p[1] for p in self.points])
+        return self.bounds[1]
 
 
     @x.setter
     def x(self, x):
-        if self.points:
-            shift = x - self.x
-            self.points = [(p[0]+shift, p[1]) for p in self.points] 
+        if self.numPoints:
+            self.translate(x - self.x, 0)
 
 
     @y.setter
     def y(self, y):
-        if self.points:
-            shift = y - self.y
-            self.points = [(p[0], p[1]+shift) for p in self.points] 
+        if self.numPoints:
+            self.translate(0, y - self.y)
 
     
     @property
@@ -84,12 +231,8 @@ class Lines(Shape):
         """
         Width of shape
         """
-        if not self.points:
-            return 0
-
-        positions = [p[0] for p in self.points]
-        return max(positions) - min(positions)
-
+        b = self.bounds
+        return b[2] - b[0]
 
 
     @property
@@ -97,35 +240,52 @@ class Lines(Shape):
         """
         Height of shape
         """
-        if not self.points:
-            return 0
-
-        positions = [p[1] for p in self.points]
-        return max(positions) - min(positions)
+        b = self.bounds
+        return b[3] - b[1]
 
 
     @w.setter
     def w(self, w):
-        if self.points:
-            #Keep track of starting position
-            x = self.x
-            #Scale widgets
-            scale     = w / self.w
-            self.points = [(round(p[0]*scale), p[1]) for p in self.points]
-            #Reset widget to starting position
-            self.x = x
+        if self.numPoints:
+            self.scale(w / self.w, 1)
 
 
     @h.setter
     def h(self, h):
-        if self.points:
-            #Keep track of starting position
-            y = self.y
-            #Scale widgets
-            scale = h / self.h
-            self.points = [(p[0], round(p[1]*scale)) for p in self.points]
-            #Reset widget to starting position
-            self.y = y
+        if self.numPoints:
+            self.scale(1, h / self.h)
+
+
+    def translate(self, dx, dy):
+        """
+        Shift every point of the line
+
+        Parameters
+        ----------
+        dx : int
+            Horizontal shift
+
+        dy : int
+            Vertical shift
+        """
+        self.points = self.points + (int(dx), int(dy))
+
+
+    def scale(self, sx, sy):
+        """
+        Scale the line about its top left corner
+
+        Parameters
+        ----------
+        sx : float
+            Horizontal scale factor
+
+        sy : float
+            Vertical scale factor
+        """
+        origin = self.bounds[:2]
+        scaled = np.rint((self.points - origin) * (sx, sy))
+        self.points = scaled.astype(int) + origin
 
 
     @property
@@ -136,19 +296,73 @@ class Lines(Shape):
         return len(self.points)
 
 
+    @property
+    def simplified(self):
+        """
+        Points that will be rendered
+
+        If a :attr:`.tolerance` is set, consecutive duplicate points are
+        removed and the line is simplified using the Ramer-Douglas-Peucker
+        algorithm, otherwise this is identical to :attr:`.points`
+        """
+        if self.tolerance is None:
+            return self.points
+
+        if getattr(self, '_simplified', None) is None:
+            self._simplified = simplify(self.points, self.tolerance)
+            logger.debug('Simplified line {} from {} to {} points'
+                         ''.format(self.name, self.numPoints,
+                                   len(self._simplified)))
+
+        return self._simplified
+
+
+    @property
+    def reduction(self):
+        """
+        Fraction of points removed by simplification
+        """
+        if not self.numPoints:
+            return 0.
+
+        return 1. - len(self.simplified) / self.numPoints
+
+
+    @property
+    def xPoints(self):
+        """
+        Formatted block of horizontal positions for the template
+        """
+        return self._format(self.simplified[:, 0])
+
+
+    @property
+    def yPoints(self):
+        """
+        Formatted block of vertical positions for the template
+        """
+        return self._format(self.simplified[:, 1])
+
+
+    @staticmethod
+    def _format(column):
+        return '\n'.join(map('    {} {}'.format, range(len(column)),
+                                                  column.tolist()))
+
+
 class GateValve(Lines):
     points = copy(Lines.points)
-    points.default = [(0,0),(4,2),(4,0),(0,2),(0,0)]
+    points.default = as_points([(0,0),(4,2),(4,0),(0,2),(0,0)])
 
 class Stopper(Lines):
     points = copy(Lines.points)
-    points.default = [(0,2),(2,0),(7,0),(9,2),
-                      (9,7),(7,9),(2,9),(0,7)]
+    points.default = as_points([(0,2),(2,0),(7,0),(9,2),
+                                (9,7),(7,9),(2,9),(0,7)])
 
 class Camera(Lines): 
     points = copy(Lines.points)
-    points.default = [(0,0),(4,0),(2,2),(4,2),
-                      (4,6),(0,6),(0,2),(2,2)]
+    points.default = as_points([(0,0),(4,0),(2,2),(4,2),
+                                (4,6),(0,6),(0,2),(2,2)])
 
 class Circle(Shape):
     widgetClass = 'activeCircleClass'
@@ -17,6 +17,7 @@ import logging
 from ..widget  import Widget
 from ..utils   import pedlproperty, Font
 from ..choices import AlignmentChoice, FontChoice, ColorChoice
+from ..metrics import fit_text
 
 logger = logging.getLogger(__name__)
 
@@ -47,3 +48,24 @@ class StaticText(Widget):
 
     font = pedlproperty(Font.is_font, default=Font(size=12),
                         doc= 'Font as indicated by :class:`.Font`')
+
+
+    def fit(self, padding=2):
+        """
+        Resize the widget to fit the text
+
+        The size is calculated from the metrics of the font, so EDM does not
+        need to be opened to check the result
+
+        Parameters
+        ----------
+        padding : int, optional
+            Space to leave on each side of the text
+
+        Returns
+        -------
+        dimension : tuple
+            New width and height of the widget
+        """
+        fit_text([self], padding=padding)
+        return self.w, self.h
@@ -11,4 +11,6 @@ setup(name    = 'pedl',
       packages    = find_packages(),
       description = 'Qt Inspired Wrapper for creation of EDM files',
       include_package_data = True,
+      python_requires      = '>=3.7',
+      entry_points = {'console_scripts' : ['pedl = pedl.cli:main']},
     )
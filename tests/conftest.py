@@ -1,5 +1,11 @@
+import os
+import sys
+import stat
+import time
 import logging
 
+import pytest
+
 #Configure Logging
 logging.getLogger('pedl').setLevel(logging.DEBUG)
 logging.basicConfig()
@@ -45,3 +51,61 @@ w 0
 h 0
 endObjectProperties"""
 
+
+#Stand-in for EDM, which records each request and the title of the screen it
+#was given. The first instance stays open as the server, recording its
+#process id, while later instances started with -oneInst hand over their file
+#and exit
+fake_edm = """\
+#!{python}
+import os, sys, time
+log, pid = os.environ['FAKE_EDM_LOG'], os.environ['FAKE_EDM_PID']
+title = ''
+if os.path.exists(sys.argv[-1]):
+    with open(sys.argv[-1]) as f:
+        title = [l for l in f if l.startswith('title')][0].split('"')[1]
+with open(log, 'a') as f:
+    f.write(' '.join(sys.argv[1:-1] + [title]) + '\\n')
+if '-oneInst' in sys.argv and os.path.exists(pid):
+    sys.exit(0)
+with open(pid, 'w') as f:
+    f.write(str(os.getpid()))
+time.sleep(float(os.environ.get('FAKE_EDM_TIME', 30)))
+"""
+
+
+class FakeEDM:
+    """
+    Files written by the stand-in for EDM
+    """
+    def __init__(self, directory):
+        self.log = os.path.join(directory, 'edm.log')
+        self.pid = os.path.join(directory, 'edm.pid')
+
+
+    def requests(self, count):
+        """
+        Wait for a number of requests to reach EDM
+        """
+        for i in range(100):
+            if os.path.exists(self.log):
+                with open(self.log) as f:
+                    lines = f.read().splitlines()
+                if len(lines) >= count:
+                    return lines
+            time.sleep(0.05)
+        raise TimeoutError('EDM received too few requests')
+
+
+@pytest.fixture(scope='function')
+def edm(tmpdir, monkeypatch):
+    path = os.path.join(str(tmpdir), 'edm')
+    with open(path, 'w') as f:
+        f.write(fake_edm.format(python=sys.executable))
+    os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+
+    fake = FakeEDM(str(tmpdir))
+    monkeypatch.setenv('PATH', str(tmpdir) + os.pathsep + os.environ['PATH'])
+    monkeypatch.setenv('FAKE_EDM_LOG', fake.log)
+    monkeypatch.setenv('FAKE_EDM_PID', fake.pid)
+    return fake
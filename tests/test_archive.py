@@ -0,0 +1,100 @@
+############
+# Standard #
+############
+import os
+import json
+import tarfile
+
+###############
+# Third Party #
+###############
+import pytest
+
+##########
+# Module #
+##########
+from pedl.archive import Archive, extract, members, manifest, zstandard
+
+screens = {'panels/a.edl': 'screen a\n',
+           'panels/b.edl': 'screen b\n',
+           'top.edl'     : 'top'}
+
+
+@pytest.mark.parametrize('ext', ['.tar', '.tar.gz', '.tgz', '.tar.xz',
+                                 '.zip', '.tar.zst'])
+def test_archive(tmpdir, ext):
+    if ext == '.tar.zst' and zstandard is None:
+        pytest.skip('zstandard is not installed')
+
+    path = os.path.join(str(tmpdir), 'screens' + ext)
+
+    with Archive(path) as archive:
+        for name, text in screens.items():
+            archive.add(name, text)
+
+    contents = dict(members(path))
+    assert list(contents) == list(screens) + [manifest]
+    assert json.loads(contents[manifest].decode())[0]['size'] == 9
+
+    #Only screens that changed are written
+    out = os.path.join(str(tmpdir), 'out')
+    assert extract(path, out) == list(screens)
+    assert extract(path, out) == []
+
+    with open(os.path.join(out, 'panels', 'b.edl'), 'w') as f:
+        f.write('edited\n')
+
+    assert extract(path, out) == ['panels/b.edl']
+    with open(os.path.join(out, 'panels', 'b.edl')) as f:
+        assert f.read() == 'screen b\n'
+
+
+def test_archive_errors(tmpdir):
+    with pytest.raises(ValueError):
+        Archive(os.path.join(str(tmpdir), 'screens.rar'))
+
+    path = os.path.join(str(tmpdir), 'screens.tar')
+    with pytest.raises(ValueError):
+        with Archive(path) as archive:
+            archive.add('../escape.edl', 'outside')
+
+    #Screens that do not match the manifest are reported
+    with Archive(path) as archive:
+        archive.add('a.edl', 'screen a')
+        archive.entries[0]['size'] = 1
+
+    #Nothing is written unless the whole archive matches
+    out = os.path.join(str(tmpdir), 'out')
+    with pytest.raises(ValueError):
+        extract(path, out)
+    assert os.listdir(out) == []
+
+    #Every screen needs a manifest
+    with tarfile.open(path, 'w') as archive:
+        archive.add(__file__, 'a.edl')
+    with pytest.raises(ValueError):
+        extract(path, out)
+    assert os.listdir(out) == []
+
+
+def test_extract_mode(tmpdir):
+    path = os.path.join(str(tmpdir), 'screens.tar.gz')
+    out  = os.path.join(str(tmpdir), 'out')
+    with Archive(path) as archive:
+        archive.add('a.edl', 'screen a')
+        archive.add('b.edl', 'screen b')
+
+    os.makedirs(out)
+    with open(os.path.join(out, 'b.edl'), 'w') as f:
+        f.write('old')
+    os.chmod(os.path.join(out, 'b.edl'), 0o664)
+
+    umask = os.umask(0o022)
+    try:
+        assert extract(path, out) == ['a.edl', 'b.edl']
+    finally:
+        os.umask(umask)
+
+    assert os.stat(os.path.join(out, 'a.edl')).st_mode & 0o777 == 0o644
+    assert os.stat(os.path.join(out, 'b.edl')).st_mode & 0o777 == 0o664
+    assert sorted(os.listdir(out)) == ['a.edl', 'b.edl']
@@ -0,0 +1,71 @@
+############
+# Standard #
+############
+import os
+import time
+import asyncio
+
+###############
+# Third Party #
+###############
+import pytest
+
+##########
+# Module #
+##########
+import pedl
+
+
+
+def screen(i):
+    d = pedl.Designer()
+    d.window.name = 'Screen {}'.format(i)
+    d.addWidget(pedl.widgets.Rectangle(x=i, y=i, w=10, h=10))
+    return d
+
+
+def test_save_async(tmpdir):
+    screens = {os.path.join(str(tmpdir), '{}.edl'.format(i)): screen(i)
+               for i in range(20)}
+
+    async def save():
+        return await asyncio.gather(*[d.save_async(path, only_changed=True)
+                                      for (path, d) in screens.items()])
+
+    assert asyncio.run(save()) == [True]*20
+    assert asyncio.run(save()) == [False]*20
+
+    for path, d in screens.items():
+        assert open(path).read() == d.dumps()
+
+
+def test_launch_async(tmpdir, edm, monkeypatch):
+    path = os.path.join(str(tmpdir), 'screen.edl')
+    screen(0).save(path)
+
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(pedl.launch_async('NOT.edl'))
+
+    #Wait for EDM to close
+    monkeypatch.setenv('FAKE_EDM_TIME', '0.1')
+    proc = asyncio.run(pedl.launch_async(path))
+    assert proc.returncode == 0
+
+    #Cancellation terminates EDM
+    monkeypatch.setenv('FAKE_EDM_TIME', '30')
+
+    async def cancel():
+        task = asyncio.ensure_future(pedl.launch_async(path, MACRO='TST'))
+        while not os.path.exists(edm.pid):
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    os.remove(edm.pid)
+    start = time.monotonic()
+    asyncio.run(cancel())
+    assert time.monotonic() - start < 10
+    pid = int(open(edm.pid).read())
+    with pytest.raises(ProcessLookupError):
+        os.kill(pid, 0)
@@ -0,0 +1,181 @@
+############
+# Standard #
+############
+import os
+import sys
+import json
+
+###############
+# Third Party #
+###############
+import pytest
+
+##########
+# Module #
+##########
+import pedl
+from pedl.cli import main
+from pedl.build import build
+from pedl.factory import registry
+from pedl.archive import members, manifest
+
+screens = """\
+import pedl
+
+@pedl.factory('panels/{name}.edl')
+def {name}():
+    d = pedl.Designer()
+    d.window.name = '{name}'
+    d.addWidget(pedl.widgets.Rectangle(x=10, y=10, w={size}, h={size}))
+    return d
+"""
+
+broken = """\
+import pedl
+
+@pedl.factory()
+def broken():
+    raise RuntimeError('Missing device')
+"""
+
+
+@pytest.fixture(scope='function')
+def sources(tmpdir):
+    src = os.path.join(str(tmpdir), 'src')
+    os.makedirs(src)
+    path = os.path.join(src, 'built_screens.py')
+
+    with open(path, 'w') as f:
+        f.write('\n'.join(screens.format(name='s{}'.format(i), size=10 + i)
+                          for i in range(6)))
+
+    with open(os.path.join(src, 'built_broken.py'), 'w') as f:
+        f.write(broken)
+
+    yield src
+
+    for name in [m for m in sys.modules if m.startswith('built_')]:
+        del sys.modules[name]
+    for path in [p for (p, f) in registry.items()
+                 if f.module.startswith('built_')]:
+        del registry[path]
+    sys.path.remove(src)
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_build(sources, tmpdir, workers):
+    out = os.path.join(str(tmpdir), 'out')
+    module = os.path.join(sources, 'built_screens.py')
+    summary = build([module], directory=out, workers=workers)
+    assert summary['total'] == 6
+    assert summary['written'] == 6
+    assert summary['failed'] == 0
+    assert [r['path'] for r in summary['screens']] == \
+           ['panels/s{}.edl'.format(i) for i in range(6)]
+    assert sorted(os.listdir(os.path.join(out, 'panels'))) == \
+           ['s{}.edl'.format(i) for i in range(6)]
+
+    #Unchanged screens are not written again
+    summary = build([module], directory=out, workers=workers)
+    assert summary['written'] == 0
+    assert summary['bytes'] == sum(os.path.getsize(os.path.join(out, r['path']))
+                                   for r in summary['screens'])
+
+    #Stats does not write
+    summary = build([module], directory=out, mode='stats', workers=workers,
+                    force=True)
+    assert summary['written'] == 0
+    assert all(r['render'] >= 0 for r in summary['screens'])
+
+
+def test_build_renders_once(sources, tmpdir, monkeypatch):
+    calls  = list()
+    dumps  = pedl.Designer.dumps
+    module = os.path.join(sources, 'built_screens.py')
+
+    def counted(self, *args, **kwargs):
+        calls.append(self)
+        return dumps(self, *args, **kwargs)
+
+    monkeypatch.setattr(pedl.Designer, 'dumps', counted)
+
+    for force in (False, True):
+        del calls[:]
+        summary = build([module], directory=str(tmpdir), force=force)
+        assert summary['written'] == 6
+        assert len(calls) == 6
+
+
+def test_build_force_atomic(sources, tmpdir, monkeypatch):
+    module = os.path.join(sources, 'built_screens.py')
+    out    = str(tmpdir.join('out'))
+    build([module], directory=out)
+    screens = sorted(os.path.join(root, name)
+                     for (root, _, names) in os.walk(out) for name in names)
+    before  = [open(path).read() for path in screens]
+
+    #A failed write leaves the previous screens in place
+    def replace(src, dst):
+        raise OSError('No space left on device')
+
+    monkeypatch.setattr(os, 'replace', replace)
+    summary = build([module], directory=out, force=True, workers=1)
+    monkeypatch.undo()
+    assert summary['written'] == 0
+    assert all(r['error'] for r in summary['screens'])
+    assert sorted(os.path.join(root, name) for (root, _, names)
+                  in os.walk(out) for name in names) == screens
+    assert [open(path).read() for path in screens] == before
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_build_archive(sources, tmpdir, workers):
+    path    = os.path.join(str(tmpdir), 'screens.tar.gz')
+    module  = os.path.join(sources, 'built_screens.py')
+    summary = build([module], directory=str(tmpdir), workers=workers,
+                    archive=path)
+    assert summary['written'] == 6
+    assert os.listdir(str(tmpdir)) == ['src', 'screens.tar.gz']
+
+    contents = dict(members(path))
+    assert list(contents) == [r['path'] for r in summary['screens']] + \
+                             [manifest]
+    assert all(len(contents[r['path']]) == r['bytes']
+               for r in summary['screens'])
+
+    with pytest.raises(ValueError):
+        build([module], mode='check', archive=path)
+
+
+def test_cli(sources, tmpdir, capsys):
+    out     = os.path.join(str(tmpdir), 'out')
+    report  = os.path.join(str(tmpdir), 'summary.json')
+    module  = os.path.join(sources, 'built_screens.py')
+    failing = os.path.join(sources, 'built_broken.py')
+
+    assert main(['build', module, '-o', out, '-j', '2', '--json', report]) == 0
+    with open(report) as f:
+        assert json.load(f)['written'] == 6
+
+    assert main(['check', module]) == 0
+    capsys.readouterr()
+    assert main(['stats', module, '--json', '-']) == 0
+    summary = json.loads(capsys.readouterr().out)
+    assert summary['total'] == 6
+
+    #Archives are unpacked by extract
+    archive = os.path.join(str(tmpdir), 'screens.zip')
+    target  = os.path.join(str(tmpdir), 'target')
+    assert main(['build', module, '--archive', archive]) == 0
+    capsys.readouterr()
+    assert main(['extract', archive, '-o', target]) == 0
+    assert '6 screens written' in capsys.readouterr().out
+    assert sorted(os.listdir(os.path.join(target, 'panels'))) == \
+           ['s{}.edl'.format(i) for i in range(6)]
+
+    #Failures give a non-zero exit code
+    assert main(['build', module, failing, '-o', out]) == 1
+    assert 'broken.edl : RuntimeError: Missing device' in \
+           capsys.readouterr().err
+    assert main(['build', '-g', 'pedl.no.such.group']) == 1
+
@@ -40,6 +40,18 @@ def test_display():
     assert d.render(w) == display_edl
 
 
+def test_display_close_current():
+    d = pedl.Designer()
+    buttons = [pedl.widgets.RelatedDisplay(closeCurrent=c,
+                                           displays=[Display('first',
+                                                             'tests/test.edl',
+                                                             '')])
+               for c in (1, True)]
+    assert all(b.closeCurrent is True for b in buttons)
+    assert d.render(buttons[0]) == d.render(buttons[1])
+    assert 'closeAction' in d.render(buttons[0])
+
+
 def test_shell_command():
     w = pedl.widgets.ShellCommand(x=116,y=416,w=156,h=64,
                                     label='Shell',
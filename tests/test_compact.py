@@ -0,0 +1,99 @@
+############
+# Standard #
+############
+import os
+
+###############
+# Third Party #
+###############
+
+##########
+# Module #
+##########
+import pedl
+from pedl import Visibility
+from pedl.choices import ColorChoice
+from pedl.parser import parse_edl
+from pedl.compact import minify, restore, defaults
+from pedl.widgets.shape import Lines
+from pedl.widgets import (StaticText, Rectangle, Circle, MessageButton,
+                          MenuButton, ShellCommand, RelatedDisplay)
+
+
+def screen():
+    d = pedl.Designer()
+    d.window.name = 'Compact'
+    d.addWidget(StaticText(x=5, y=5, w=100, h=20, text='Label',
+                           alignment='left'))
+    d.addWidget(StaticText(x=5, y=30, w=100, h=20, text='Filled',
+                           fill=ColorChoice.Red))
+    d.addWidget(Rectangle(x=5, y=55, w=50, h=50, fill=ColorChoice.Green,
+                          visibility=Visibility(pv='TST:VIS', max=1)))
+    d.addWidget(Circle(x=60, y=55, w=50, h=50, lineWidth=3))
+    d.addWidget(Circle(x=120, y=55, w=50, h=50))
+    d.addWidget(Lines(points=[(5, 215), (100, 215)]))
+    d.addWidget(MessageButton(x=5, y=110, w=80, h=20, controlPv='TST:PV',
+                              value=1, label='Press'))
+    d.addWidget(MenuButton(x=5, y=135, w=80, h=20, controlPv='TST:ENUM'))
+    d.addWidget(ShellCommand(x=5, y=160, w=80, h=20,
+                             commands=[('List', 'ls -l')]))
+    d.addWidget(RelatedDisplay(x=5, y=185, w=80, h=20,
+                               displays=['related.edl']))
+    return d
+
+
+def test_minify():
+    text = '\n'.join(['# (Label)',
+                      'object activeXTextClass',
+                      'beginObjectProperties',
+                      'major 4',
+                      'fontAlign "left"',
+                      'value {',
+                      '  "1"',
+                      '}',
+                      'bgColor index 0',
+                      'lineWidth 1',
+                      'endObjectProperties',
+                      ''])
+    assert minify(text) == '\n'.join(['object activeXTextClass',
+                                      'beginObjectProperties',
+                                      'major 4',
+                                      'value {',
+                                      '  "1"',
+                                      '}',
+                                      'bgColor index 0',
+                                      'lineWidth 1',
+                                      'endObjectProperties'])
+
+
+def test_compact(tmpdir):
+    d = screen()
+    full, small = d.dumps(), d.dumps(compact=True)
+    assert len(small) < len(full)
+    assert '# (' not in small
+    assert d.dumps(workers=2, compact=True) == small
+
+    #EDM reads the same objects from either file
+    screen_full,  objects_full  = parse_edl(full)
+    screen_small, objects_small = parse_edl(small)
+    assert screen_small == screen_full
+    assert len(objects_small) == len(objects_full) == 10
+
+    for a, b in zip(objects_full, objects_small):
+        assert a.widgetClass == b.widgetClass
+        assert dict(restore(b.widgetClass, b.properties)) == dict(a.properties)
+
+    #Every default is written by the templates and removed from the output
+    for widgetClass, props in defaults.items():
+        for key, value in props.items():
+            full_values  = [o.properties.get(key) for o in objects_full
+                            if o.widgetClass == widgetClass]
+            small_values = [o.properties.get(key) for o in objects_small
+                            if o.widgetClass == widgetClass]
+            assert value.strip('"') in full_values
+            assert value.strip('"') not in small_values
+
+    path = os.path.join(str(tmpdir), 'compact.edl')
+    d.save(path, compact=True)
+    with open(path, 'r') as f:
+        assert f.read() == small
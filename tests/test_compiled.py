@@ -0,0 +1,124 @@
+############
+# Standard #
+############
+import os
+import sys
+import pickle
+
+###############
+# Third Party #
+###############
+import pytest
+
+##########
+# Module #
+##########
+import pedl
+from pedl import Param
+from pedl.build import build
+from pedl.factory import registry
+from pedl.choices import ColorChoice
+from pedl.widgets import Rectangle, StaticText
+
+
+def panel(prefix, color):
+    d = pedl.Designer()
+    d.window.name = '{} Overview'.format(prefix)
+    d.addWidget(StaticText(x=5, y=5, w=100, h=20, text=prefix))
+    d.addWidget(Rectangle(x=5, y=30, w=50, h=50, fill=color,
+                          alarmPV='{}:STATE'.format(prefix)))
+    return d
+
+
+def test_compile():
+    screen = panel('$(P)', Param('COLOR')).compile(['P', 'COLOR'])
+    assert screen.valid
+    assert screen.objects == 2
+
+    expected = panel('VGC:01', ColorChoice.Green).dumps()
+    assert screen.render(P='VGC:01', COLOR=ColorChoice.Green) == expected
+    assert screen.bind(P='VGC:01').bind(COLOR=16).dumps() == expected
+
+    #Parameters that are not given are left for EDM
+    text = screen.render(COLOR=ColorChoice.Green)
+    assert text == panel('$(P)', ColorChoice.Green).dumps()
+
+    with pytest.raises(TypeError):
+        screen.render(Q='VGC:01')
+
+    #Screens can be sent to other processes
+    copy = pickle.loads(pickle.dumps(screen))
+    assert copy.render(P='VGC:01', COLOR=ColorChoice.Green) == expected
+
+
+def test_save_atomic(tmpdir, monkeypatch):
+    screen = panel('$(P)', ColorChoice.Green).compile(['P'])
+    path   = os.path.join(str(tmpdir), 'screen.edl')
+    assert screen.save(path, P='VGC:01')
+    os.chmod(path, 0o664)
+
+    #A failed write leaves the previous screen in place
+    def replace(src, dst):
+        raise OSError('No space left on device')
+
+    monkeypatch.setattr(os, 'replace', replace)
+    with pytest.raises(OSError):
+        screen.save(path, P='VGC:02')
+    monkeypatch.undo()
+    assert os.listdir(str(tmpdir)) == ['screen.edl']
+    assert open(path).read() == screen.render(P='VGC:01')
+
+    #Permissions are kept
+    assert screen.save(path, P='VGC:02')
+    assert open(path).read() == screen.render(P='VGC:02')
+    assert os.stat(path).st_mode & 0o777 == 0o664
+
+
+family = """\
+import pedl
+from pedl.widgets import Rectangle, StaticText
+
+@pedl.family('valves/{{P}}.edl', [{{'P': 'VGC:{{:02}}'.format(i)}}
+                                  for i in range({count})])
+def valve():
+    d = pedl.Designer()
+    d.window.name = '$(P)'
+    d.addWidget(Rectangle(x=5, y=5, w=50, h=50))
+    d.addWidget(StaticText(x=5, y=60, w=100, h=20, text='$(P):STATE'))
+    return d
+"""
+
+
+@pytest.fixture(scope='function')
+def module(tmpdir):
+    src  = os.path.join(str(tmpdir), 'src')
+    path = os.path.join(src, 'compiled_family.py')
+    os.makedirs(src)
+
+    with open(path, 'w') as f:
+        f.write(family.format(count=40))
+
+    yield path
+
+    sys.modules.pop('compiled_family', None)
+    for key in [p for (p, f) in registry.items()
+                if f.module == 'compiled_family']:
+        del registry[key]
+    sys.path.remove(src)
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_family(module, tmpdir, workers):
+    out = os.path.join(str(tmpdir), 'out')
+    summary = build([module], directory=out, workers=workers)
+    assert summary['total'] == summary['written'] == 40
+    assert summary['failed'] == 0
+
+    with open(os.path.join(out, 'valves', 'VGC:07.edl')) as f:
+        text = f.read()
+
+    assert 'title "VGC:07"' in text
+    assert 'VGC:07:STATE' in text
+    assert '$(P)' not in text
+
+    assert build([module], mode='check')['failed'] == 0
@@ -7,6 +7,7 @@ import pedl
 import conftest
 import tempfile
 from pedl.choices import FontChoice
+from pedl.widgets.shape import Lines
 
 
 requires_edm = pytest.mark.skipif(find_executable('edm') == None,
@@ -91,3 +92,120 @@ def test_exec():
 
 
 
+
+
+def test_scaled():
+    d = pedl.Designer()
+    l = pedl.HBoxLayout()
+    l.addWidget(pedl.widgets.StaticText(text='Label', w=100, h=25))
+    l.addWidget(pedl.widgets.Rectangle(w=51, h=25, lineWidth=2))
+    d.window.setLayout(l, resize=True)
+    line = pedl.widgets.shape.Lines(points=[(10, 10), (20, 30)])
+    d.addWidget(line)
+
+    s = d.scaled(2)
+    assert s.window.parent is s
+    assert s.env is d.env
+    assert (s.window.w, s.window.h) == (2*d.window.w, 2*d.window.h)
+
+    text, rect = s.widgets[0].widgets
+    assert text.geometry == (10, 10, 200, 50)
+    assert rect.geometry == (220, 10, 102, 50)
+    assert rect.lineWidth == 2
+    assert text.font.size == 24
+    assert s.widgets[1].points.tolist() == [[20, 20], [40, 60]]
+
+    #Original is unchanged
+    assert d.widgets[0].widgets[0].geometry == (5, 5, 100, 25)
+    assert d.widgets[0].widgets[0].font.size == 12
+    assert line.points.tolist() == [[10, 10], [20, 30]]
+
+    #Neighbouring widgets still touch after rounding
+    d = pedl.Designer()
+    d.addWidget(pedl.widgets.Rectangle(x=0,  y=0, w=33, h=33))
+    d.addWidget(pedl.widgets.Rectangle(x=33, y=0, w=33, h=33))
+    a, b = d.scaled(1.5).widgets
+    assert a.right == b.x
+
+
+def test_save_variants(tmpdir):
+    d = pedl.Designer()
+    d.addWidget(pedl.widgets.Rectangle(x=10, y=10, w=50, h=50))
+    path  = os.path.join(str(tmpdir), 'screen.edl')
+    paths = d.save_variants(path, {'_hd' : 1, '_4k' : 2})
+    assert paths['_4k'].endswith('screen_4k.edl')
+
+    with open(paths['_4k']) as f:
+        assert pedl.utils.find_screen_size(f) == (1500, 2200)
+
+
+def test_save_variants_render_once(tmpdir, monkeypatch):
+    d = pedl.Designer()
+    l = pedl.VBoxLayout(spacing=7)
+    l.addWidget(pedl.widgets.StaticText(text='Label', w=101, h=25))
+    l.addWidget(pedl.widgets.MessageButton(label='Go', w=67, h=33))
+    l.addWidget(pedl.widgets.RelatedDisplay(label='More', w=67, h=33))
+    l.addWidget(pedl.widgets.Circle(w=23, h=23, lineWidth=3))
+    d.window.setLayout(l, resize=True)
+    d.addWidget(Lines(points=[(11, 13), (27, 41), (3, 39)]))
+    d.addWidget(pedl.widgets.Rectangle(x=-5, y=7, w=33, h=17))
+    variants = {'_small' : 0.75, '_hd' : 1, '_wide' : 1.5, '_4k' : 2}
+    expected = {suffix : d.scaled(factor).dumps()
+                for (suffix, factor) in variants.items()}
+
+    renders = list()
+    dumps   = pedl.Designer.dumps
+    monkeypatch.setattr(pedl.Designer, 'dumps',
+                        lambda self, **kw: renders.append(self)
+                                           or dumps(self, **kw))
+    paths = d.save_variants(os.path.join(str(tmpdir), 'screen.edl'),
+                            variants)
+    assert renders == [d]
+
+    for suffix, path in paths.items():
+        with open(path) as f:
+            assert f.read() == expected[suffix]
+
+
+def test_scaled_spacing():
+    d = pedl.Designer()
+    l = pedl.HBoxLayout(spacing=5)
+    l.addWidget(pedl.widgets.Rectangle(w=50, h=25))
+    l.addWidget(pedl.widgets.Rectangle(w=50, h=25))
+    d.window.setLayout(l, resize=True)
+    s = d.scaled(2)
+    layout = s.widgets[0]
+    assert layout.spacing == 10
+    assert s.window.margin == 10
+    a, b = layout.widgets
+    assert b.x - a.right == 10
+
+    #Arranging the copy again keeps the scale
+    layout.shuffle()
+    assert b.x - a.right == 10
+    assert b.x == 120
+    assert d.widgets[0].spacing == 5
+    assert d.window.margin == 5
+
+
+def test_dump_workers():
+    d = pedl.Designer()
+    outer = pedl.VBoxLayout()
+    for i in range(50):
+        row = pedl.HBoxLayout()
+        for j in range(10):
+            row.addWidget(pedl.widgets.StaticText(text='{}:{}'.format(i, j),
+                                                  w=40, h=20))
+        row.addWidget(pedl.widgets.Rectangle(w=10, h=10))
+        outer.addLayout(row)
+    d.window.setLayout(outer, resize=True)
+    d.addWidget(Lines(points=[(0, 0), (5, 5), (10, 0)]))
+    d.addWidget(pedl.VBoxLayout())
+
+    serial = d.dumps()
+    assert d.dumps(workers=4) == serial
+    assert d.dumps(workers=64) == serial
+
+    path = os.path.join(tempfile.mkdtemp(), 'screen.edl')
+    d.save(path, workers=3)
+    assert open(path).read() == serial
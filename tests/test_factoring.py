@@ -0,0 +1,97 @@
+############
+# Standard #
+############
+
+###############
+# Third Party #
+###############
+
+##########
+# Module #
+##########
+import pedl
+from pedl import Visibility, VBoxLayout, HBoxLayout, GridLayout
+from pedl.factoring import macros, report
+from pedl.widgets import (Rectangle, StaticText, MessageButton,
+                          EmbeddedWindow)
+
+
+def panel(device):
+    v = VBoxLayout()
+    v.addWidget(StaticText(w=100, h=20, text='Valve'))
+    v.addWidget(Rectangle(w=50, h=50,
+                          visibility=Visibility(pv=device + ':STATE', max=1)))
+    h = HBoxLayout()
+    h.addWidget(MessageButton(w=40, h=20, controlPv=device + ':OPEN',
+                              value=1, label='Open'))
+    h.addWidget(MessageButton(w=40, h=20, controlPv=device + ':CLOSE',
+                              value=1, label='Close'))
+    v.addLayout(h)
+    return v
+
+
+def screen(count):
+    d = pedl.Designer()
+    g = GridLayout(cols=4)
+
+    for i in range(count):
+        g.addLayout(panel('VGC:{:02}'.format(i)))
+
+    d.window.setLayout(g, resize=True)
+    return d
+
+
+def test_macros():
+    templates, values = macros([['A:1:X', 'LOC', 'B:1'],
+                                ['A:2:X', 'LOC', 'B:2']])
+    assert templates == ['$(P1):X', 'LOC', '$(P2)']
+    assert values == [{'P1': 'A:1', 'P2': 'B:1'},
+                      {'P1': 'A:2', 'P2': 'B:2'}]
+
+    #PVs of the same device share a macro
+    templates, values = macros([['A:1:X', 'A:1:Y'], ['A:2:X', 'A:2:Y']])
+    assert templates == ['$(P):X', '$(P):Y']
+    assert values == [{'P': 'A:1'}, {'P': 'A:2'}]
+
+
+def test_factor():
+    d = screen(8)
+    before = d.dumps()
+    screens = d.factor('vacuum')
+    assert list(screens) == ['vacuum.edl', 'vacuum_shared1.edl']
+
+    #The original screen is untouched
+    assert d.dumps() == before
+
+    main, shared = screens.values()
+    windows = main.findChildren()
+    assert len(windows) == 8
+    assert all(isinstance(w, EmbeddedWindow) for w in windows)
+    assert windows[3].displays[0].macros == 'P=VGC:03'
+    assert windows[3].geometry == d.widgets[0].widgets[3].geometry
+
+    #Substituting the macros gives the contents of the original layout
+    original = panel('VGC:03')
+    original.x, original.y = 0, 0
+    text = '\n\n'.join(shared.render(w) for w in shared.widgets)
+    assert '$(P):STATE' in text
+    assert text.replace('$(P)', 'VGC:03') == d.render(original)
+    assert (shared.window.w, shared.window.h) == (original.w, original.h)
+
+    summary = report(d, screens)
+    assert summary.uses == {'vacuum_shared1.edl': 8}
+    assert summary.before == len(before.encode())
+    assert 0 < summary.after < summary.before
+    assert 'vacuum_shared1.edl embedded 8 times' in str(summary)
+
+
+def test_factor_count():
+    d = screen(2)
+    #A layout must repeat enough times to be shared
+    assert list(d.factor('vacuum', count=3)) == ['vacuum.edl']
+    assert list(d.factor('vacuum', widgets=5)) == ['vacuum.edl']
+
+    #Only the outermost repeated layout is shared
+    screens = d.factor('vacuum')
+    assert len(screens) == 2
+    assert len(screens['vacuum_shared1.edl'].widgets) == 4
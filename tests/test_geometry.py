@@ -0,0 +1,65 @@
+import copy
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pedl
+from pedl.geometry import GeometryStore, store
+from pedl.spatial  import SpatialIndex
+
+def test_store():
+    s = GeometryStore(capacity=2)
+    slots = [s.allocate() for i in range(5)]
+    assert slots == [0, 1, 2, 3, 4]
+    assert s.data.shape == (4, 8)
+    s.axis('w')[3] = 10
+    assert s.data[2, 3] == 10
+    s.release(3)
+    assert len(s) == 4
+    assert s.allocate() == 3
+    assert s.data[2, 3] == 0
+
+def test_store_threads():
+    s = GeometryStore(capacity=2)
+
+    def churn(i):
+        slots = [s.allocate() for j in range(200)]
+        for slot in slots[::2]:
+            s.release(slot)
+        return slots[1::2]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        kept = [slot for slots in pool.map(churn, range(16))
+                     for slot in slots]
+
+    #No slot is given out twice
+    assert len(set(kept)) == len(kept) == len(s)
+    assert s.size == len(s) + len(s.free)
+    assert not set(kept) & set(s.free)
+
+def test_read_through():
+    w = pedl.Widget(x=1, y=2, w=3, h=4)
+    assert 'x' not in w.attributes
+    assert tuple(store.data[:, w._slot]) == (1, 2, 3, 4)
+    store.data[0, w._slot] = 10
+    assert w.x == 10
+    w.h = 20
+    assert store.axis('h')[w._slot] == 20
+    assert w.geometry == (10, 2, 3, 20)
+
+def test_copies():
+    w = pedl.widgets.Rectangle(x=1, y=2, w=3, h=4)
+    for c in (copy.copy(w), copy.deepcopy(w), pickle.loads(pickle.dumps(w))):
+        assert c._slot != w._slot
+        assert c.geometry == w.geometry
+        c.x = 100
+        assert w.x == 1
+
+def test_vectorized_layout_notifies():
+    l = pedl.HBoxLayout()
+    widgets = [pedl.Widget(w=10, h=10) for i in range(3)]
+    for w in widgets:
+        l.addWidget(w)
+    index = SpatialIndex(widgets)
+    l.spacing = 20
+    assert [w.x for w in widgets] == [0, 30, 60]
+    assert index.at(65, 5) == [widgets[2]]
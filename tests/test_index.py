@@ -0,0 +1,99 @@
+############
+# Standard #
+############
+import os.path
+import shutil
+
+###############
+# Third Party #
+###############
+import pytest
+
+##########
+# Module #
+##########
+import pedl
+from pedl.index import ObjectIndex
+
+@pytest.fixture(scope='function')
+def edl(tmpdir):
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        'test.edl')
+    tmp  = str(tmpdir.join('test.edl'))
+    shutil.copy(path, tmp)
+    return tmp
+
+def test_build(edl):
+    index = ObjectIndex.build(edl)
+    assert len(index) == 4
+    assert index.find(name='Circle') == [2, 3]
+    assert index.find(widgetClass='activeRectangleClass') == [0, 1]
+    assert index.read(0).startswith('# (Rectangle)\nobject activeRectangleClass')
+    assert index.read(0).endswith('endObjectProperties')
+
+def test_cache(edl):
+    index = ObjectIndex.load(edl)
+    assert os.path.exists(edl + '.idx')
+    assert ObjectIndex.load(edl).blocks == index.blocks
+
+    #Modification invalidates cache
+    with open(edl, 'a') as f:
+        f.write('\n')
+    assert ObjectIndex.load(edl).stamp != index.stamp
+
+def test_patch_in_place(edl):
+    index = ObjectIndex.load(edl)
+    text  = index.read(1).replace('fillColor index 92',
+                                  'fillColor index 93')
+    index = index.patch({1 : text})
+    assert index.read(1) == text
+    assert ObjectIndex.build(edl).blocks == index.blocks
+
+def test_patch_resize(edl):
+    index = ObjectIndex.load(edl)
+    last  = index.read(3)
+    w     = pedl.widgets.Rectangle(name='Replaced', w=10, h=10)
+    text  = pedl.Designer().render(w)
+    index = index.patch({0 : text})
+    assert index.read(0) == text
+    assert index.read(3) == last
+    assert ObjectIndex.build(edl).blocks == index.blocks
+    assert ObjectIndex.load(edl).blocks  == index.blocks
+
+    #Stale indices are refused
+    with open(edl, 'a') as f:
+        f.write('\n\n')
+    with pytest.raises(ValueError):
+        index.patch({0 : text})
+
+
+@pytest.fixture(scope='function')
+def group(tmpdir):
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        'group.edl')
+    tmp  = str(tmpdir.join('group.edl'))
+    shutil.copy(path, tmp)
+    return tmp
+
+
+def test_build_group(group):
+    index = ObjectIndex.build(group)
+    assert [b.widgetClass for b in index.blocks] == ['activeGroupClass',
+                                                     'activeCircleClass']
+    text = index.read(0)
+    assert text.startswith('# (Group)\nobject activeGroupClass')
+    assert text.endswith('visMax "1"\nendObjectProperties')
+    assert text.count('endGroup') == 2
+
+
+def test_patch_group(group):
+    index = ObjectIndex.load(group)
+    text  = index.read(0).replace('VGC:01', 'VGC:002')
+    os.chmod(group, 0o644)
+    index = index.patch({0 : text})
+    assert index.read(0) == text
+    assert index.read(1).startswith('# (Circle)')
+    assert ObjectIndex.build(group).blocks == index.blocks
+
+    #Permissions survive a copy of the file
+    assert os.stat(group).st_mode & 0o777 == 0o644
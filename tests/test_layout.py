@@ -1,3 +1,5 @@
+import os.path
+import random
 import pedl
 import pytest
 
@@ -286,3 +288,212 @@ def test_compound_layout():
 
 
 
+
+def test_grid_layout():
+    l = pedl.GridLayout(cols=2, spacing=10)
+    l.addWidget(pedl.Widget(w=50,  h=100))
+    l.addWidget(pedl.Widget(w=100, h=50))
+    l.addWidget(pedl.Widget(w=80,  h=20))
+    l.addWidget(pedl.Widget(w=20,  h=40))
+
+    #Widgets wrap after two columns
+    assert l.rowCount    == 2
+    assert l.columnCount == 2
+    assert [w.x for w in l.widgets] == [0, 90, 0, 90]
+    assert [w.y for w in l.widgets] == [0, 0, 110, 110]
+    assert l.w == 190
+    assert l.h == 150
+
+    #Per-cell alignment
+    AlignmentChoice = pedl.choices.AlignmentChoice
+    c = pedl.Widget(w=10, h=10)
+    l.addWidget(c, 0, 2, alignment=[AlignmentChoice.Right,
+                                    AlignmentChoice.Bottom])
+    assert (c.x, c.y) == (200, 90)
+    l.alignment = AlignmentChoice.Center
+    assert (l.widgets[2].x, l.widgets[2].y) == (0, 120)
+    assert (c.x, c.y) == (200, 90)
+
+    #Adjust Position
+    l.x = 100
+    l.y = 150
+    assert (l.widgets[0].x, l.widgets[0].y) == (115, 150)
+    assert (c.x, c.y) == (300, 240)
+    assert l.x == 100
+    assert l.y == 150
+
+
+def test_grid_span():
+    l = pedl.GridLayout(spacing=10)
+    l.addWidget(pedl.Widget(w=50, h=10), 0, 0)
+    l.addWidget(pedl.Widget(w=50, h=10), 0, 1)
+    wide = pedl.Widget(w=200, h=10)
+    l.addWidget(wide, 1, 0, colSpan=2)
+
+    #Extra width is given to the last spanned column
+    assert l.widgets[1].x == 60
+    assert wide.x == 0
+    assert l.w == 200
+
+    #Spanning widgets that fit do not change the grid
+    l.widgets[1].w = 200
+    l.shuffle()
+    assert l.w == 260
+
+    with pytest.raises(ValueError):
+        l.addWidget(pedl.Widget(), 2, 0, rowSpan=0)
+
+    with pytest.raises(TypeError):
+        l.addWidget(4, 2, 0)
+    assert len(l.cells) == 3
+
+
+def test_grid_nested():
+    h = pedl.HBoxLayout()
+    h.addWidget(pedl.Widget(w=100, h=100))
+
+    g = pedl.GridLayout()
+    v = pedl.VBoxLayout()
+    v.addWidget(pedl.Widget(w=30, h=30))
+    v.addWidget(pedl.Widget(w=30, h=30))
+    g.addLayout(v, 0, 0)
+    g.addWidget(pedl.Widget(w=20, h=20), 0, 1)
+    h.addLayout(g)
+
+    #Grid is placed as a single unit
+    assert g.x == 105
+    assert v.x == 105
+    assert g.widgets[1].x == 140
+    assert h.w == 160
+
+    #Changes within the grid move the parent
+    v.spacing = 20
+    assert g.h == 80
+    assert h.h == 100
+
+
+def test_remove_widget():
+    l = pedl.HBoxLayout()
+    ws = [pedl.Widget(w=50, h=50) for i in range(3)]
+    for w in ws:
+        l.addWidget(w)
+
+    l.removeWidget(ws[1])
+    assert ws[1].parent is None
+    assert l.widgets == [ws[0], ws[2]]
+    assert ws[2].x == 55
+
+    with pytest.raises(ValueError):
+        l.removeWidget(ws[1])
+
+
+def test_flow_layout():
+    l = pedl.FlowLayout(maxWidth=200, spacing=10)
+    for w in (50, 50, 50, 100, 150, 20):
+        l.addWidget(pedl.Widget(w=w, h=w))
+
+    assert [w.x for w in l.widgets] == [0, 60, 120, 0, 0, 160]
+    assert [w.y for w in l.widgets] == [0, 0, 0, 60, 170, 170]
+    assert l.rowCount == 3
+    assert l.w == 180
+    assert l.h == 320
+
+    #Alignment within rows
+    l.alignment = pedl.choices.AlignmentChoice.Bottom
+    assert l.widgets[5].y == 300
+
+    #Changing the width reflows every row
+    l.maxWidth = 1000
+    assert l.rowCount == 1
+
+
+def test_flow_incremental():
+    random.seed(0)
+    l = pedl.FlowLayout(maxWidth=300)
+    for i in range(200):
+        if l.widgets and random.random() < 0.3:
+            l.removeWidget(random.choice(l.widgets))
+        else:
+            w = pedl.Widget(w=random.randint(10, 120),
+                            h=random.randint(10, 60))
+            l.insertWidget(random.randint(0, l.count), w)
+
+        #Incremental reflow matches arranging from the start
+        positions = [(w.x, w.y) for w in l.widgets]
+        starts    = list(l.starts)
+        l.shuffle()
+        assert positions == [(w.x, w.y) for w in l.widgets]
+        assert starts == l.starts
+
+
+def test_flow_window():
+    d = pedl.Designer()
+    d.window.w = 300
+    l = pedl.FlowLayout()
+    for i in range(10):
+        l.addWidget(pedl.Widget(w=100, h=20))
+
+    #Default width of a window
+    assert l.rowCount == 2
+
+    d.window.setLayout(l, resize=True)
+    assert l.maxWidth == 290
+    assert l.rowCount == 5
+    assert (l.x, l.y) == (5, 5)
+    assert d.window.w == 215
+
+
+def test_packed_layout():
+    l = pedl.PackedLayout(maxWidth=200, spacing=0)
+    l.addWidgets([pedl.Widget(w=100, h=50),  pedl.Widget(w=100, h=100),
+                  pedl.Widget(w=100, h=50),  pedl.Widget(w=200, h=20)])
+
+    #Tallest first, then in the order added
+    assert [(w.x, w.y) for w in l.widgets] == [(100, 0), (0, 0),
+                                               (100, 50), (0, 100)]
+    assert l.w == 200
+    assert l.h == 120
+
+    with pytest.raises(TypeError):
+        l.addWidgets([4])
+
+
+def test_packed_random():
+    random.seed(1)
+    l  = pedl.PackedLayout(maxWidth=1000)
+    ws = [pedl.Widget(w=random.randint(20, 300), h=random.randint(20, 200))
+          for i in range(500)]
+    l.addWidgets(ws)
+
+    assert not pedl.spatial.SpatialIndex(ws).overlaps()
+    assert l.w <= 1000
+    assert sum(w.w * w.h for w in ws) / (l.w * l.h) > 0.7
+
+
+def test_packed_display():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        'test.edl')
+    l   = pedl.PackedLayout(x=10, y=20)
+    emb = l.addDisplay(path)
+    assert (emb.w, emb.h) == (780, 1125)
+    assert (emb.x, emb.y) == (10, 20)
+
+    #Several displays are packed with a single rearrangement
+    shuffles = list()
+    l.shuffle = lambda : shuffles.append(None)
+    windows = l.addDisplays([path, path])
+    assert len(shuffles) == 1
+    assert l.widgets == [emb] + windows
+
+
+def test_fit_text():
+    l = pedl.VBoxLayout()
+    l.addWidget(pedl.widgets.StaticText(text='Valve'))
+    l.addWidget(pedl.widgets.StaticText(text='Turbo Pump'))
+    l.addWidget(pedl.Widget(w=10, h=10))
+    l.fitText(uniform=True)
+
+    short, long, other = l.widgets
+    assert short.w == long.w > 0
+    assert long.y == short.bottom + l.spacing
+    assert other.w == 10
@@ -0,0 +1,63 @@
+############
+# Standard #
+############
+
+###############
+# Third Party #
+###############
+import pytest
+
+##########
+# Module #
+##########
+import pedl
+from pedl.utils import Font
+from pedl.choices import FontChoice
+from pedl.metrics import measure, measure_many, fit_text
+
+
+@pytest.mark.parametrize('font', list(FontChoice))
+def test_every_face(font):
+    for bold in (False, True):
+        for italic in (False, True):
+            f = Font(size=18, bold=bold, italicized=italic, font=font)
+            w, h = measure('Beamline', f)
+            assert 50 < w < 150
+            assert 10 < h < 25
+
+
+def test_measure():
+    #Courier is fixed width
+    f = Font(size=10, font=FontChoice.Courier)
+    assert measure('abc', f)[0] == 18
+    assert measure('',    f)[0] == 0
+
+    #Sizes scale with the font
+    small, large = Font(size=12), Font(size=24)
+    assert measure('MFX:DG1', large)[0] in (2*measure('MFX:DG1', small)[0],
+                                            2*measure('MFX:DG1', small)[0] - 1)
+
+    #Characters outside the table
+    assert measure('μ', f) == measure('n', f)
+
+
+def test_measure_many():
+    f       = Font(size=14, bold=True)
+    strings = ['', 'A', 'Valve {}'.format(1), 'Long label for a device']
+    sizes   = measure_many(strings, f)
+    assert sizes.shape == (4, 2)
+    assert sizes.tolist() == [list(measure(s, f)) for s in strings]
+    assert measure_many([], f).shape == (0, 2)
+
+
+def test_fit_text():
+    labels = [pedl.widgets.StaticText(text='Short'),
+              pedl.widgets.StaticText(text='Much longer label',
+                                      font=Font(size=18))]
+    sizes = fit_text(labels, padding=0)
+    assert labels[0].w == measure('Short', Font(size=12))[0]
+    assert labels[1].h == measure('Much', Font(size=18))[1]
+
+    fit_text(labels, uniform=True)
+    assert labels[0].w == labels[1].w
+    assert labels[0].h == labels[1].h
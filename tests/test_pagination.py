@@ -0,0 +1,140 @@
+############
+# Standard #
+############
+import os.path
+
+###############
+# Third Party #
+###############
+import pytest
+
+##########
+# Module #
+##########
+import pedl
+from pedl.pagination import split, save_pages
+from pedl.parser import parse_edl
+
+
+def device(i):
+    l = pedl.HBoxLayout()
+    l.addWidget(pedl.widgets.StaticText(text='Device {}'.format(i),
+                                        w=100, h=20))
+    l.addWidget(pedl.widgets.Rectangle(w=20, h=20))
+    return l
+
+
+def test_split():
+    v = pedl.VBoxLayout()
+    for i in range(10):
+        v.addLayout(device(i))
+
+    #Four rows fit in 95 pixels
+    pages = split(v, 200, 95)
+    assert [p.count for p in pages] == [4, 4, 2]
+    assert all(p.h <= 95 for p in pages)
+    assert not v.widgets
+    assert pages[1].widgets[0].parent is pages[1]
+
+
+def test_split_oversize():
+    v = pedl.VBoxLayout()
+    v.addWidget(pedl.Widget(w=50, h=50))
+    v.addWidget(pedl.Widget(w=50, h=500))
+    v.addWidget(pedl.Widget(w=50, h=50))
+    assert [p.count for p in split(v, 100, 100)] == [1, 1, 1]
+
+
+def test_split_grid():
+    g = pedl.GridLayout(cols=2, spacing=10,
+                        alignment=pedl.choices.AlignmentChoice.Right)
+    widgets = list()
+    for i in range(3):
+        label = pedl.widgets.StaticText(text='Device {}'.format(i),
+                                        w=100, h=20)
+        g.addWidget(label, i, 0)
+        g.addWidget(pedl.widgets.Rectangle(w=20, h=20), i, 1,
+                    alignment=pedl.choices.AlignmentChoice.Left)
+        widgets.append(label)
+
+    #A widget spanning both columns stays in a single row
+    wide = pedl.Widget(w=200, h=20)
+    g.addWidget(wide, 3, 0, colSpan=2)
+
+    pages = split(g, 300, 50)
+    assert [p.count for p in pages] == [4, 3]
+    assert all(isinstance(p, pedl.GridLayout) for p in pages)
+    assert all(p.cols == 2 and p.spacing == 10 for p in pages)
+    assert pages[0].alignment is not pages[1].alignment
+    assert not g.cells
+
+    second = pages[1]
+    assert second.cells[widgets[2]].row == 0
+    assert second.cells[wide] == (1, 0, 1, 2, None)
+    assert second.rowCount == 2
+    assert second.columnCount == 2
+
+    #Columns still line up, and each cell keeps its alignment
+    label, rect = second.widgets[:2]
+    assert rect.x == label.right + 10
+    assert wide.y == label.bottom + 10
+
+    #Widgets added later follow the last cell
+    extra = pedl.Widget(w=20, h=20)
+    second.addWidget(extra)
+    assert second.cells[extra].row == 2
+
+
+def test_paginate_template_dir(tmpdir):
+    templates = os.path.join(os.path.dirname(pedl.__file__), 'templates')
+    d = pedl.Designer(template_dir=templates)
+    d.window.h = 100
+    v = pedl.VBoxLayout()
+    for i in range(4):
+        v.addLayout(device(i))
+
+    pages = d.paginate(v, 'devices')
+    assert len(pages) > 1
+    assert all(p.template_dir == templates for p in pages.values())
+
+
+def test_paginate(tmpdir):
+    d = pedl.Designer()
+    d.window.h = 300
+    v = pedl.VBoxLayout()
+    for i in range(30):
+        v.addLayout(device(i))
+
+    pages = d.paginate(v, 'devices')
+    assert list(pages) == ['devices_{}.edl'.format(i) for i in (1, 2, 3)]
+
+    for page in pages.values():
+        assert page.window.h <= 300
+        assert page.env is d.env
+
+    #Navigation between pages
+    middle  = pages['devices_2.edl']
+    buttons = middle.findChildren(_type=pedl.widgets.RelatedDisplay)
+    assert [b.displays[0].path for b in buttons] == ['devices_1.edl',
+                                                     'devices_3.edl']
+    assert [b.label for b in buttons] == ['< Previous', 'Next >']
+
+    paths = save_pages(pages, str(tmpdir))
+    assert all(os.path.exists(p) for p in paths)
+
+    with open(paths[1]) as f:
+        screen, objects = parse_edl(f.read())
+
+    displays = [o for o in objects if o.widgetClass == 'relatedDisplayClass']
+    assert displays[1].properties['displayFileName'] == ['devices_3.edl']
+    assert displays[1].properties['closeAction'] == ['1']
+
+
+def test_paginate_single():
+    d = pedl.Designer()
+    v = pedl.VBoxLayout()
+    v.addLayout(device(0))
+    pages = d.paginate(v, 'devices')
+    assert list(pages) == ['devices.edl']
+    assert not pages['devices.edl'].findChildren(
+                                        _type=pedl.widgets.RelatedDisplay)
@@ -0,0 +1,69 @@
+############
+# Standard #
+############
+import os.path
+
+###############
+# Third Party #
+###############
+
+##########
+# Module #
+##########
+import pedl
+from pedl.parser import parse_edl, parse_properties, walk
+from pedl.widgets import EmbeddedWindow
+
+def test_parse_properties():
+    props = parse_properties(['x 4', 'fill', 'value {', '  "LABEL"', '}',
+                              'menuLabel {', '  0 "one"', '  1 "two"', '}'])
+    assert props['x']         == '4'
+    assert props['fill']      == True
+    assert props['value']     == ['LABEL']
+    assert props['menuLabel'] == ['one', 'two']
+
+def test_parse_edl():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        'test.edl')
+    with open(path, 'r') as f:
+        screen, objects = parse_edl(f.read())
+
+    assert screen['w'] == '780'
+    assert screen['h'] == '1125'
+    assert len(objects) == 4
+    assert objects[0].name == 'Rectangle'
+    assert objects[3].widgetClass == 'activeCircleClass'
+    assert objects[3].properties['fillColor'] == 'index 90'
+
+def test_parse_rendered():
+    d = pedl.Designer()
+    d.addWidget(EmbeddedWindow(displays=['tests/test.edl'], autoscale=False))
+    screen, objects = parse_edl('\n\n'.join([d.render(d.window),
+                                             d.render(d.widgets[0])]))
+    assert screen['w'] == '750'
+    assert objects[0].properties['displayFileName'] == ['tests/test.edl']
+    assert objects[0].properties['filePv'] == 'LOC\\\\emb-window=i:0'
+
+
+def test_parse_group():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        'group.edl')
+    with open(path, 'r') as f:
+        screen, objects = parse_edl(f.read())
+
+    assert screen['w'] == '400'
+    assert [o.widgetClass for o in objects] == ['activeGroupClass',
+                                                'activeCircleClass']
+    group = objects[0]
+    assert group.properties['w'] == '200'
+    assert group.properties['visPv'] == 'VGC:01:VISIBLE'
+    assert 'object' not in group.properties
+    assert [o.name for o in group.children] == ['Label', 'Inner']
+
+    inner = group.children[1]
+    assert inner.properties['visPv'] == 'VGC:01:INNER'
+    assert inner.children[0].properties['w'] == '50'
+    assert inner.children[0].properties['alarmPv'] == 'VGC:01:STATE'
+
+    assert [o.name for o in walk(objects)] == ['Group', 'Label', 'Inner',
+                                               'Status', 'Circle']
@@ -0,0 +1,85 @@
+############
+# Standard #
+############
+import os
+
+###############
+# Third Party #
+###############
+import pytest
+
+##########
+# Module #
+##########
+import pedl
+from pedl.preview import PreviewSession
+
+
+
+def test_preview_reload(edm):
+    d = pedl.Designer()
+    d.window.name = 'First'
+    proc = d.exec_(wait=False)
+    path = d.session.path
+    assert proc.poll() is None
+    edm.requests(1)
+
+    #Second preview reuses the file and the process
+    d.window.name = 'Second'
+    assert d.exec_(wait=False) is proc
+    assert d.session.path == path
+    assert proc.poll() is None
+    assert edm.requests(2) == ['-x -eolc -oneInst First', '-x -eolc -oneInst Second']
+    assert os.listdir(os.path.dirname(path)) == ['preview.edl']
+
+    #Closing removes the process and file
+    d.closeAllWindows()
+    assert proc.poll() is not None
+    assert not os.path.exists(path)
+
+
+def test_preview_restart(edm):
+    d = pedl.Designer()
+    d.window.name = 'Screen'
+    s = PreviewSession(d, oneInst=False)
+    first = s.exec_()
+    edm.requests(1)
+    second = s.exec_()
+    assert first is not second
+    assert first.poll() is not None
+    assert second.poll() is None
+    edm.requests(2)
+
+    #Changing macros restarts the process
+    s.oneInst = True
+    third = s.exec_(P='TST')
+    assert third is not second
+    assert edm.requests(3)[-1] == '-x -eolc -oneInst P=TST Screen'
+    s.close()
+
+
+def test_preview_wd(edm, tmpdir):
+    d = pedl.Designer()
+    d.window.name = 'Screen'
+    first = d.exec_(wait=False)
+    edm.requests(1)
+    assert d.exec_(wait=False) is first
+
+    #Changing the working directory restarts the process
+    second = d.exec_(wd=str(tmpdir), wait=False)
+    assert second is not first
+    assert first.poll() is not None
+    assert d.session.cwd == str(tmpdir)
+    d.closeAllWindows()
+
+
+def test_processes(edm):
+    d = pedl.Designer()
+    with pytest.deprecated_call():
+        assert d.processes == []
+
+    proc = d.exec_(wait=False)
+    with pytest.deprecated_call():
+        assert d.processes == [(d.session.path, proc)]
+
+    d.closeAllWindows()
@@ -0,0 +1,100 @@
+############
+# Standard #
+############
+import os
+import shutil
+
+###############
+# Third Party #
+###############
+import pytest
+
+##########
+# Module #
+##########
+import pedl
+from pedl.errors  import DesignerError
+from pedl.resolve import PathResolver, DependencyGraph
+from pedl.widgets import EmbeddedWindow, RelatedDisplay
+
+test_edl = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        'test.edl')
+
+@pytest.fixture(scope='function')
+def search(tmpdir):
+    first, second = tmpdir.mkdir('first'), tmpdir.mkdir('second')
+    shutil.copy(test_edl, str(second.join('test.edl')))
+    shutil.copy(test_edl, str(second.join('other.edl')))
+    shutil.copy(test_edl, str(first.join('other.edl')))
+    return [str(first), str(second)]
+
+def test_resolver(search):
+    r = PathResolver(':'.join(search))
+    assert r.resolve('test.edl')  == os.path.join(search[1], 'test.edl')
+    assert r.resolve('test')      == os.path.join(search[1], 'test.edl')
+    assert r.resolve('other.edl') == os.path.join(search[0], 'other.edl')
+    assert r.resolve('missing.edl') is None
+    assert r.resolve(test_edl) == test_edl
+
+    #New files are found after a miss
+    shutil.copy(test_edl, os.path.join(search[0], 'missing.edl'))
+    assert r.resolve('missing.edl') == os.path.join(search[0], 'missing.edl')
+
+def test_embedded_search_path(search, monkeypatch):
+    monkeypatch.setenv('EDMDATAFILES', ':'.join(search))
+    emb = EmbeddedWindow(displays=['test.edl'])
+    assert (emb.w, emb.h) == (780, 1125)
+
+def test_search_path_first(search, tmpdir, monkeypatch):
+    #A relative path on the search path is preferred to the working directory
+    shutil.copy(test_edl, str(tmpdir.join('other.edl')))
+    monkeypatch.chdir(str(tmpdir))
+    r = PathResolver(search)
+    assert r.resolve('other.edl') == os.path.join(search[0], 'other.edl')
+    assert r.resolve('test.edl') == os.path.join(search[1], 'test.edl')
+
+    #Only tried as given once the search path is exhausted
+    assert PathResolver([search[0]]).resolve('../other.edl') == os.path.join(
+                                                search[0], '../other.edl')
+    assert PathResolver([]).resolve('other.edl') == 'other.edl'
+
+def test_from_edl_search_path(search, monkeypatch):
+    monkeypatch.setenv('EDMDATAFILES', ':'.join(search))
+    d = pedl.widgets.embedded.Display.from_edl('test')
+    assert d.name == 'test'
+    assert d.path == 'test'
+    assert d.locate() == os.path.join(search[1], 'test.edl')
+
+    with pytest.raises(ValueError):
+        pedl.widgets.embedded.Display.from_edl('missing')
+
+def designer(embed=(), related=()):
+    d = pedl.Designer()
+    if embed:
+        d.addWidget(EmbeddedWindow(displays=list(embed), autoscale=False))
+    if related:
+        d.addWidget(RelatedDisplay(displays=list(related)))
+    return d
+
+def test_graph(search, tmpdir):
+    g     = DependencyGraph(resolver=PathResolver(search))
+    out   = str(tmpdir.join('out'))
+    top   = g.addDesigner(os.path.join(out, 'top.edl'),
+                          designer(embed=['middle.edl', 'test.edl'],
+                                   related=['missing.edl']))
+    mid   = g.addDesigner(os.path.join(out, 'middle.edl'),
+                          designer(embed=['bottom.edl'],
+                                   related=['top.edl']))
+    bot   = g.addDesigner(os.path.join(out, 'bottom.edl'), designer())
+    other = g.addFile(os.path.join(search[1], 'other.edl'))
+
+    assert g.dependencies(top) == [mid, os.path.join(search[1], 'test.edl')]
+    assert g.dependencies(mid, kind=None) == [bot, top]
+    assert g.dangling() == {top : ['missing.edl']}
+    assert g.order() == [bot, other, mid, top]
+    assert g.order(changed=[mid]) == [mid, top]
+
+    #Cycles of embedded screens are reported
+    g.addDesigner(os.path.join(out, 'bottom.edl'), designer(embed=['top.edl']))
+    with pytest.raises(DesignerError):
+        g.order()
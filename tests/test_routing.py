@@ -0,0 +1,81 @@
+############
+# Standard #
+############
+import random
+
+###############
+# Third Party #
+###############
+import pytest
+
+##########
+# Module #
+##########
+import pedl
+from pedl.widgets import Rectangle
+from pedl.routing import Router, orthogonal
+
+
+def crosses(points, widget):
+    """
+    Whether any segment of a path passes through the inside of a widget
+    """
+    for (x0, y0), (x1, y1) in zip(points[:-1], points[1:]):
+        if (min(x0, x1) < widget.right and max(x0, x1) > widget.x
+            and min(y0, y1) < widget.bottom and max(y0, y1) > widget.y):
+            return True
+    return False
+
+
+def test_orthogonal():
+    points = orthogonal([(0, 0), (10, 0), (20, 0), (20, 10), (30, 20)])
+    assert points.tolist() == [[0, 0], [20, 0], [20, 10], [30, 10], [30, 20]]
+
+
+def test_route_around():
+    a    = Rectangle(x=20,  y=100, w=40, h=40)
+    b    = Rectangle(x=300, y=100, w=40, h=40)
+    wall = Rectangle(x=150, y=50,  w=40, h=150)
+    r    = Router(400, 300, [a, b, wall])
+
+    points = r.route(a, b)
+    assert points[0].tolist()  == [60, 120]
+    assert points[-1].tolist() == [300, 120]
+    assert not crosses(points.tolist(), wall)
+
+    #Every segment is horizontal or vertical
+    steps = points[1:] - points[:-1]
+    assert (steps == 0).any(axis=1).all()
+
+    #Routes are cached until an obstacle moves
+    assert r.route(a, b) is points
+    wall.y = 400
+    assert r.route(a, b).tolist() == [[60, 120], [300, 120]]
+
+
+def test_connect():
+    random.seed(0)
+    d = pedl.Designer()
+    d.window.w, d.window.h = 1000, 1000
+    widgets = [Rectangle(x=40 + 95*i, y=40 + 95*j, w=40, h=40)
+               for i in range(10) for j in range(10)]
+    for w in widgets:
+        d.addWidget(w)
+
+    for k in range(50):
+        a, b = random.sample(widgets, 2)
+        line = d.connect(a, b, lineColor=pedl.choices.ColorChoice.Blue)
+        assert not line.closed
+        assert not any(crosses(line.points.tolist(), w)
+                       for w in widgets if w not in (a, b))
+
+    #Connections are not obstacles
+    assert len(d.router.obstacles) == 100
+
+    line = d.connect(widgets[0], widgets[1], style='direct')
+    assert line.numPoints == 2
+
+    with pytest.raises(ValueError):
+        d.connect(widgets[0], widgets[1], style='curved')
+
+    assert 'closePolygon' not in d.render(line)
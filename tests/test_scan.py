@@ -0,0 +1,78 @@
+############
+# Standard #
+############
+import os
+import shutil
+
+###############
+# Third Party #
+###############
+import pytest
+
+##########
+# Module #
+##########
+import pedl
+from pedl.cli  import main
+from pedl.scan import ScreenDatabase, summarize
+from pedl.widgets import EmbeddedWindow
+
+@pytest.fixture(scope='function')
+def screens(tmpdir):
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        'test.edl')
+    shutil.copy(path, str(tmpdir.join('test.edl')))
+    #Create a screen embedding the first
+    d = pedl.Designer()
+    d.addWidget(EmbeddedWindow(displays=['test.edl'],
+                               autoscale=False))
+    tmpdir.mkdir('sub')
+    with open(str(tmpdir.join('sub', 'embed.edl')), 'w') as f:
+        d.dump(f)
+    return str(tmpdir)
+
+def test_summarize(screens):
+    summary = summarize(os.path.join(screens, 'test.edl'))
+    assert (summary['w'], summary['h']) == (780, 1125)
+    assert summary['objects'] == {'activeRectangleClass' : 2,
+                                  'activeCircleClass'    : 2}
+    assert ('fillColor', 92) in summary['colors']
+
+def test_summarize_group():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        'group.edl')
+    summary = summarize(path)
+    assert summary['objects'] == {'activeGroupClass'     : 2,
+                                  'activeXTextClass'     : 1,
+                                  'activeRectangleClass' : 1,
+                                  'activeCircleClass'    : 1}
+    assert ('visPv', 'VGC:01:VISIBLE') in summary['pvs']
+    assert ('alarmPv', 'VGC:01:STATE') in summary['pvs']
+
+def test_database(screens):
+    db = ScreenDatabase()
+    assert len(db.update(screens, workers=1)) == 2
+    embed = os.path.join(screens, 'sub', 'embed.edl')
+    test  = os.path.join(screens, 'test.edl')
+    assert db.screensWithDisplay('test.edl') == [embed]
+    assert db.screensWithPv('LOC\\\\emb-window=i:0') == [embed]
+    assert db.screensWithPv('LOC\\\\emb-window=i:0', property='visPv') == []
+    assert db.screensWithColor(pedl.choices.ColorChoice.CXI) == [test]
+    assert db.screensWithClass('activePipClass') == [embed]
+
+    #Nothing has changed
+    assert db.update(screens) == []
+
+    #Modified and removed files
+    os.utime(test, ns=(0, 0))
+    os.remove(embed)
+    assert db.update(screens) == [test]
+    assert db.screens == [test]
+
+def test_cli(screens, capsys):
+    db = os.path.join(screens, 'screens.db')
+    assert main(['scan', screens, '--db', db, '-j', '2']) == 0
+    assert main(['query', '--db', db, '--display', 'test.edl']) == 0
+    out = capsys.readouterr().out
+    assert out.endswith(os.path.join(screens, 'sub', 'embed.edl') + '\n')
+    assert main(['query', '--db', db, '--pv', 'NOT:A:PV']) == 1
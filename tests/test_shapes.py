@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 import pedl
 
 def test_fill():
@@ -45,3 +46,56 @@ def test_lines_widget():
     assert v.w == 10
     assert v.h == 25
 
+
+def test_lines_array():
+    v = pedl.widgets.shape.Lines.from_array(np.array([[10, 20], [30, 60]]))
+    assert v.numPoints == 2
+    assert (v.x, v.y, v.w, v.h) == (10, 20, 20, 40)
+    with pytest.raises(ValueError):
+        v.points[0, 0] = 4
+
+    v.scale(2, 0.5)
+    assert v.points.tolist() == [[10, 20], [50, 40]]
+    v.translate(-10, -20)
+    assert v.points.tolist() == [[0, 0], [40, 20]]
+    assert v.xPoints == '    0 0\n    1 40'
+    assert v.yPoints == '    0 0\n    1 20'
+
+def test_lines_closed():
+    d = pedl.Designer()
+    lines = [pedl.widgets.shape.Lines(points=[(0, 0), (5, 5)], closed=c)
+             for c in (0, False)]
+    assert all(l.closed is False for l in lines)
+    assert d.render(lines[0]) == d.render(lines[1])
+    assert 'closePolygon' not in d.render(lines[0])
+    assert pedl.widgets.shape.Lines().closed is True
+
+def test_add_polylines():
+    d = pedl.Designer()
+    lines = d.addPolylines([np.zeros((3, 2)), [(0, 0), (5, 5)]],
+                           lineWidth=2)
+    assert d.widgets == lines
+    assert [l.numPoints for l in lines] == [3, 2]
+    assert lines[1].lineWidth == 2
+    assert 'yPoints {\n    0 0\n    1 5\n}' in d.render(lines[1])
+
+def test_simplify():
+    x = np.arange(1000)
+    v = pedl.widgets.shape.Lines.from_array(np.column_stack([x, x % 2]))
+    assert v.simplified is v.points
+    assert v.reduction == 0.
+
+    v.tolerance = 1.5
+    assert v.simplified.tolist() == [[0, 0], [999, 1]]
+    assert v.reduction == 0.998
+    assert v.points.shape == (1000, 2)
+    assert 'numPoints 2\n' in pedl.Designer().render(v)
+
+    #Detail beyond the tolerance is kept
+    v.tolerance = 0.5
+    assert len(v.simplified) == 1000
+
+def test_simplify_duplicates():
+    v = pedl.widgets.shape.Lines(points=[(0,0), (0,0), (5,0), (5,0), (5,5),
+                                         (0,5), (0,0)], tolerance=0)
+    assert v.simplified.tolist() == [[0,0], [5,0], [5,5], [0,5], [0,0]]
@@ -0,0 +1,61 @@
+import pedl
+from pedl.spatial import SpatialIndex
+from pedl.widgets import Rectangle, StaticText
+
+def test_index_queries():
+    a = Rectangle(x=0,   y=0,  w=100, h=100)
+    b = Rectangle(x=50,  y=50, w=100, h=100)
+    c = Rectangle(x=150, y=0,  w=50,  h=50)
+    index = SpatialIndex([a, b, c], cell=32)
+    assert len(index) == 3
+    assert index.at(75, 75)  == [a, b]
+    assert index.at(175, 25) == [c]
+    assert index.at(500, 500) == []
+    assert index.within((140, 40, 20, 20)) == [b, c]
+    assert index.within((0, 0, 160, 160), contained=True) == [a, b]
+    #Shared edges are not overlaps
+    assert index.overlaps() == [(a, b)]
+
+def test_index_update():
+    a = Rectangle(x=0,   y=0, w=100, h=100)
+    b = Rectangle(x=200, y=0, w=100, h=100)
+    index = SpatialIndex([a, b], cell=32)
+    assert index.overlaps() == []
+    b.x = 50
+    assert index.overlaps() == [(a, b)]
+    assert index.at(250, 50) == []
+    index.remove(b)
+    assert index.at(75, 50) == [a]
+    assert b.listeners == []
+
+def test_duplicates():
+    a = Rectangle(x=10, y=10, w=10, h=10)
+    b = Rectangle(x=10, y=10, w=10, h=10)
+    c = StaticText(x=10, y=10, w=10, h=10)
+    index = SpatialIndex([a, b, c])
+    assert index.duplicates() == [[a, b]]
+
+def test_designer_queries():
+    d = pedl.Designer()
+    h = pedl.HBoxLayout()
+    s = pedl.StackedLayout()
+    back, front = Rectangle(w=50, h=50), StaticText(w=50, h=20)
+    s.addWidget(back)
+    s.addWidget(front)
+    h.addLayout(s)
+    h.addWidget(Rectangle(w=50, h=50))
+    d.window.setLayout(h, resize=True)
+    assert d.findOverlaps() == []
+    assert d.findOverlaps(exclude=None) == [(back, front)]
+    assert d.widgetsAt(*back.center) == [back, front]
+
+    #Newly added widgets are indexed
+    extra = Rectangle(x=front.x, y=front.y, w=5, h=5)
+    d.addWidget(extra)
+    assert d.findOverlaps() == [(back, extra), (front, extra)]
+    assert d.widgetsIn((extra.x, extra.y, 1, 1)) == [back, front, extra]
+
+    #Replacing the contents rebuilds the index
+    d.window.setLayout(s)
+    assert d.findOverlaps() == []
+    assert extra.listeners == []
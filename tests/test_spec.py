@@ -0,0 +1,118 @@
+############
+# Standard #
+############
+import os
+import json
+import time
+
+###############
+# Third Party #
+###############
+import pytest
+
+##########
+# Module #
+##########
+import pedl
+from pedl import spec
+from pedl.choices import ColorChoice, AlignmentChoice
+from pedl.widgets import StaticText, Rectangle, RelatedDisplay, Display
+
+panel = {'window'  : {'name': 'Valve', 'background': 'Blue'},
+         'layout'  : {'type': 'VBoxLayout', 'spacing': 4,
+                      'children': [
+                         {'type': 'StaticText', 'text': 'VGC:01', 'w': 100,
+                          'h': 20, 'fontColor': 'White',
+                          'font': {'size': 14, 'bold': True}},
+                         {'type': 'HBoxLayout', 'children': [
+                            {'type': 'Rectangle', 'w': 40, 'h': 40,
+                             'fill': 'Green', 'lineWidth': 2},
+                            {'type': 'RelatedDisplay', 'w': 60, 'h': 40,
+                             'label': 'More', 'fill': 21,
+                             'displays': [{'name': 'more',
+                                           'path': 'more.edl',
+                                           'macros': 'P=VGC:01'}]}]}]},
+         'widgets' : [{'type': 'Circle', 'x': 5, 'y': 200, 'w': 10, 'h': 10,
+                       'visibility': {'pv': 'VGC:01:OK'}}]}
+
+
+def by_hand():
+    d = pedl.Designer()
+    d.window.name = 'Valve'
+    d.window.background = ColorChoice.Blue
+    v = pedl.VBoxLayout(spacing=4)
+    v.addWidget(StaticText(text='VGC:01', w=100, h=20,
+                           fontColor=ColorChoice.White,
+                           font={'size': 14, 'bold': True}))
+    h = pedl.HBoxLayout()
+    h.addWidget(Rectangle(w=40, h=40, fill=ColorChoice.Green, lineWidth=2))
+    h.addWidget(RelatedDisplay(w=60, h=40, label='More', fill=21,
+                               displays=[Display('more', 'more.edl',
+                                                 'P=VGC:01')]))
+    v.addLayout(h)
+    d.window.setLayout(v, resize=True)
+    d.addWidget(pedl.widgets.Circle(x=5, y=200, w=10, h=10,
+                                    visibility={'pv': 'VGC:01:OK'}))
+    return d
+
+
+def test_build():
+    d = spec.loads(json.dumps(panel))
+    assert d.dumps() == by_hand().dumps()
+
+    #Each combination of type and properties is compiled once
+    count = len(spec.plans)
+    spec.build(panel)
+    assert len(spec.plans) == count
+
+
+def test_grid():
+    d = spec.build({'layout': {'type': 'GridLayout', 'cols': 2,
+                               'children': [
+                                   {'type': 'Rectangle', 'w': 10, 'h': 10},
+                                   {'type': 'Rectangle', 'w': 30, 'h': 10,
+                                    'row': 1, 'col': 0, 'colSpan': 2}]}})
+    grid = d.widgets[0]
+    assert (grid.rowCount, grid.columnCount) == (2, 2)
+    assert grid.widgets[1].y == grid.widgets[0].bottom + grid.spacing
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        spec.create({'type': 'Slider'})
+
+    with pytest.raises(ValueError):
+        spec.create({'type': 'Rectangle', 'colour': 'Red'})
+
+    with pytest.raises(ValueError):
+        spec.build({'window': {'colour': 'Red'}})
+
+    with pytest.raises(ValueError):
+        spec.loads('', format='xml')
+
+
+def test_load(tmpdir):
+    path = os.path.join(str(tmpdir), 'panel.json')
+    with open(path, 'w') as f:
+        json.dump(panel, f)
+    assert spec.load(path).dumps() == by_hand().dumps()
+
+    yaml = pytest.importorskip('yaml')
+    path = os.path.join(str(tmpdir), 'panel.yml')
+    with open(path, 'w') as f:
+        yaml.safe_dump(panel, f)
+    assert spec.load(path).dumps() == by_hand().dumps()
+
+
+def test_defaults():
+    a, b = [spec.create({'type': 'StaticText', 'name': 'label', 'w': 10})
+            for i in range(2)]
+    assert spec.plans[('StaticText', ('name', 'w'))].direct
+    assert a.name == 'label' and (a.x, a.w) == (0, 10)
+    assert sorted(a.attributes) == sorted(StaticText().attributes)
+
+    #Mutable defaults are not shared
+    a.font.size = 24
+    a.visibility.pv = 'TST:PV'
+    assert b.font.size == 12
+    assert b.visibility.pv is None
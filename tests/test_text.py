@@ -42,3 +42,9 @@ value {
 border
 lineWidth 3
 endObjectProperties"""
+
+def test_fit():
+    w = pedl.widgets.StaticText(text='LABEL')
+    assert w.fit(padding=0) == pedl.metrics.measure('LABEL', w.font)
+    assert w.fit() == (w.w, w.h)
+    assert w.w == pedl.metrics.measure('LABEL', w.font)[0] + 4
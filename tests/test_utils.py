@@ -12,7 +12,8 @@ from six import StringIO
 ##########
 # Module #
 ##########
-from pedl.utils import LocalPv, LocalEnumPv, find_screen_size
+from pedl.utils import (LocalPv, LocalEnumPv, find_screen_size,
+                        write_if_changed)
 
 
 def test_find_screen_size():
@@ -39,3 +40,41 @@ def test_local_pv():
 def test_local_enum():
     pv = LocalEnumPv('enumPv', ['zero','one','two'], value='two')
     assert str(pv) == 'LOC\\\\enumPv=e:2,zero,one,two'
+
+
+def test_write_if_changed(tmpdir):
+    path = os.path.join(str(tmpdir), 'screen.edl')
+    assert write_if_changed(path, 'first')
+    assert not write_if_changed(path, 'first')
+    assert write_if_changed(path, 'second')
+    assert open(path).read() == 'second'
+    assert os.listdir(str(tmpdir)) == ['screen.edl']
+
+
+def test_write_if_changed_mode(tmpdir):
+    path  = os.path.join(str(tmpdir), 'screen.edl')
+    umask = os.umask(0o022)
+
+    try:
+        #New files follow the umask
+        assert write_if_changed(path, 'first')
+        assert os.stat(path).st_mode & 0o777 == 0o644
+
+        #Existing files keep their permissions
+        os.chmod(path, 0o664)
+        assert write_if_changed(path, 'second')
+        assert os.stat(path).st_mode & 0o777 == 0o664
+
+    finally:
+        os.umask(umask)
+
+
+def test_atomic_leaves_umask(tmpdir, monkeypatch):
+    #Changing the umask would affect files created by other threads
+    def umask(mask):
+        raise AssertionError('umask changed')
+
+    monkeypatch.setattr(os, 'umask', umask)
+    path = os.path.join(str(tmpdir), 'screen.edl')
+    assert write_if_changed(path, 'first')
+    assert open(path).read() == 'first'
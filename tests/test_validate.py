@@ -0,0 +1,47 @@
+import pytest
+import pedl
+from pedl.errors  import DesignerError
+from pedl.widgets import Rectangle, RelatedDisplay, ShellCommand
+from pedl.widgets.shape import Lines
+
+def test_valid_screen():
+    d = pedl.Designer()
+    l = pedl.VBoxLayout()
+    l.addWidget(Rectangle(name='First',  w=100, h=100))
+    l.addWidget(Rectangle(name='Second', w=100, h=100))
+    d.window.setLayout(l, resize=True)
+    report = d.validate(raises=True)
+    assert report.valid
+    assert len(report) == 0
+
+def test_invalid_screen():
+    d = pedl.Designer()
+    bad_template = Rectangle(name='Template', w=10, h=10)
+    bad_template.template = 'not_a_template.edl'
+    bad_color    = Rectangle(name='Color', w=10, h=10)
+    bad_color.attributes['fill'] = 93
+    hidden       = Rectangle(name='Hidden', w=10, h=10,
+                             visibility={'min' : 4})
+    outside      = Rectangle(name='Outside', x=-10, w=10, h=10)
+    empty        = Rectangle(name='Empty')
+    related      = RelatedDisplay(w=10, h=10)
+    shell        = ShellCommand(w=10, h=10)
+    line         = Lines(points=[(0,0), (10,0)])
+    dupes        = [Rectangle(name='Dupe', w=10, h=10) for i in range(2)]
+
+    for w in [bad_template, bad_color, hidden, outside, empty,
+              related, shell, line] + dupes:
+        d.addWidget(w)
+
+    report = d.validate()
+    assert not report.valid
+    assert [p.widget for p in report.filter('template')] == [bad_template]
+    assert [p.widget for p in report.filter('enum')] == [bad_color]
+    assert [p.widget for p in report.filter('visibility')] == [hidden]
+    assert [p.widget for p in report.filter('geometry')] == [outside]
+    assert [p.widget for p in report.filter('size')] == [empty]
+    assert [p.widget for p in report.filter('empty')] == [related, shell]
+    assert [p.widget for p in report.filter('name')] == dupes
+
+    with pytest.raises(DesignerError):
+        d.validate(raises=True)
@@ -0,0 +1,134 @@
+############
+# Standard #
+############
+import os
+import sys
+import time
+import shutil
+
+###############
+# Third Party #
+###############
+import pytest
+
+##########
+# Module #
+##########
+import pedl
+from pedl.factory import registry
+from pedl.watch import (Regenerator, PollingWatcher, InotifyWatcher,
+                        debounce)
+
+generator = """\
+import watched_first, watched_second
+"""
+
+first = """\
+import pedl
+from watched_helpers import size
+
+@pedl.factory('panels/first.edl')
+def first():
+    d = pedl.Designer(template_dir={templates!r})
+    d.window.name = {name!r}
+    d.addWidget(pedl.widgets.Rectangle(w=size, h=size))
+    return d
+"""
+
+second = """\
+import pedl
+
+@pedl.factory()
+def second():
+    d = pedl.Designer(template_dir={templates!r})
+    d.addWidget(pedl.widgets.StaticText(text='Label', w=50, h=20))
+    return d
+"""
+
+helpers = """\
+size = {size}
+"""
+
+
+def write(path, text):
+    with open(path, 'w') as f:
+        f.write(text)
+    #Distinguish modification times on coarse filesystems
+    os.utime(path, ns=(time.time_ns(), time.time_ns() + 10**9))
+
+
+def edit(path, old, new):
+    with open(path) as f:
+        text = f.read()
+    write(path, text.replace(old, new))
+
+
+@pytest.fixture(scope='function')
+def package(tmpdir):
+    src       = os.path.join(str(tmpdir), 'src')
+    templates = os.path.join(str(tmpdir), 'templates')
+    out       = os.path.join(str(tmpdir), 'out')
+    os.makedirs(src)
+    shutil.copytree(os.path.join(os.path.dirname(pedl.__file__),
+                                 'templates'), templates)
+
+    write(os.path.join(src, 'watched_gen.py'), generator)
+    write(os.path.join(src, 'watched_first.py'),
+          first.format(templates=templates, name='First'))
+    write(os.path.join(src, 'watched_second.py'),
+          second.format(templates=templates))
+    write(os.path.join(src, 'watched_helpers.py'), helpers.format(size=10))
+    yield src, templates, out
+
+    #Forget the generated modules
+    for name in [m for m in sys.modules if m.startswith('watched_')]:
+        del sys.modules[name]
+    for path in [p for (p, f) in registry.items()
+                 if f.module.startswith('watched_')]:
+        del registry[path]
+    sys.path.remove(src)
+
+
+@pytest.mark.parametrize('poll', [False, True])
+def test_regenerate(package, poll):
+    src, templates, out = package
+    r = Regenerator(os.path.join(src, 'watched_gen.py'), directory=out,
+                    poll=poll, interval=0.05, delay=0.1)
+    assert r.paths == [src, templates]
+    assert sorted(os.listdir(out)) == ['panels', 'second.edl']
+    assert r.step(timeout=0.2) == []
+
+    #Only the changed factory is run
+    write(os.path.join(src, 'watched_first.py'),
+          first.format(templates=templates, name='Changed'))
+    assert r.step(timeout=5) == ['panels/first.edl']
+    with open(os.path.join(out, 'panels', 'first.edl')) as f:
+        assert 'title "Changed"' in f.read()
+
+    #Shared code runs every factory, though only changed screens are written
+    write(os.path.join(src, 'watched_helpers.py'), helpers.format(size=20))
+    assert r.step(timeout=5) == ['panels/first.edl']
+
+    #Templates run the factories using them, including through extends
+    edit(os.path.join(templates, 'text.edl'), 'value {', 'value {\n')
+    assert r.step(timeout=5) == ['second.edl']
+
+    edit(os.path.join(templates, 'widget.edl'), 'beginObjectProperties',
+         'beginObjectProperties\n')
+    assert sorted(r.step(timeout=5)) == ['panels/first.edl', 'second.edl']
+    r.watcher.close()
+
+
+@pytest.mark.parametrize('cls', [InotifyWatcher, PollingWatcher])
+def test_debounce(tmpdir, cls):
+    kwargs = {'interval': 0.02} if cls is PollingWatcher else {}
+    w = cls([str(tmpdir)], **kwargs)
+    assert debounce(w, timeout=0.1) == set()
+
+    paths = [os.path.join(str(tmpdir), name) for name in ('a.py', 'b.py')]
+    for path in paths:
+        write(path, 'x = 1')
+        time.sleep(0.05)
+
+    assert debounce(w, delay=0.3, timeout=1) == set(paths)
+    w.close()